@@ -74,7 +74,11 @@ class ConfigHandler:
                 'setup': files("libs") / "resources" / "save_files" / "1.0.0" / "standard.ini",
                 'measurement_path': ConfigHandler.get_save_files_path(),
                 'auto_save': 1,
-                'max_process_memory': 2048.0
+                'max_process_memory': 2048.0,
+                'estimate_cost': 0,
+                'check_tooth_culling': 0,
+                'result_cache_size': 0.0,
+                'store_snapshots': 0
             },
             'GUI': {
                 'theme': 'awdark',
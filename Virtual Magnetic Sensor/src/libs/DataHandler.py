@@ -26,6 +26,8 @@ from libs.elements.sensors.GMRSensor import GMRSensor
 from libs.elements.sensors.FieldRecorder import FieldRecorder
 from libs.elements.sensors.HallSensor import HallSensor
 
+from libs.simulation.Telemetry import Telemetry
+
 
 class DataHandler:
     """Objects of this class hold both the simulation parameters and the measurement 
@@ -34,10 +36,13 @@ class DataHandler:
 
     :param objects: List containing all instances of classes in the simulation with parameters.
     :type objects: List[any]
+    :param telemetry: Timings and solver statistics of the last simulation run.
+    :type telemetry: Telemetry
     """
 
     objects: List[any]
     filepath: Path
+    telemetry: Telemetry
 
     def __init__(self,
                  objects: List[any] = list(),
@@ -46,6 +51,7 @@ class DataHandler:
 
         self.objects = objects
         self.filepath = filepath
+        self.telemetry = Telemetry()
 
     @classmethod
     def template(cls):
@@ -108,6 +114,7 @@ class DataHandler:
         except FileNotFoundError:
             data_dict = dict()
 
+        self.telemetry = Telemetry.from_dict(data_dict.pop('telemetry', dict()))
         self.deploy_dict(data_dict)
 
         if self.sim_params() is None:
@@ -215,6 +222,9 @@ class DataHandler:
             if hasattr(obj, "to_dict"):
                 dictionary[key + str(num)] = obj.to_dict()
 
+        if self.telemetry.events:
+            dictionary['telemetry'] = self.telemetry.to_dict()
+
         return dictionary
 
     def gui_dict(self) -> Dict[str, any]:
@@ -334,6 +344,15 @@ class DataHandler:
         except IOError:
             return False
 
+    def save_trace(self) -> bool:
+        """Outputs the telemetry of the last simulation run as Chrome trace JSON file.
+
+        :return: True when the process is successful, false otherwise.
+        :rtype: bool
+        """
+
+        return self.telemetry.save_trace(self.filepath.with_suffix(".json"))
+
     def save_h5(self, measurement_path: Path) -> bool:
         """Outputs the parameters and measurement data held by the object to a specified file.
 
@@ -0,0 +1,104 @@
+import numpy as np
+from itertools import product
+from typing import List
+
+
+class BoundingBox:
+    """Axis-aligned bounding boxes of the bodies in the scenery. A box is given by its lower and upper corner as array
+        of shape (2, 3), like the boundaries of the simulation.
+    """
+
+    @staticmethod
+    def points(points: np.ndarray) -> np.ndarray:
+        """Returns the bounding box of a set of points.
+
+        :param points: Array of shape (n, 3) with the points.
+        :type points: numpy.ndarray
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+
+        return np.array([points.min(axis=0), points.max(axis=0)])
+
+    @staticmethod
+    def cuboid(center: np.ndarray, matrix: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Returns the bounding box of a rotated cuboid.
+
+        :param center: Origin of the body-fixed coordinate system.
+        :type center: numpy.ndarray
+        :param matrix: Matrix transforming body-fixed into global directions.
+        :type matrix: numpy.ndarray
+        :param lower: Lower corner of the cuboid in body-fixed coordinates.
+        :type lower: numpy.ndarray
+        :param upper: Upper corner of the cuboid in body-fixed coordinates.
+        :type upper: numpy.ndarray
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        corners = np.array(list(product(*zip(lower, upper))), dtype=float)
+
+        return BoundingBox.points(np.asarray(center, dtype=float) + corners.dot(np.asarray(matrix, dtype=float).T))
+
+    @staticmethod
+    def cylinder(center: np.ndarray, axis: np.ndarray, radius: float, length: float) -> np.ndarray:
+        """Returns the bounding box of a cylinder.
+
+        :param center: Center of the cylinder.
+        :type center: numpy.ndarray
+        :param axis: Direction of the cylinder axis.
+        :type axis: numpy.ndarray
+        :param radius: Radius of the cylinder.
+        :type radius: float
+        :param length: Length of the cylinder along the axis.
+        :type length: float
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        axis = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+        half = length / 2 * np.abs(axis) + radius * np.sqrt(np.clip(1 - axis ** 2, 0.0, 1.0))
+
+        return np.array([center - half, center + half], dtype=float)
+
+    @staticmethod
+    def union(boxes: List[np.ndarray]) -> np.ndarray:
+        """Returns the bounding box of a list of boxes.
+
+        :param boxes: Boxes to enclose.
+        :type boxes: List[numpy.ndarray]
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.points(np.vstack(boxes))
+
+    @staticmethod
+    def volume(box: np.ndarray) -> float:
+        """Returns the volume of a box.
+
+        :param box: Lower and upper corner of the box.
+        :type box: numpy.ndarray
+        :return: Volume of the box, 0 if it is empty.
+        :rtype: float
+        """
+
+        return float(np.prod(np.clip(box[1] - box[0], 0.0, None)))
+
+    @staticmethod
+    def distance(box: np.ndarray, other: np.ndarray) -> float:
+        """Returns the distance between two boxes.
+
+        :param box: Lower and upper corner of the first box.
+        :type box: numpy.ndarray
+        :param other: Lower and upper corner of the second box.
+        :type other: numpy.ndarray
+        :return: Euclidean distance of the closest points, 0 if the boxes overlap.
+        :rtype: float
+        """
+
+        gap = np.clip(np.maximum(box[0] - other[1], other[0] - box[1]), 0.0, None)
+
+        return float(np.linalg.norm(gap))
@@ -3,6 +3,8 @@ import numpy as np
 import abc
 from typing import Dict
 
+from libs.elements.BoundingBox import BoundingBox
+
 
 class Component:
     """Parent class contains the parameters to describe the position and magnetic properties of a component in the
@@ -89,3 +91,11 @@ class Component:
         :type t: float
         """
 
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the component at the current time stamp.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.points(self.pos)
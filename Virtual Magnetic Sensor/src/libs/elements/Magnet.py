@@ -3,6 +3,8 @@ import numpy as np
 from typing import Dict
 import abc
 
+from libs.elements.BoundingBox import BoundingBox
+
 
 class Magnet:
     """Parent class contains the parameters to describe the position and magnetic properties of a magnet in the
@@ -95,3 +97,12 @@ class Magnet:
     @abc.abstractmethod
     def gui(self) -> Magnet:
         """Returns a copy of the class with attributes converted to units used in the gui."""
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the magnet.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.points(self.pos)
@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict, List
 import abc
 
+from libs.elements.BoundingBox import BoundingBox
 from libs.simulation.MagneticField import MagneticField
 
 
@@ -92,3 +93,32 @@ class Sensor:
         :param field: Instance of the MagneticField class.
         :type field: MagneticField
         """
+
+    @abc.abstractmethod
+    def sampling_points(self) -> np.ndarray:
+        """Method returns the points in the 3D space at which the sensor samples the magnetic field.
+
+        :return: Array of shape (n, 3) with the sampling points.
+        :rtype: numpy.ndarray
+        """
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the sensor.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.points(self.pos)
+
+    @abc.abstractmethod
+    def quantities(self, field: MagneticField) -> np.ndarray:
+        """Method returns the quantities of interest the sensor output is based on, e.g. to check the convergence of
+            the magnetic field with respect to the sensor.
+
+        :param field: Instance of the MagneticField class.
+        :type field: MagneticField
+
+        :return: Flat array of the quantities of interest.
+        :rtype: numpy.ndarray
+        """
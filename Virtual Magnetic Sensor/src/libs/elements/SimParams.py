@@ -20,6 +20,63 @@ class SimParams:
     :type tol: float
     :param maxit: The maximum number of allowed iterations to calculate the magnetic field.
     :type maxit: int
+    :param solver: Linear solver used for the finite element system. 0: Iterative (CG with BDDC preconditioner),
+        1: Direct (sparse Cholesky factorization, reused as long as mesh and materials do not change).
+    :type solver: int
+    :param recycle: Number of previous solutions recycled as deflation space of the iterative solver. 0 disables
+        recycling and solves each time step with plain CG.
+    :type recycle: int
+    :param adaptive_tol: Relative change of the sensor quantities of interest below which the adaptive mesh refinement
+        stops. 0 disables the adaptive refinement.
+    :type adaptive_tol: float
+    :param adaptive_maxit: Maximum number of adaptive refinements of each newly built mesh.
+    :type adaptive_maxit: int
+    :param submodel_margin: Margin in mm around the sampling points of each sensor defining the box of a fine local
+        submodel. The coarse global solution without the sensor refinements provides the boundary values of the box.
+        0 disables the submodeling and solves the full scene on the fine mesh.
+    :type submodel_margin: float
+    :param formulation: Formulation of the magnetostatic problem. 0: Automatic, i.e. axisymmetric if possible and
+        vector potential otherwise, 1: Vector potential (HCurl), 2: Total scalar potential (H1), valid since the
+        scenery is free of currents, 3: Planar vector potential on the 2D cross-section of sceneries extruded along the
+        z-axis (see NGPlanarField.validity), 4: Axisymmetric scalar potential on the meridian half plane of coaxial rod
+        magnets and shafts (see NGAxisymmetricField.validity).
+    :type formulation: int
+    :param symmetry: Reduce the 3D simulation to the half or quarter of the box at the center planes the scenery is
+        mirror symmetric to (see SymmetryPlane.from_scene).
+    :type symmetry: bool
+    :param shell_thickness: Thickness in mm of the open boundary shell meshed around the simulation boundaries.
+        Within the shell, the coordinates are stretched so that the field decays as in a much larger box, which allows
+        boundaries close to the components (see CoordinateStretching). 0 closes the box at the boundaries.
+    :type shell_thickness: float
+    :param shell_stretch: Ratio of the thickness the shell represents to its meshed thickness.
+    :type shell_stretch: float
+    :param tooth_culling: Radius in mm around the magnets, sensors and field recorders within which the teeth of gears
+        and gear racks are built. Teeth farther away are left out of the geometry (see ToothCulling). 0 builds all
+        teeth.
+    :type tooth_culling: float
+    :param geometry_backend: Geometry kernel the 3D mesh is generated from. 0: CSG (netgen.csg), 1: OpenCascade
+        (netgen.occ, see OCCGeometry) with the cross-sections of the components extruded as flat faces.
+    :type geometry_backend: int
+    :param mesh_pipeline: Number of upcoming time steps whose meshes are generated ahead in separate processes while
+        the current step is solved, if they can not be moved from the current mesh (see MeshPipeline). The number of
+        meshes generated at once is further bounded by the memory limit of the process. 0 generates the meshes when
+        needed.
+    :type mesh_pipeline: int
+    :param fourier_harmonics: Number of harmonics of the tooth frequency the sensor signals of steadily rotating gears
+        are reconstructed from. The field is solved at the angles of one revolution the harmonics require and the
+        signals at the time stamps are evaluated from a truncated Fourier series fitted to them (see
+        FourierReconstruction). 0 solves each time stamp.
+    :type fourier_harmonics: int
+    :param fourier_tol: Error of the Fourier reconstruction at held-out verification angles relative to the amplitude
+        of the signals above which the number of harmonics is increased.
+    :type fourier_tol: float
+    :param sampling_tol: Change of the sensor signals between successive solved time stamps relative to their
+        amplitude above which the time stamp between them is solved as well (see AdaptiveSampler). The signals at the
+        time stamps not solved are interpolated. 0 solves each time stamp.
+    :type sampling_tol: float
+    :param sampling_stride: Number of time stamps between the solved time stamps of the coarse grid the adaptive
+        sampling starts from.
+    :type sampling_stride: int
     :param t: Array containing the time stamps of the simulation.
     :type t: np.ndarray
     """
@@ -31,6 +88,22 @@ class SimParams:
     maxh_global: float
     tol: float
     maxit: int
+    solver: int
+    recycle: int
+    adaptive_tol: float
+    adaptive_maxit: int
+    submodel_margin: float
+    formulation: int
+    symmetry: bool
+    shell_thickness: float
+    shell_stretch: float
+    tooth_culling: float
+    geometry_backend: int
+    mesh_pipeline: int
+    fourier_harmonics: int
+    fourier_tol: float
+    sampling_tol: float
+    sampling_stride: int
     t: np.ndarray
 
     def __init__(self,
@@ -41,6 +114,22 @@ class SimParams:
                  maxh_global: float,
                  tol: float,
                  maxit: int,
+                 solver: int = 0,
+                 recycle: int = 0,
+                 adaptive_tol: float = 0.0,
+                 adaptive_maxit: int = 5,
+                 submodel_margin: float = 0.0,
+                 formulation: int = 0,
+                 symmetry: bool = False,
+                 shell_thickness: float = 0.0,
+                 shell_stretch: float = 10.0,
+                 tooth_culling: float = 0.0,
+                 geometry_backend: int = 0,
+                 mesh_pipeline: int = 0,
+                 fourier_harmonics: int = 0,
+                 fourier_tol: float = 1e-3,
+                 sampling_tol: float = 0.0,
+                 sampling_stride: int = 8,
                  **kwargs) -> None:
         """Constructor method."""
 
@@ -51,6 +140,22 @@ class SimParams:
         self.maxh_global = maxh_global
         self.tol = tol
         self.maxit = maxit
+        self.solver = solver
+        self.recycle = recycle
+        self.adaptive_tol = adaptive_tol
+        self.adaptive_maxit = adaptive_maxit
+        self.submodel_margin = submodel_margin
+        self.formulation = formulation
+        self.symmetry = symmetry
+        self.shell_thickness = shell_thickness
+        self.shell_stretch = shell_stretch
+        self.tooth_culling = tooth_culling
+        self.geometry_backend = geometry_backend
+        self.mesh_pipeline = mesh_pipeline
+        self.fourier_harmonics = fourier_harmonics
+        self.fourier_tol = fourier_tol
+        self.sampling_tol = sampling_tol
+        self.sampling_stride = sampling_stride
 
         self.t = np.linspace(self.t0, self.t1, samples)
         if samples > 1:
@@ -67,7 +172,23 @@ class SimParams:
                    samples=11,
                    maxh_global=5.0,
                    tol=1e-6,
-                   maxit=100)
+                   maxit=100,
+                   solver=0,
+                   recycle=0,
+                   adaptive_tol=0.0,
+                   adaptive_maxit=5,
+                   submodel_margin=0.0,
+                   formulation=0,
+                   symmetry=False,
+                   shell_thickness=0.0,
+                   shell_stretch=10.0,
+                   tooth_culling=0.0,
+                   geometry_backend=0,
+                   mesh_pipeline=0,
+                   fourier_harmonics=0,
+                   fourier_tol=1e-3,
+                   sampling_tol=0.0,
+                   sampling_stride=8)
 
     @classmethod
     def from_dict(cls, dictionary: Dict[any]) -> SimParams:
@@ -118,4 +239,9 @@ class SimParams:
     def reset(self) -> None:
         """Calls the init method with the actual class attributes."""
 
-        self.__init__(self.boundaries, self.t0, self.t1, self.samples, self.maxh_global, self.tol, self.maxit)
+        self.__init__(self.boundaries, self.t0, self.t1, self.samples, self.maxh_global, self.tol, self.maxit,
+                      self.solver, self.recycle, self.adaptive_tol, self.adaptive_maxit,
+                      self.submodel_margin, self.formulation, self.symmetry, self.shell_thickness,
+                      self.shell_stretch, self.tooth_culling, self.geometry_backend,
+                      self.mesh_pipeline, self.fourier_harmonics, self.fourier_tol, self.sampling_tol,
+                      self.sampling_stride)
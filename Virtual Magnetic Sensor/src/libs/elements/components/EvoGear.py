@@ -4,6 +4,7 @@ from math import sin, cos, tan, radians, degrees
 from typing import Dict
 
 from libs.elements.Component import Component
+from libs.elements.BoundingBox import BoundingBox
 
 
 class EvoGear(Component):
@@ -272,6 +273,17 @@ class EvoGear(Component):
 
         self.theta = self.omega * t
 
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the gear including the teeth. Like its geometry, the gear is placed
+            at the origin and extends along the negative z-axis.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cylinder(np.array([0.0, 0.0, -self.length / 2]), np.array([0.0, 0.0, 1.0]), self.d_a / 2,
+                                    self.length)
+
     def position(self, angle: float) -> np.ndarray:
         """Method to calculate the angle based center of the EvoGear with eccentricity.
 
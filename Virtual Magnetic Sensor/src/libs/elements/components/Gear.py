@@ -4,6 +4,7 @@ from math import sin, cos, tan, radians, degrees
 from typing import Dict
 
 from libs.elements.Component import Component
+from libs.elements.BoundingBox import BoundingBox
 
 
 class Gear(Component):
@@ -262,6 +263,17 @@ class Gear(Component):
 
         self.theta = self.omega * t
 
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the gear including the teeth at the current rotation angle.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        radius = self.diameter[1] / 2 + self.tooth_height / 2 + max(float(np.max(self.tooth_deviations)), 0.0)
+
+        return BoundingBox.cylinder(self.position(self.theta), self.rotation_axis(self.theta), radius, self.length)
+
     def position(self, angle: float) -> np.ndarray:
         """Method to calculate the angle based center of the gear with eccentricity.
 
@@ -4,6 +4,7 @@ from math import sin, cos, radians, degrees
 from typing import Dict
 
 from libs.elements.Component import Component
+from libs.elements.BoundingBox import BoundingBox
 
 
 class GearRack(Component):
@@ -33,6 +34,11 @@ class GearRack(Component):
     :type chamfer_angle: float
     :param maxh: Mesh size of the gear.
     :type maxh: float
+    :param move_mesh: Specifies whether to move the mesh of the gear rack with it and smooth the surrounding air or to
+        build up the mesh at every time step from scratch.
+    :type move_mesh: bool
+    :param move_mesh_max_shift: Maximum permissible shift of the gear rack in mm before the mesh is rebuilt.
+    :type move_mesh_max_shift: float
     :param pos: Current position of the gear rack.
     :type pos: np.ndarray
     """
@@ -49,6 +55,8 @@ class GearRack(Component):
     chamfer_depth: float
     chamfer_angle: float
     maxh: float
+    move_mesh: bool
+    move_mesh_max_shift: float
 
     def __init__(self,
                  pos: np.ndarray,
@@ -63,6 +71,8 @@ class GearRack(Component):
                  chamfer_depth: float,
                  chamfer_angle: float,
                  maxh: float,
+                 move_mesh: bool = True,
+                 move_mesh_max_shift: float = 1.0,
                  shift: np.ndarray = None) -> None:
         """Constructor method."""
 
@@ -76,6 +86,8 @@ class GearRack(Component):
         self.tooth_flank_angle = tooth_flank_angle
         self.chamfer_depth = chamfer_depth
         self.chamfer_angle = chamfer_angle
+        self.move_mesh = move_mesh
+        self.move_mesh_max_shift = move_mesh_max_shift
 
         self.shift = np.array([0.0, 0.0, 0.0])
 
@@ -98,7 +110,9 @@ class GearRack(Component):
                    mu_r=4000.0,
                    chamfer_depth=0.0 * 1e-3,
                    chamfer_angle=radians(45.0),
-                   maxh=2.0)
+                   maxh=2.0,
+                   move_mesh=True,
+                   move_mesh_max_shift=1.0)
 
     @classmethod
     def from_dict(cls, dictionary: Dict[any]) -> GearRack:
@@ -148,7 +162,7 @@ class GearRack(Component):
         """Calls the init method with the actual class attributes."""
         self.__init__(self.pos, self.dim, self.rot, self.velocity, self.tooth_height, self.tooth_width,
                       self.tooth_pitch, self.tooth_flank_angle, self.mu_r, self.chamfer_depth, self.chamfer_angle,
-                      self.maxh)
+                      self.maxh, self.move_mesh, self.move_mesh_max_shift)
 
     def convert_to_si(self) -> None:
         """Calls the init method and converts the parameters from gui units to SI units."""
@@ -164,7 +178,9 @@ class GearRack(Component):
                       self.mu_r,
                       self.chamfer_depth * 1e-3,
                       radians(self.chamfer_angle),
-                      self.maxh)
+                      self.maxh,
+                      self.move_mesh,
+                      self.move_mesh_max_shift)
 
     def gui(self) -> GearRack:
         """Returns a copy of the class with attributes converted to units used in the gui."""
@@ -180,7 +196,9 @@ class GearRack(Component):
                         self.mu_r,
                         self.chamfer_depth * 1e3,
                         degrees(self.chamfer_angle),
-                        self.maxh)
+                        self.maxh,
+                        self.move_mesh,
+                        self.move_mesh_max_shift)
 
     def update(self, t: float) -> None:
         """Method to update the gear rotation angle theta for the next simulation step.
@@ -191,6 +209,16 @@ class GearRack(Component):
 
         self.shift = self.velocity * t
 
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the gear rack including the teeth at the current position.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cuboid(self.position(), self.transformation_matrix(), -self.dim / 2,
+                                  self.dim / 2 + np.array([0.0, self.tooth_height, 0.0]))
+
     def position(self) -> np.ndarray:
         """Method to calculate the angle based center of the gear with eccentricity.
 
@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict
 
 from libs.elements.Component import Component
+from libs.elements.BoundingBox import BoundingBox
 
 
 class Shaft(Component):
@@ -130,3 +131,12 @@ class Shaft(Component):
         """Stub
         """
         pass
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the shaft.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cylinder(self.pos, self.axis, self.diameter[1] / 2, self.length)
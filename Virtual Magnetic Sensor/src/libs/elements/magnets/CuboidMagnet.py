@@ -4,6 +4,7 @@ from math import sin, cos
 from typing import Dict
 
 from libs.elements.Magnet import Magnet
+from libs.elements.BoundingBox import BoundingBox
 
 
 class CuboidMagnet(Magnet):
@@ -148,6 +149,15 @@ class CuboidMagnet(Magnet):
                             self.tk,
                             self.maxh)
 
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the magnet.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cuboid(self.pos, self.transformation_matrix, -self.dim / 2, self.dim / 2)
+
     def get_transformation_matrix(self) -> np.ndarray:
         """Method for calculating the transformation matrix to transform the global coordinate system into the
             body-fixed coordinate system.
@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict
 
 from libs.elements.Magnet import Magnet
+from libs.elements.BoundingBox import BoundingBox
 
 
 class RodMagnet(Magnet):
@@ -150,3 +151,12 @@ class RodMagnet(Magnet):
                          self.temperature,
                          self.tk,
                          self.maxh)
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the magnet.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cylinder(self.pos, self.axis, self.radius, self.length)
@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict, List
 
 from libs.simulation.MagneticField import MagneticField
+from libs.elements.BoundingBox import BoundingBox
 
 
 class FieldRecorder:
@@ -176,3 +177,36 @@ class FieldRecorder:
             data_dict['field'].append(magnetic_field.get_h_field(self.X, self.Y, self.Z))
 
         return data_dict
+
+    def sampling_points(self) -> np.ndarray:
+        """Method returns the points in the 3D space at which the recorder samples the magnetic field.
+
+        :return: Array of shape (n, 3) with the grid points.
+        :rtype: numpy.ndarray
+        """
+
+        return np.column_stack((self.X.flatten(), self.Y.flatten(), self.Z.flatten()))
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the sampling grid.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.points(self.sampling_points())
+
+    def quantities(self, magnetic_field: MagneticField) -> np.ndarray:
+        """Method returns the recorded field on the grid as flat array.
+
+        :param magnetic_field: Instance of the MagneticField class.
+        :type magnetic_field: MagneticField
+
+        :return: B- or H-field on the grid points.
+        :rtype: numpy.ndarray
+        """
+
+        if self.field_specifier == 1:
+            return magnetic_field.get_b_field(self.X, self.Y, self.Z).flatten()
+        else:
+            return magnetic_field.get_h_field(self.X, self.Y, self.Z).flatten()
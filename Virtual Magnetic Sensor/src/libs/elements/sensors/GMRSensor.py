@@ -8,6 +8,7 @@ from pathlib import Path
 import os
 
 from libs.elements.Sensor import Sensor
+from libs.elements.BoundingBox import BoundingBox
 
 from libs.simulation.MagneticField import MagneticField
 
@@ -333,6 +334,37 @@ class GMRSensor(Sensor):
                                                        self.sensor_sampling_matrix[:, 2]))
         return data_dict
 
+    def sampling_points(self) -> np.ndarray:
+        """Method returns the points in the 3D space at which the sensor samples the magnetic field.
+
+        :return: Array of shape (n, 3) with the sampling points of all GMR elements.
+        :rtype: numpy.ndarray
+        """
+
+        return self.gmr_sampling_matrix.reshape(-1, 3)
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the sensor body and its sampling points.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.union([BoundingBox.cuboid(self.pos, self.transformation_matrix, -self.dim / 2, self.dim / 2),
+                                  BoundingBox.points(self.sampling_points())])
+
+    def quantities(self, field: MagneticField) -> np.ndarray:
+        """Method returns the quantities of interest the sensor output is based on.
+
+        :param field: Instance of the MagneticField class.
+        :type field: MagneticField
+
+        :return: Magnetic field strength averaged over each GMR element.
+        :rtype: numpy.ndarray
+        """
+
+        return self.get_gmr_h_values(field).flatten()
+
     def get_transformation_matrix(self) -> np.ndarray:
         """Method for calculating the transformation matrix to transform the global coordinate system into the
             body-fixed coordinate system, where the x-axis points along the arrangement of the GMR elements.
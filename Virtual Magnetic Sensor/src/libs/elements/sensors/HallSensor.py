@@ -4,6 +4,7 @@ import numpy as np
 from math import sin, cos
 
 from libs.elements.Sensor import Sensor
+from libs.elements.BoundingBox import BoundingBox
 from libs.simulation.MagneticField import MagneticField
 
 
@@ -154,6 +155,36 @@ class HallSensor(Sensor):
 
         return data_dict
 
+    def sampling_points(self) -> np.ndarray:
+        """Method returns the points in the 3D space at which the sensor samples the magnetic field.
+
+        :return: Array of shape (1, 3) with the sensor position.
+        :rtype: numpy.ndarray
+        """
+
+        return np.array([self.pos])
+
+    def bounding_box(self) -> np.ndarray:
+        """Returns the axis-aligned bounding box of the sensor body.
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return BoundingBox.cuboid(self.pos, self.transformation_matrix, -self.dim / 2, self.dim / 2)
+
+    def quantities(self, field: MagneticField) -> np.ndarray:
+        """Method returns the quantities of interest the sensor output is based on.
+
+        :param field: Instance of the MagneticField class.
+        :type field: MagneticField
+
+        :return: Hall voltage.
+        :rtype: numpy.ndarray
+        """
+
+        return np.array([self.get_hall_voltage(field)])
+
     def get_transformation_matrix(self) -> np.ndarray:
         """Method for calculating the transformation matrix to transform the global coordinate system into the
             body-fixed coordinate system.
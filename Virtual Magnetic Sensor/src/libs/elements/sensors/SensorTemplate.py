@@ -1,4 +1,5 @@
 from __future__ import annotations
+import numpy as np
 from libs.elements.Sensor import Sensor
 from libs.simulation.MagneticField import MagneticField
 from typing import Dict, List
@@ -129,3 +130,28 @@ class SensorTemplate(Sensor):
         data_dict['measurement_data'].append(measured_value_at_current_time_step)
 
         return data_dict
+
+    def sampling_points(self) -> np.ndarray:
+        """Method returns the points in the 3D space at which the sensor samples the magnetic field.
+
+        :return: Array of shape (n, 3) with the sampling points.
+        :rtype: numpy.ndarray
+        """
+
+        # Return the points passed to the field in set_data
+
+        return np.empty((0, 3))
+
+    def quantities(self, field: MagneticField) -> np.ndarray:
+        """Method returns the quantities of interest the sensor output is based on.
+
+        :param field: Instance of the MagneticField class.
+        :type field: MagneticField
+
+        :return: Flat array of the quantities of interest.
+        :rtype: numpy.ndarray
+        """
+
+        # Return the field values the measured variables are calculated from
+
+        return np.empty(0)
@@ -109,6 +109,36 @@ class FileDialogs:
         else:
             showerror(title="Error", message="No data to export.")
 
+    @staticmethod
+    def export_trace(data_stack: List[DataHandler], gui_handler: GUIHandler) -> None:
+
+        filetypes = [('JSON Files', '*.json *.JSON'),
+                     ('All Files', '*.*')]
+
+        if data_stack:
+            idx = gui_handler.selected_tab()
+
+            if not data_stack[idx].telemetry.events:
+                showerror(title="Error", message="No telemetry recorded. Run the simulation first.")
+                return
+
+            filename: str = fd.asksaveasfilename(
+                title='Select a File', initialdir=data_stack[idx].filepath.parent.as_posix(),
+                initialfile=Path(data_stack[idx].filepath.stem).with_suffix(".json"), filetypes=filetypes)
+
+            if filename:
+                filepath = Path(filename)
+                data_stack[idx].filepath = Path(filepath.parent.as_posix(), filepath.stem)
+
+                success = data_stack[idx].save_trace()
+
+                if success:
+                    showinfo(title="Info", message="File successfully saved.")
+                else:
+                    showerror(title="Error", message="File could not be saved.")
+        else:
+            showerror(title="Error", message="No data to export.")
+
     @staticmethod
     def export_py(data_stack: List[DataHandler], gui_handler: GUIHandler) -> None:
         showinfo(title='Error', message='Not implemented yet.')
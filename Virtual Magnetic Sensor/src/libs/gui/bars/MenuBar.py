@@ -27,6 +27,8 @@ class MenuBar(tk.Menu):
                                      command=lambda: FileDialogs.export_py(data_stack, gui_handler))
         self.export_menu.add_command(label="Export as .INI",
                                      command=lambda: FileDialogs.export_ini(data_stack, gui_handler))
+        self.export_menu.add_command(label="Export Telemetry as .JSON (Chrome Trace)",
+                                     command=lambda: FileDialogs.export_trace(data_stack, gui_handler))
         self.file_menu.add_command(
             label='New...',
             command=lambda: gui_handler.add_tab(DataHandler().template(), data_stack, config_handler),
@@ -77,6 +79,11 @@ class MenuBar(tk.Menu):
             command=lambda: SimulationHandler.draw(multiprocessing_tasks, data_stack, gui_handler,
                                                    gui_handler.selected_tab()),
             accelerator='F8')
+        self.sim_menu.add_command(
+            label='Size Scene',
+            command=lambda: SimulationHandler.size_scene(data_stack, config_handler, gui_handler,
+                                                         gui_handler.selected_tab())
+        )
         self.sim_menu.add_command(
             label='Run',
             command=lambda: SimulationHandler.run(multiprocessing_tasks, data_stack, config_handler, gui_handler,
@@ -127,6 +134,7 @@ class MenuBar(tk.Menu):
         self.sim_menu.entryconfig("Run", state=tk.NORMAL)
         self.sim_menu.entryconfig("Run All", state=tk.NORMAL)
         self.sim_menu.entryconfig("Draw (Netgen)", state=tk.NORMAL)
+        self.sim_menu.entryconfig("Size Scene", state=tk.NORMAL)
         self.help_menu.entryconfig("Documentation", state=tk.NORMAL)
         self.help_menu.entryconfig("Info", state=tk.NORMAL)
 
@@ -142,5 +150,6 @@ class MenuBar(tk.Menu):
         self.sim_menu.entryconfig("Run", state=tk.DISABLED)
         self.sim_menu.entryconfig("Run All", state=tk.DISABLED)
         self.sim_menu.entryconfig("Draw (Netgen)", state=tk.DISABLED)
+        self.sim_menu.entryconfig("Size Scene", state=tk.DISABLED)
         self.help_menu.entryconfig("Documentation", state=tk.DISABLED)
         self.help_menu.entryconfig("Info", state=tk.DISABLED)
@@ -36,6 +36,14 @@ class SimParamsFrame(ttk.LabelFrame):
                                             label=u'Ending Time t\u2081: ', unit='s')
         self.entries['samples'] = Gui.input_line(master=self.time_frame, config=config_handler.config, col=1, row=3,
                                                  label="Samples N:")
+        self.entries['fourier_harmonics'] = Gui.input_line(master=self.time_frame, config=config_handler.config, col=1,
+                                                           row=4, label="Fourier Harmonics (0 = Off):")
+        self.entries['fourier_tol'] = Gui.input_line(master=self.time_frame, config=config_handler.config, col=1,
+                                                     row=5, label="Fourier Tolerance:")
+        self.entries['sampling_tol'] = Gui.input_line(master=self.time_frame, config=config_handler.config, col=1,
+                                                      row=6, label="Sampling Tolerance (0 = Off):")
+        self.entries['sampling_stride'] = Gui.input_line(master=self.time_frame, config=config_handler.config, col=1,
+                                                         row=7, label="Initial Sampling Stride:")
 
         self.entries['boundaries'] = Gui.vector6_input(master=self, config=config_handler.config, col=1,
                                                        row=2, column_span=3, head_label="Boundaries in mm")
@@ -46,6 +54,64 @@ class SimParamsFrame(ttk.LabelFrame):
         self.entries['maxit'] = Gui.input_line(master=self, config=config_handler.config, col=1, row=5,
                                                label="Max Iterations:")
 
+        self.solver_frame = Gui.label_frame(master=self, config=config_handler.config, col=1, row=6,
+                                            column_span=3, row_span=1, label="Linear Solver")
+        self.entries['solver'] = tk.IntVar()
+        ttk.Radiobutton(master=self.solver_frame, text="Iterative (CG + BDDC)", variable=self.entries['solver'],
+                        value=0).grid(column=1, row=1, sticky='w', padx=config_handler.config['GUI']['padding'],
+                                      pady=config_handler.config['GUI']['h_spacing'])
+        ttk.Radiobutton(master=self.solver_frame, text="Direct (Sparse Cholesky)", variable=self.entries['solver'],
+                        value=1).grid(column=1, row=2, sticky='w', padx=config_handler.config['GUI']['padding'],
+                                      pady=config_handler.config['GUI']['h_spacing'])
+        self.entries['recycle'] = Gui.input_line(master=self.solver_frame, config=config_handler.config, col=1, row=3,
+                                                 label="Recycled Solutions:")
+
+        self.adaptive_frame = Gui.label_frame(master=self, config=config_handler.config, col=1, row=7,
+                                              column_span=3, row_span=1, label="Adaptive Refinement")
+        self.entries['adaptive_tol'] = Gui.input_line(master=self.adaptive_frame, config=config_handler.config, col=1,
+                                                      row=1, label="Sensor Tolerance (0 = Off):")
+        self.entries['adaptive_maxit'] = Gui.input_line(master=self.adaptive_frame, config=config_handler.config,
+                                                        col=1, row=2, label="Max Refinements:")
+
+        self.entries['submodel_margin'] = Gui.input_line(master=self, config=config_handler.config, col=1, row=8,
+                                                         label="Submodel Margin (0 = Off):", unit="mm")
+
+        self.formulation_frame = Gui.label_frame(master=self, config=config_handler.config, col=1, row=9,
+                                                 column_span=3, row_span=1, label="Field Formulation")
+        self.entries['formulation'] = tk.IntVar()
+        for row, (text, value) in enumerate([("Automatic", 0), ("Vector Potential (HCurl)", 1),
+                                             ("Scalar Potential (H1)", 2), ("Planar 2D (Cross-Section)", 3),
+                                             ("Axisymmetric (r-z)", 4)]):
+            ttk.Radiobutton(master=self.formulation_frame, text=text, variable=self.entries['formulation'],
+                            value=value).grid(column=1, row=row + 1, sticky='w',
+                                              padx=config_handler.config['GUI']['padding'],
+                                              pady=config_handler.config['GUI']['h_spacing'])
+
+        self.entries['symmetry'] = Gui.check_box(master=self, config=config_handler.config, col=1, row=10,
+                                                 label="Use Symmetry Planes")
+
+        self.open_boundary_frame = Gui.label_frame(master=self, config=config_handler.config, col=1, row=11,
+                                                   column_span=3, row_span=1, label="Open Boundary")
+        self.entries['shell_thickness'] = Gui.input_line(master=self.open_boundary_frame, config=config_handler.config,
+                                                         col=1, row=1, label="Shell Thickness (0 = Off):", unit="mm")
+        self.entries['shell_stretch'] = Gui.input_line(master=self.open_boundary_frame, config=config_handler.config,
+                                                       col=1, row=2, label="Stretch Factor:")
+
+        self.entries['tooth_culling'] = Gui.input_line(master=self, config=config_handler.config, col=1, row=12,
+                                                       label="Tooth Culling Radius (0 = Off):", unit="mm")
+
+        self.geometry_backend_frame = Gui.label_frame(master=self, config=config_handler.config, col=1, row=13,
+                                                      column_span=3, row_span=1, label="Geometry Backend")
+        self.entries['geometry_backend'] = tk.IntVar()
+        for row, (text, value) in enumerate([("CSG", 0), ("OpenCascade", 1)]):
+            ttk.Radiobutton(master=self.geometry_backend_frame, text=text, variable=self.entries['geometry_backend'],
+                            value=value).grid(column=1, row=row + 1, sticky='w',
+                                              padx=config_handler.config['GUI']['padding'],
+                                              pady=config_handler.config['GUI']['h_spacing'])
+
+        self.entries['mesh_pipeline'] = Gui.input_line(master=self, config=config_handler.config, col=1, row=14,
+                                                       label="Meshes Generated Ahead (0 = Off):")
+
     def get_parameters(self) -> Dict[str, any]:
         return Gui.extract(self.entries)
 
@@ -70,6 +70,11 @@ class GearRackFrame(ObjectFrame):
                                                      entry_labels=["x: ", "y: ", "z: "])
         self.entries['maxh'] = Gui.input_line(master=self.sim_params_frame, config=config_handler.config, col=0, row=1,
                                               label="Max Mesh Size:", unit="mm", col_shift=1)
+        self.entries['move_mesh'] = Gui.check_box(master=self.sim_params_frame, config=config_handler.config, col=0,
+                                                  row=2, label="Move Gear Rack Mesh")
+        self.entries['move_mesh_max_shift'] = Gui.input_line(master=self.sim_params_frame,
+                                                             config=config_handler.config, col=0, row=3, unit="mm",
+                                                             label="Max Mesh Shift:", col_shift=1)
 
         self.info_button = ttk.Button(master=self.button_frame, text="?", width=3, command=InfoFrame)
         self.info_button.pack(side="right", anchor="ne", padx=(1, config_handler.config['GUI']['padding']),
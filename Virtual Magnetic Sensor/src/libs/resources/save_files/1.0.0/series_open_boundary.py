@@ -0,0 +1,82 @@
+import numpy as np
+
+SimParams = {
+    "boundaries": np.array([[-6.0, -5.1, -2.5], [6.0, 7.8, 2.5]]),
+    "t0": 0,
+    "t1": 0,
+    "samples": 1,
+    "maxh_global": 2.0,
+    "tol": 1e-8,
+    "maxit": 1000,
+    "formulation": 2
+}
+
+Gear0 = {
+    "pos": np.array([0.0, 0.0, 0.0]),
+    "axis_0": np.array([0.0, 0.0, 1.0]),
+    "omega": 15.0,
+    "diameter": np.array([0.0, 7.64]),
+    "length": 3.0,
+    "tooth_height": 0.5,
+    "tooth_width": 0.333,
+    "n": 24,
+    "display_teeth_angle": np.array([0.0, 360.0]),
+    "tooth_flank_angle": 10.0,
+    "mu_r": 4000.0,
+    "eccentricity": 0.0,
+    "wobble_angle": 0.0,
+    "chamfer_depth": 0.0,
+    "chamfer_angle": 45,
+    "dev_tooth_num": 7,
+    "tooth_deviations": np.array([0.0, 0.0, 0.0]),
+    "maxh": 2.0,
+    "rotate_mesh": True,
+    "rotate_mesh_max_angle": 3.0
+}
+
+CuboidMagnet0 = {
+    "pos": np.array([0.0, 5.52, 0.0]),
+    "rot": np.array([0.0, 0.0, 0.0]),
+    "dim": np.array([10.0, 2.5, 1.3]),
+    "direction": np.array([0.0, 0.0, 1.0]),
+    "m": 1e3,
+    "mu_r": 1.0,
+    "temperature": 20.0,
+    "tk": -0.2,
+    "maxh": 2.0
+}
+
+GMRSensor0 = {
+    "pos": np.array([0.0, 4.27, -0.7]),
+    "rot": np.array([0.0, 0.0, 0.0]),
+    "depth": 100.0,
+    "height": 100.0,
+    "current": 1.0,
+    "gmr_offset": np.array([-455.0, -295.0, -205.0, -45.0, 45.0, 205.0, 295.0, 455.0]),
+    "gmr_length": 85.0,
+    "gmr_sampling": 20,
+    "sensor_sampling": 200,
+    "maxh": 0.2
+}
+
+HallSensor0 = {
+    "pos": np.array([3.0, 5.0, 0.5]),
+    "rot": np.array([0.0, 0.0, 0.0]),
+    "dim": np.array([0.2, 0.2, 0.2]),
+    "hall_coefficient": -53.0,
+    "conductor_thickness": 100.0,
+    "current": 1.0,
+    "maxh": 0.3
+}
+
+# Sensor error versus box size: The boxes leave a margin of 1 mm, 2.5 mm, 5 mm and 10 mm around the gear and the
+# magnet. The boxes up to 5 mm are simulated without and with a 2 mm open boundary shell, the 10 mm box without. A box
+# with a margin of 25 mm serves as reference.
+hardware = np.array([[-5.0, -4.1, -1.5], [5.0, 6.8, 1.5]])
+margins = np.array([1.0, 1.0, 2.5, 2.5, 5.0, 5.0, 10.0, 25.0])
+series = {
+    "SimParams": {
+        "boundaries": np.array([hardware + np.array([[-margin] * 3, [margin] * 3]) for margin in margins]),
+        "shell_thickness": np.array([0.0, 2.0, 0.0, 2.0, 0.0, 2.0, 0.0, 0.0])
+    },
+}
@@ -0,0 +1,107 @@
+import numpy as np
+from typing import Dict, List
+
+from libs.simulation.Sampler import Sampler
+
+from libs.DataHandler import DataHandler
+
+
+class AdaptiveSampler(Sampler):
+    """Samples the sensor signals at a subset of the time stamps of the simulation. The time stamps are solved on a
+        coarse grid first, every sampling_stride time stamp. Wherever the measurement data of two successive solved
+        time stamps differ by more than the tolerance relative to the amplitude of the signals, the time stamp centered
+        between them is solved as well, until the differences are within the tolerance or the time stamps are
+        adjacent. The signals at the time stamps not solved are interpolated linearly.
+
+        Flat parts of the signals, e.g. between tooth edges, are thus covered by the coarse grid, while edges and
+        deviating teeth are resolved down to the time stamps of the simulation. Features shorter than the stride of the
+        coarse grid, which do not change the signal from one coarse time stamp to the next, are not detected.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param solved: Measurement data of each object at the indices of the time stamps solved so far.
+    :type solved: Dict[int, List[Dict[str, list]]]
+    :param pending: Indices of the time stamps returned to be solved and not added yet.
+    :type pending: List[int]
+    """
+
+    data_handler: DataHandler
+    solved: Dict[int, List[Dict[str, list]]]
+    pending: List[int]
+
+    def __init__(self, data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.data_handler = data_handler
+        self.solved = dict()
+        samples = data_handler.sim_params().samples
+        self.pending = sorted(set(range(0, samples, max(1, data_handler.sim_params().sampling_stride))) |
+                              {samples - 1})
+
+    def next_times(self) -> List[float]:
+        """Method to return the time stamps to solve next. Once the pending time stamps are solved, the intervals
+            between successive solved time stamps are checked and the ones whose signals change by more than the
+            tolerance are bisected.
+
+        :return: Time stamps not solved yet, empty once the signals are resolved.
+        :rtype: List[float]
+        """
+
+        self.pending = [idx for idx in self.pending if idx not in self.solved]
+        if not self.pending:
+            indices = sorted(self.solved)
+            tol = self.data_handler.sim_params().sampling_tol
+            self.pending = [(start + end) // 2 for start, end in zip(indices[:-1], indices[1:])
+                            if end - start > 1 and self.change(start, end) > tol]
+
+        return [float(self.data_handler.sim_params().t[idx]) for idx in self.pending]
+
+    def add(self, times: List[float], outputs: List[List[Dict[str, list]]]) -> None:
+        """Method to add the measurement data of solved time stamps.
+
+        :param times: The time stamps.
+        :type times: List[float]
+        :param outputs: Measurement data of each object at each of the time stamps.
+        :type outputs: List[List[Dict[str, list]]]
+        """
+
+        for t, output in zip(times, outputs):
+            self.solved[int(np.argmin(np.abs(self.data_handler.sim_params().t - t)))] = output
+
+    def change(self, start: int, end: int) -> float:
+        """Method to calculate the largest change of the measurement data between two solved time stamps relative to
+            the amplitude of each output channel.
+
+        :param start: Index of the first time stamp.
+        :type start: int
+        :param end: Index of the second time stamp.
+        :type end: int
+
+        :return: The relative change.
+        :rtype: float
+        """
+
+        change = 0.0
+        for num, key in self.channels():
+            change = max(change, self.deviation(num, key, self.values([end], num, key), self.values([start], num, key)))
+
+        return change
+
+    def result(self) -> List[Dict[str, list]]:
+        """Method to return the measurement data at the time stamps of the simulation, interpolated linearly between
+            the solved time stamps.
+
+        :return: Measurement data of each object.
+        :rtype: List[Dict[str, list]]
+        """
+
+        indices = sorted(self.solved)
+        t = self.data_handler.sim_params().t
+        result = self.empty_result()
+        for num, key in self.channels():
+            values = self.values(indices, num, key)
+            columns = values.reshape(len(indices), -1)
+            interpolated = np.column_stack([np.interp(t, t[indices], column) for column in columns.T])
+            result[num][key] = list(interpolated.reshape((len(t),) + values.shape[1:]))
+
+        return result
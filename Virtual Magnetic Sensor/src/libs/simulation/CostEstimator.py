@@ -0,0 +1,205 @@
+import copy
+import json
+import multiprocessing
+import numpy as np
+from concurrent import futures
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from libs.simulation.MagneticFieldFactory import MagneticFieldFactory
+from libs.simulation.Telemetry import Telemetry
+
+from libs.DataHandler import DataHandler
+from libs.ConfigHandler import ConfigHandler
+
+
+class CostEstimator:
+    """Predicts the cost of a simulation before it is run. The scenery is meshed twice with all mesh sizes coarsened
+        by the factors below, which is cheap compared to the full mesh. The number of elements is extrapolated to the
+        configured mesh sizes with the exponent observed between both coarse meshes, which accounts for the geometry
+        that is resolved regardless of the mesh size. The degrees of freedom follow from the finite element space of
+        the chosen formulation on the finer coarse mesh. Small meshes are generated directly.
+
+        Solve time per step and peak memory of the worker process are predicted from the degrees of freedom by fits
+        to a calibration table in the config directory. After each run, the measured values are added to the table.
+        As long as it holds less than two runs, default values measured on a desktop machine are used.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param calibration_path: Path to the calibration table.
+    :type calibration_path: Path
+    """
+
+    data_handler: DataHandler
+    calibration_path: Path
+
+    # Coarsening factors of the mesh sizes the element count is extrapolated from.
+    factors = (2.0, 4.0)
+    # Below this number of elements on the finer coarse mesh, the full mesh is cheap and generated directly.
+    min_elements = 2000
+    # Default solve time per step in s per dof and peak memory in MB as base and per dof.
+    default_time_per_dof = 6e-5
+    default_rss = (250.0, 2.2e-3)
+    # Maximum number of runs kept in the calibration table.
+    max_entries = 50
+
+    def __init__(self,
+                 data_handler: DataHandler,
+                 calibration_path: Union[Path, None] = None) -> None:
+        """Constructor method."""
+
+        self.data_handler = data_handler
+        self.calibration_path = calibration_path if calibration_path is not None else \
+            ConfigHandler.get_config_path("cost_calibration.json")
+
+    @staticmethod
+    def mesh_statistics(data_handler: DataHandler, factor: float) -> Tuple[int, int]:
+        """Meshes the scenery at the start of the simulation with all mesh sizes multiplied by a factor.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param factor: Factor of the mesh sizes.
+        :type factor: float
+        :return: Number of volume elements and degrees of freedom, including submodels.
+        :rtype: Tuple[int, int]
+        """
+
+        scene = copy.deepcopy(data_handler)
+        # Only the mesh at the start is generated, no upcoming meshes.
+        scene.sim_params().mesh_pipeline = 0
+        scene.sim_params().maxh_global *= factor
+        for obj in scene.objects:
+            if hasattr(obj, "maxh"):
+                obj.maxh *= factor
+        for component in scene.components():
+            component.update(scene.sim_params().t0)
+
+        field = MagneticFieldFactory.init_field('ngsolve', scene)
+        elements = 0
+        dofs = 0
+        for model in [field] + field.submodels:
+            model.ng_mesh.update(scene, scene.sim_params().t0)
+            elements += model.ng_mesh.mesh.ne
+            dofs += model.finite_element_space().ndof
+
+        return elements, dofs
+
+    def load_calibration(self) -> List[Dict[str, float]]:
+        """Loads the calibration table.
+
+        :return: Degrees of freedom, solve time per step and peak memory of previous runs. Empty if there is no table.
+        :rtype: List[Dict[str, float]]
+        """
+
+        try:
+            with open(self.calibration_path, 'r') as file:
+                return json.load(file)
+        except (IOError, ValueError):
+            return list()
+
+    def calibrate(self, telemetry: Telemetry) -> bool:
+        """Adds the measured cost of a run to the calibration table.
+
+        :param telemetry: Telemetry of the run.
+        :type telemetry: Telemetry
+        :return: True when the table was written, false if the run has no solver statistics or writing failed.
+        :rtype: bool
+        """
+
+        steps = [step for step in telemetry.steps if 'ndof' in step and 'duration' in step and 'rss' in step]
+        if not steps:
+            return False
+
+        table = self.load_calibration()
+        table.append({'ndof': float(np.median([step['ndof'] for step in steps])),
+                      'step_time': float(np.median([step['duration'] for step in steps])),
+                      'peak_rss': float(max(step['rss'] for step in steps))})
+        try:
+            with open(self.calibration_path, 'w') as file:
+                json.dump(table[-self.max_entries:], file)
+            return True
+        except IOError:
+            return False
+
+    def predict(self, dofs: float) -> Tuple[float, float]:
+        """Predicts solve time per step and peak memory from the degrees of freedom. Time is fitted by a power law,
+            memory by a linear function of the degrees of freedom.
+
+        :param dofs: Degrees of freedom.
+        :type dofs: float
+        :return: Solve time per step in s and peak memory in MB.
+        :rtype: Tuple[float, float]
+        """
+
+        table = self.load_calibration()
+        ndof = np.array([entry['ndof'] for entry in table], dtype=float)
+        if np.unique(ndof).size < 2:
+            return self.default_time_per_dof * dofs, self.default_rss[0] + self.default_rss[1] * dofs
+
+        step_time = np.array([entry['step_time'] for entry in table], dtype=float)
+        peak_rss = np.array([entry['peak_rss'] for entry in table], dtype=float)
+        [exponent, offset] = np.polyfit(np.log(ndof), np.log(step_time), 1)
+        [slope, base] = np.polyfit(ndof, peak_rss, 1)
+
+        return float(np.exp(offset) * dofs ** exponent), float(base + slope * dofs)
+
+    def estimate(self) -> Dict[str, float]:
+        """Estimates the cost of the simulation.
+
+        :return: Number of volume elements, degrees of freedom, solve time per step and of all steps in s and peak
+            memory of the worker process in MB.
+        :rtype: Dict[str, float]
+        """
+
+        [elements_fine, dofs_fine] = self.mesh_statistics(self.data_handler, self.factors[0])
+        if elements_fine < self.min_elements:
+            [elements, dofs] = self.mesh_statistics(self.data_handler, 1.0)
+        else:
+            [elements_coarse, _] = self.mesh_statistics(self.data_handler, self.factors[1])
+            # Without geometry constraints, the element count grows with the third power of the refinement.
+            exponent = np.log(elements_fine / max(elements_coarse, 1)) / np.log(self.factors[1] / self.factors[0])
+            elements = elements_fine * self.factors[0] ** float(np.clip(exponent, 0.0, 3.0))
+            dofs = elements * dofs_fine / elements_fine
+        [step_time, peak_rss] = self.predict(dofs)
+
+        return {'elements': int(elements), 'ndof': int(dofs), 'step_time': step_time,
+                'total_time': step_time * self.data_handler.sim_params().samples, 'peak_rss': peak_rss}
+
+    def spawn_estimate(self) -> Union[Dict[str, float], None]:
+        """Estimates the cost of the simulation in a separate process, so the meshes are neither generated in the
+            process of the GUI nor kept in its memory.
+
+        :return: The estimate as returned by the estimate method. None if the estimation failed.
+        :rtype: Union[Dict[str, float], None]
+        """
+
+        # Forking the threads of the Ngsolve task manager is unsafe, the process is spawned instead.
+        with futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            try:
+                return executor.submit(self.estimate).result()
+            except Exception as error:
+                print("Cost estimation failed: " + str(error))
+                return None
+
+    @staticmethod
+    def report(estimate: Dict[str, float], max_memory: Union[float, None] = None) -> str:
+        """Summarizes an estimate.
+
+        :param estimate: Estimate as returned by the estimate method.
+        :type estimate: Dict[str, float]
+        :param max_memory: Memory limit of the worker process in MB. None if unlimited.
+        :type max_memory: Union[float, None]
+        :return: The report.
+        :rtype: str
+        """
+
+        lines = ["Estimated Elements: " + str(estimate['elements']),
+                 "Estimated DOFs: " + str(estimate['ndof']),
+                 "Estimated Time per Step: " + str(round(estimate['step_time'], 1)) + " s",
+                 "Estimated Total Time: " + str(round(estimate['total_time'] / 60, 1)) + " min",
+                 "Estimated Peak Memory: " + str(round(estimate['peak_rss'])) + " MB"]
+        if max_memory is not None and estimate['peak_rss'] > max_memory:
+            lines.append("The peak memory exceeds the max. process memory of " + str(round(max_memory)) +
+                         " MB, the worker process will be restarted repeatedly.")
+
+        return "\n".join(lines)
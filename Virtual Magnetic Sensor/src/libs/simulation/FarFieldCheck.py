@@ -0,0 +1,104 @@
+import copy
+import multiprocessing
+import numpy as np
+from concurrent import futures
+from typing import List
+
+from libs.simulation.MagneticFieldFactory import MagneticFieldFactory
+
+from libs.DataHandler import DataHandler
+
+
+class FarFieldCheck:
+    """Checks the accuracy of the tooth culling (see ToothCulling) before a simulation is run. The field at the
+        sampling points of the sensors and field recorders is calculated at the start of the simulation with the
+        culling radius of the simulation parameters and with twice the radius as reference. The teeth between both
+        radii contribute more to the field than the ones beyond the doubled radius, so the deviation bounds the error of
+        the culling from above.
+    """
+
+    # Tolerated deviation relative to the largest flux density of the reference.
+    tolerance = 0.01
+
+    @staticmethod
+    def sensor_field(data_handler: DataHandler, radius: float) -> np.ndarray:
+        """Calculates the flux density at the sampling points at the start of the simulation.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param radius: Culling radius in mm.
+        :type radius: float
+        :return: Array of shape (n, 3) with the flux density at the sampling points of all sensors.
+        :rtype: numpy.ndarray
+        """
+
+        scene = copy.deepcopy(data_handler)
+        scene.sim_params().tooth_culling = radius
+        # Only the field at the start is solved, no upcoming meshes.
+        scene.sim_params().mesh_pipeline = 0
+        for component in scene.components():
+            component.update(scene.sim_params().t0)
+
+        field = MagneticFieldFactory.init_field('ngsolve', scene)
+        field.create_field(scene, scene.sim_params().t0)
+        points = np.vstack([np.asarray(sensor.sampling_points(), dtype=float).reshape(-1, 3)
+                            for sensor in scene.sensors()])
+
+        return field.get_b_field(points[:, 0], points[:, 1], points[:, 2])
+
+    @staticmethod
+    def error(data_handler: DataHandler) -> float:
+        """Estimates the error of the tooth culling.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Largest deviation of the flux density at the sampling points relative to the largest flux density of
+            the reference.
+        :rtype: float
+        """
+
+        radius = data_handler.sim_params().tooth_culling
+        culled = FarFieldCheck.sensor_field(data_handler, radius)
+        reference = FarFieldCheck.sensor_field(data_handler, 2 * radius)
+        scale = float(np.max(np.linalg.norm(reference, axis=1)))
+
+        return float(np.max(np.linalg.norm(culled - reference, axis=1))) / scale if scale > 0 else 0.0
+
+    @staticmethod
+    def check(data_handler: DataHandler) -> List[str]:
+        """Checks the accuracy of the tooth culling if it is enabled and there are gears or gear racks and sensors.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Description of the problem, empty if the culling is accurate enough.
+        :rtype: List[str]
+        """
+
+        radius = data_handler.sim_params().tooth_culling
+        if radius <= 0 or not data_handler.components() or not data_handler.sensors():
+            return list()
+
+        error = FarFieldCheck.error(data_handler)
+        if error <= FarFieldCheck.tolerance:
+            return list()
+
+        return ["Culling the teeth beyond " + str(radius) + " mm changes the field at the sensors by " +
+                str(round(100 * error, 2)) + " %. Increase the tooth culling radius."]
+
+    @staticmethod
+    def spawn_check(data_handler: DataHandler) -> List[str]:
+        """Checks the accuracy of the tooth culling in a separate process, so the two fields are neither solved in the
+            process of the GUI nor kept in its memory.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Description of the problem, empty if the culling is accurate enough.
+        :rtype: List[str]
+        """
+
+        # Forking the threads of the Ngsolve task manager is unsafe, the process is spawned instead.
+        with futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            try:
+                return executor.submit(FarFieldCheck.check, data_handler).result()
+            except Exception as error:
+                return ["The tooth culling could not be checked: " + str(error)]
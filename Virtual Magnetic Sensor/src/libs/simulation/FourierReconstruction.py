@@ -0,0 +1,255 @@
+import numpy as np
+from typing import Dict, List, Tuple, Union
+
+from libs.elements.components.GearRack import GearRack
+from libs.simulation.Sampler import Sampler
+
+from libs.DataHandler import DataHandler
+
+
+class FourierReconstruction(Sampler):
+    """Reconstructs the sensor signals of steadily rotating gears from a small number of solves. The signals are
+        periodic in the revolution of the slowest gear and band-limited by the tooth frequency, so they are sampled on
+        a uniform grid of one revolution that resolves the requested harmonics of the tooth frequency (Nyquist). A
+        truncated Fourier series is fitted to each output channel, i.e. each measurement of each sensor, and evaluated
+        at the time stamps of the simulation.
+
+        The series is verified at a few held-out angles between the grid points. If its error relative to the
+        amplitude of the signals exceeds the tolerance, the grid is refined by a factor of two. The refined grid
+        contains the previous grid and the verification angles, so no solve is wasted. If the refined grid would need
+        more solves than the time stamps themselves, the time stamps are solved directly.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param omega: Angular velocity of the revolution the signals are periodic in.
+    :type omega: float
+    :param grid_size: Number of angles of the current grid, even. The series comprises grid_size / 2 - 1 harmonics of
+        the revolution.
+    :type grid_size: int
+    :param solved: Measurement data of each object at each time stamp solved so far.
+    :type solved: Dict[float, List[Dict[str, list]]]
+    :param error: Verification error of the last fit relative to the amplitude of the signals.
+    :type error: float
+    :param direct: True if the time stamps are solved directly since the reconstruction did not converge.
+    :type direct: bool
+    :param converged: True if the error of the last fit is within the tolerance.
+    :type converged: bool
+    """
+
+    data_handler: DataHandler
+    omega: float
+    grid_size: int
+    solved: Dict[float, List[Dict[str, list]]]
+    error: float
+    direct: bool
+    converged: bool
+
+    # Number of held-out angles the series is verified at.
+    verification_points = 3
+
+    def __init__(self, data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.data_handler = data_handler
+        [self.omega, harmonics] = self.bandwidth(data_handler)
+        self.grid_size = 2 * (harmonics * data_handler.sim_params().fourier_harmonics + 1)
+        self.solved = dict()
+        self.error = np.inf
+        self.direct = self.grid_size + self.verification_points >= data_handler.sim_params().samples
+        self.converged = False
+        if self.direct:
+            print("The Fourier reconstruction needs more solves than samples. Solving the samples instead.")
+
+    @staticmethod
+    def validity(data_handler: DataHandler) -> Tuple[bool, str]:
+        """Method to check whether the scenery has sensor signals and whether they are periodic, i.e. at least one gear
+            rotates, no gear rack moves and the angular velocities of all rotating gears are integer multiples of the
+            slowest one.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Whether the signals can be reconstructed and the reason if not.
+        :rtype: Tuple[bool, str]
+        """
+
+        if not data_handler.sensors():
+            return False, "No sensor signals to reconstruct."
+
+        omegas = list()
+        for component in data_handler.components():
+            if isinstance(component, GearRack) and np.any(np.asarray(component.velocity) != 0):
+                return False, "The moving gear racks make the signals non-periodic."
+            if getattr(component, 'omega', 0) != 0:
+                omegas.append(abs(component.omega))
+
+        if not omegas:
+            return False, "No gear rotates."
+
+        ratios = np.array(omegas) / min(omegas)
+        if not np.allclose(ratios, np.round(ratios), rtol=0, atol=1e-9):
+            return False, "The angular velocities of the gears are no integer multiples of the slowest one."
+
+        return True, ""
+
+    @staticmethod
+    def bandwidth(data_handler: DataHandler) -> Tuple[float, int]:
+        """Method to determine the revolution the signals are periodic in and the frequency of the teeth passing by.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Angular velocity of the slowest gear and the highest tooth frequency in multiples of it.
+        :rtype: Tuple[float, int]
+        """
+
+        components = [component for component in data_handler.components() if getattr(component, 'omega', 0) != 0]
+        omega = min(abs(component.omega) for component in components)
+
+        return omega, max(int(round(component.n * abs(component.omega) / omega)) for component in components)
+
+    def period(self) -> float:
+        """Method to return the duration of the revolution the signals are periodic in.
+
+        :return: The period.
+        :rtype: float
+        """
+
+        return 2 * np.pi / self.omega
+
+    def grid(self) -> List[float]:
+        """Method to return the time stamps of the angles the series is fitted to.
+
+        :return: Time stamps of one revolution, starting at the start time of the simulation.
+        :rtype: List[float]
+        """
+
+        return [self.data_handler.sim_params().t0 + num * self.period() / self.grid_size
+                for num in range(self.grid_size)]
+
+    def verification(self) -> List[float]:
+        """Method to return the time stamps of the held-out angles, centered between evenly spread grid points. They
+            are part of the grid of the next refinement.
+
+        :return: Time stamps of the verification angles.
+        :rtype: List[float]
+        """
+
+        indices = np.unique(np.linspace(0, self.grid_size, self.verification_points, endpoint=False).astype(int))
+
+        # Computed like the grid of the next refinement, so the time stamps match exactly.
+        return [self.data_handler.sim_params().t0 + (2 * num + 1) * self.period() / (2 * self.grid_size)
+                for num in indices]
+
+    def next_times(self) -> List[float]:
+        """Method to return the time stamps to solve next. Once the grid and the verification angles are solved, the
+            series is fitted and verified, and the grid is refined if necessary.
+
+        :return: Time stamps not solved yet, empty once the signals are reconstructed.
+        :rtype: List[float]
+        """
+
+        if self.direct:
+            return [t for t in self.data_handler.sim_params().t if t not in self.solved]
+        if self.converged:
+            return list()
+
+        # Solved in ascending order, so the mesh follows the rotation from one angle to the next.
+        times = sorted(t for t in self.grid() + self.verification() if t not in self.solved)
+        if times:
+            return times
+
+        verification = self.verification()
+        predicted = self.evaluate(self.fit(), verification)
+        self.error = self.error_at(predicted, verification)
+        print("Fourier Reconstruction: " + str(self.grid_size // 2 - 1) + " Harmonics, " + str(len(self.solved)) +
+              " Solves, Error: " + str(self.error))
+
+        if self.error <= self.data_handler.sim_params().fourier_tol:
+            self.converged = True
+        elif 2 * self.grid_size + self.verification_points >= self.data_handler.sim_params().samples:
+            print("The Fourier reconstruction needs more solves than samples. Solving the samples instead.")
+            self.direct = True
+        else:
+            self.grid_size *= 2
+
+        return self.next_times()
+
+    def add(self, times: List[float], outputs: List[List[Dict[str, list]]]) -> None:
+        """Method to add the measurement data of solved time stamps.
+
+        :param times: The time stamps.
+        :type times: List[float]
+        :param outputs: Measurement data of each object at each of the time stamps.
+        :type outputs: List[List[Dict[str, list]]]
+        """
+
+        for t, output in zip(times, outputs):
+            self.solved[t] = output
+
+    def fit(self) -> List[Dict[str, np.ndarray]]:
+        """Method to fit the truncated Fourier series to the grid. On the uniform grid, the least squares fit of the
+            series is given by the discrete Fourier transform truncated below the Nyquist frequency.
+
+        :return: Complex Fourier coefficients of each output channel, harmonics along the first axis.
+        :rtype: List[Dict[str, numpy.ndarray]]
+        """
+
+        grid = self.grid()
+        coefficients = self.empty_result()
+        for num, key in self.channels():
+            coefficients[num][key] = np.fft.rfft(self.values(grid, num, key), axis=0)[:self.grid_size // 2] / \
+                self.grid_size
+
+        return coefficients
+
+    def evaluate(self, coefficients: List[Dict[str, np.ndarray]], times: Union[List[float], np.ndarray]) \
+            -> List[Dict[str, list]]:
+        """Method to evaluate the Fourier series at time stamps.
+
+        :param coefficients: Complex Fourier coefficients of each output channel as returned by fit.
+        :type coefficients: List[Dict[str, numpy.ndarray]]
+        :param times: The time stamps.
+        :type times: Union[List[float], numpy.ndarray]
+
+        :return: Measurement data of each object at the time stamps.
+        :rtype: List[Dict[str, list]]
+        """
+
+        harmonics = np.arange(self.grid_size // 2)
+        phases = np.exp(1j * self.omega * np.outer(np.asarray(times) - self.data_handler.sim_params().t0, harmonics))
+        # The real signal is the sum of each harmonic and its complex conjugate, the constant part is counted once.
+        phases[:, 1:] *= 2
+
+        return [{key: list(np.tensordot(phases, values, axes=1).real) if len(values) else list()
+                 for key, values in data_dict.items()} for data_dict in coefficients]
+
+    def error_at(self, predicted: List[Dict[str, list]], times: List[float]) -> float:
+        """Method to calculate the largest deviation of the predicted from the solved measurement data relative to the
+            amplitude of each output channel.
+
+        :param predicted: Measurement data of each object at the time stamps.
+        :type predicted: List[Dict[str, list]]
+        :param times: Solved time stamps.
+        :type times: List[float]
+
+        :return: The relative deviation.
+        :rtype: float
+        """
+
+        return max([self.deviation(num, key, predicted[num][key], self.values(times, num, key))
+                    for num, key in self.channels()], default=0.0)
+
+    def result(self) -> List[Dict[str, list]]:
+        """Method to return the measurement data at the time stamps of the simulation.
+
+        :return: Measurement data of each object.
+        :rtype: List[Dict[str, list]]
+        """
+
+        if self.direct:
+            outputs = [self.solved[t] for t in self.data_handler.sim_params().t]
+            return [{key: [value for output in outputs for value in output[num].get(key, list())] for key in data_dict}
+                    for num, data_dict in enumerate(outputs[0])]
+
+        return self.evaluate(self.fit(), self.data_handler.sim_params().t)
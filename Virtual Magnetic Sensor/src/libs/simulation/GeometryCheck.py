@@ -0,0 +1,326 @@
+import copy
+import numpy as np
+from itertools import product
+from typing import Dict, List, Tuple
+
+from libs.elements.BoundingBox import BoundingBox
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.components.Gear import Gear
+from libs.elements.components.GearRack import GearRack
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.RodMagnet import RodMagnet
+from libs.elements.sensors.GMRSensor import GMRSensor
+from libs.elements.sensors.HallSensor import HallSensor
+
+from libs.DataHandler import DataHandler
+
+
+class GeometryCheck:
+    """Analytic precheck of the scenery before it is meshed. Each body is described by an envelope: Cuboids for
+        magnets, sensors and gear racks including their teeth, hollow cylinders for shafts, rod magnets and gears up
+        to the tip of the teeth. For all time stamps of the simulation, the check reports bodies with degenerate
+        dimensions, bodies reaching outside the simulation boundaries and overlapping bodies.
+
+        Two cuboids are tested exactly by separating axes, two cylinders with parallel axes by their radial and axial
+        distance. Other pairs are tested by sampling each envelope on a regular grid and locating the points in the
+        other one, after their bounding boxes have been found to overlap.
+    """
+
+    # Overlap or protrusion in mm below which bodies are considered touching.
+    tolerance = 1e-6
+    # Samples per direction of an envelope for the point based overlap test.
+    samples = 7
+
+    @staticmethod
+    def envelopes(obj: any) -> List[Dict[str, any]]:
+        """Returns the envelopes of a body.
+
+        :param obj: Component, magnet or sensor.
+        :type obj: any
+        :return: Cuboids with center, body-fixed to global matrix, lower and upper corner in body-fixed coordinates,
+            and cylinders with center, axis, inner and outer radius and length. Empty for objects without a body.
+        :rtype: List[Dict[str, any]]
+        """
+
+        if isinstance(obj, Gear):
+            return [GeometryCheck.cylinder(obj.position(obj.theta), obj.rotation_axis(obj.theta), obj.diameter[0] / 2,
+                                           obj.diameter[1] / 2 + obj.tooth_height / 2 +
+                                           max(float(np.max(obj.tooth_deviations)), 0.0), obj.length)]
+        if isinstance(obj, EvoGear):
+            return [GeometryCheck.cylinder(np.array([0.0, 0.0, -obj.length / 2]), np.array([0.0, 0.0, 1.0]),
+                                           obj.diameter[0] / 2, obj.d_a / 2, obj.length)]
+        if isinstance(obj, GearRack):
+            return [GeometryCheck.cuboid(obj.position(), obj.transformation_matrix(), -obj.dim / 2,
+                                         obj.dim / 2 + np.array([0.0, obj.tooth_height, 0.0]))]
+        if isinstance(obj, Shaft):
+            return [GeometryCheck.cylinder(obj.pos, obj.axis, obj.diameter[0] / 2, obj.diameter[1] / 2, obj.length)]
+        if isinstance(obj, RodMagnet):
+            return [GeometryCheck.cylinder(obj.pos, obj.axis, 0.0, obj.radius, obj.length)]
+        if isinstance(obj, (CuboidMagnet, HallSensor, GMRSensor)):
+            return [GeometryCheck.cuboid(obj.pos, obj.transformation_matrix, -obj.dim / 2, obj.dim / 2)]
+
+        return list()
+
+    @staticmethod
+    def cuboid(center: np.ndarray, matrix: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> Dict[str, any]:
+        """Returns the envelope of a rotated cuboid.
+
+        :param center: Origin of the body-fixed coordinate system.
+        :type center: numpy.ndarray
+        :param matrix: Matrix transforming body-fixed into global directions.
+        :type matrix: numpy.ndarray
+        :param lower: Lower corner of the cuboid in body-fixed coordinates.
+        :type lower: numpy.ndarray
+        :param upper: Upper corner of the cuboid in body-fixed coordinates.
+        :type upper: numpy.ndarray
+        :return: The envelope.
+        :rtype: Dict[str, any]
+        """
+
+        return {'type': 'cuboid', 'center': np.asarray(center, dtype=float), 'matrix': np.asarray(matrix, dtype=float),
+                'lower': np.asarray(lower, dtype=float), 'upper': np.asarray(upper, dtype=float)}
+
+    @staticmethod
+    def cylinder(center: np.ndarray, axis: np.ndarray, inner: float, outer: float, length: float) -> Dict[str, any]:
+        """Returns the envelope of a hollow cylinder.
+
+        :param center: Center of the cylinder.
+        :type center: numpy.ndarray
+        :param axis: Direction of the cylinder axis.
+        :type axis: numpy.ndarray
+        :param inner: Inner radius, 0 for a solid cylinder.
+        :type inner: float
+        :param outer: Outer radius.
+        :type outer: float
+        :param length: Length of the cylinder along the axis.
+        :type length: float
+        :return: The envelope.
+        :rtype: Dict[str, any]
+        """
+
+        axis = np.asarray(axis, dtype=float)
+        norm = np.linalg.norm(axis)
+
+        return {'type': 'cylinder', 'center': np.asarray(center, dtype=float),
+                'axis': axis / norm if norm > 0 else axis, 'inner': float(inner), 'outer': float(outer),
+                'length': float(length)}
+
+    @staticmethod
+    def bounding_box(envelope: Dict[str, any]) -> np.ndarray:
+        """Returns the axis-aligned bounding box of an envelope.
+
+        :param envelope: The envelope.
+        :type envelope: Dict[str, any]
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        if envelope['type'] == 'cuboid':
+            return BoundingBox.cuboid(envelope['center'], envelope['matrix'], envelope['lower'], envelope['upper'])
+
+        return BoundingBox.cylinder(envelope['center'], envelope['axis'], envelope['outer'], envelope['length'])
+
+    @staticmethod
+    def degenerate(envelope: Dict[str, any]) -> bool:
+        """Checks if an envelope has no volume.
+
+        :param envelope: The envelope.
+        :type envelope: Dict[str, any]
+        :return: True if a dimension is not positive or the axis has no direction.
+        :rtype: bool
+        """
+
+        if envelope['type'] == 'cuboid':
+            return bool(np.any(envelope['upper'] - envelope['lower'] <= 0) or
+                        abs(np.linalg.det(envelope['matrix'])) < 1e-12)
+
+        return bool(envelope['length'] <= 0 or envelope['outer'] <= max(envelope['inner'], 0.0) or
+                    np.linalg.norm(envelope['axis']) == 0)
+
+    @staticmethod
+    def sample(envelope: Dict[str, any], n: int) -> np.ndarray:
+        """Samples an envelope on a regular grid including its surface.
+
+        :param envelope: The envelope.
+        :type envelope: Dict[str, any]
+        :param n: Samples per direction.
+        :type n: int
+        :return: Array of shape (m, 3) with the points.
+        :rtype: numpy.ndarray
+        """
+
+        if envelope['type'] == 'cuboid':
+            local = np.array(list(product(*[np.linspace(lower, upper, n) for lower, upper in
+                                            zip(envelope['lower'], envelope['upper'])])))
+            return envelope['center'] + local.dot(envelope['matrix'].T)
+
+        axis = envelope['axis']
+        normal = np.cross(axis, [1.0, 0.0, 0.0] if abs(axis[0]) < 0.9 else [0.0, 1.0, 0.0])
+        normal /= np.linalg.norm(normal)
+        binormal = np.cross(axis, normal)
+        [r, phi, z] = [values.flatten() for values in np.meshgrid(
+            np.linspace(envelope['inner'], envelope['outer'], n), np.linspace(0.0, 2 * np.pi, 4 * n, endpoint=False),
+            np.linspace(-envelope['length'] / 2, envelope['length'] / 2, n))]
+
+        return envelope['center'] + np.outer(r * np.cos(phi), normal) + np.outer(r * np.sin(phi), binormal) + \
+            np.outer(z, axis)
+
+    @staticmethod
+    def contains(envelope: Dict[str, any], points: np.ndarray, tolerance: float) -> np.ndarray:
+        """Locates points in the interior of an envelope shrunk by the tolerance.
+
+        :param envelope: The envelope.
+        :type envelope: Dict[str, any]
+        :param points: Array of shape (m, 3) with the points.
+        :type points: numpy.ndarray
+        :param tolerance: Distance to the surface below which points are considered outside.
+        :type tolerance: float
+        :return: Boolean array of length m.
+        :rtype: numpy.ndarray
+        """
+
+        if envelope['type'] == 'cuboid':
+            local = (points - envelope['center']).dot(envelope['matrix'])
+            return np.all((local > envelope['lower'] + tolerance) & (local < envelope['upper'] - tolerance), axis=1)
+
+        z = (points - envelope['center']).dot(envelope['axis'])
+        r = np.linalg.norm(points - envelope['center'] - np.outer(z, envelope['axis']), axis=1)
+
+        return (np.abs(z) < envelope['length'] / 2 - tolerance) & (r > envelope['inner'] + tolerance) & \
+            (r < envelope['outer'] - tolerance)
+
+    @staticmethod
+    def separated_cuboids(envelope: Dict[str, any], other: Dict[str, any], tolerance: float) -> bool:
+        """Tests two cuboids for a separating axis.
+
+        :param envelope: The first cuboid.
+        :type envelope: Dict[str, any]
+        :param other: The second cuboid.
+        :type other: Dict[str, any]
+        :param tolerance: Overlap below which the cuboids are considered touching.
+        :type tolerance: float
+        :return: True if the cuboids do not overlap.
+        :rtype: bool
+        """
+
+        axes = [envelope['matrix'][:, i] for i in range(3)] + [other['matrix'][:, i] for i in range(3)]
+        axes += [np.cross(a, b) for a in axes[:3] for b in axes[3:]]
+        [center_a, half_a] = [envelope['center'] + envelope['matrix'].dot((envelope['upper'] + envelope['lower']) / 2),
+                              (envelope['upper'] - envelope['lower']) / 2]
+        [center_b, half_b] = [other['center'] + other['matrix'].dot((other['upper'] + other['lower']) / 2),
+                              (other['upper'] - other['lower']) / 2]
+        for axis in axes:
+            norm = np.linalg.norm(axis)
+            if norm < 1e-9:
+                continue
+            axis = axis / norm
+            radius_a = np.sum(half_a * np.abs(envelope['matrix'].T.dot(axis)))
+            radius_b = np.sum(half_b * np.abs(other['matrix'].T.dot(axis)))
+            if abs((center_b - center_a).dot(axis)) >= radius_a + radius_b - tolerance:
+                return True
+
+        return False
+
+    @staticmethod
+    def overlap(envelope: Dict[str, any], other: Dict[str, any], tolerance: float) -> bool:
+        """Tests two envelopes for overlap.
+
+        :param envelope: The first envelope.
+        :type envelope: Dict[str, any]
+        :param other: The second envelope.
+        :type other: Dict[str, any]
+        :param tolerance: Overlap below which the envelopes are considered touching.
+        :type tolerance: float
+        :return: True if the envelopes overlap.
+        :rtype: bool
+        """
+
+        box = GeometryCheck.bounding_box(envelope)
+        other_box = GeometryCheck.bounding_box(other)
+        if np.any(np.minimum(box[1], other_box[1]) - np.maximum(box[0], other_box[0]) <= tolerance):
+            return False
+
+        if envelope['type'] == other['type'] == 'cuboid':
+            return not GeometryCheck.separated_cuboids(envelope, other, tolerance)
+
+        if envelope['type'] == other['type'] == 'cylinder' and \
+                np.linalg.norm(np.cross(envelope['axis'], other['axis'])) < 1e-9:
+            offset = other['center'] - envelope['center']
+            axial = abs(offset.dot(envelope['axis']))
+            radial = np.linalg.norm(offset - offset.dot(envelope['axis']) * envelope['axis'])
+            if axial >= (envelope['length'] + other['length']) / 2 - tolerance or \
+                    radial >= envelope['outer'] + other['outer'] - tolerance:
+                return False
+            # One cylinder lies in the bore of the other one.
+            return not (radial + other['outer'] <= envelope['inner'] + tolerance or
+                        radial + envelope['outer'] <= other['inner'] + tolerance)
+
+        return bool(np.any(GeometryCheck.contains(other, GeometryCheck.sample(envelope, GeometryCheck.samples),
+                                                  tolerance)) or
+                    np.any(GeometryCheck.contains(envelope, GeometryCheck.sample(other, GeometryCheck.samples),
+                                                  tolerance)))
+
+    @staticmethod
+    def bodies(data_handler: DataHandler) -> List[Tuple[str, any]]:
+        """Returns the objects of the scenery that are meshed as bodies with their names.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Name and object of each magnet, component and sensor.
+        :rtype: List[Tuple[str, any]]
+        """
+
+        bodies: List[Tuple[str, any]] = list()
+        for objects in [data_handler.physical_magnets(), data_handler.components(), data_handler.physical_sensors()]:
+            for obj in objects:
+                bodies.append((type(obj).__name__ + str(sum(type(other) is type(obj) for _, other in bodies)), obj))
+
+        return bodies
+
+    @staticmethod
+    def check(data_handler: DataHandler) -> List[str]:
+        """Checks the scenery at all time stamps of the simulation. Each problem is reported once, at the first time
+            stamp it occurs.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Description of each problem found. Empty if the scenery is valid.
+        :rtype: List[str]
+        """
+
+        scene = copy.deepcopy(data_handler)
+        bodies = GeometryCheck.bodies(scene)
+        boundaries = np.asarray(scene.sim_params().boundaries, dtype=float)
+        tolerance = GeometryCheck.tolerance
+        problems: Dict[Tuple[str, ...], str] = dict()
+
+        for step, t in enumerate(scene.sim_params().t):
+            for component in scene.components():
+                component.update(t)
+            envelopes = [(name, GeometryCheck.envelopes(obj), obj in scene.components()) for name, obj in bodies]
+
+            for name, shapes, moving in envelopes:
+                if step > 0 and not moving:
+                    continue
+                if any(GeometryCheck.degenerate(shape) for shape in shapes):
+                    problems[(name,)] = name + " has non-positive dimensions."
+                    continue
+                for shape in shapes:
+                    box = GeometryCheck.bounding_box(shape)
+                    if (np.any(box[0] < boundaries[0] - tolerance) or np.any(box[1] > boundaries[1] + tolerance)) \
+                            and (name, "outside") not in problems:
+                        problems[(name, "outside")] = name + " reaches outside the simulation boundaries at t = " + \
+                            str(round(float(t), 6)) + " s."
+
+            for num, (name, shapes, moving) in enumerate(envelopes):
+                for other_name, other_shapes, other_moving in envelopes[num + 1:]:
+                    if step > 0 and not moving and not other_moving or \
+                            {(name,), (other_name,), (name, other_name)} & problems.keys():
+                        continue
+                    if any(GeometryCheck.overlap(shape, other_shape, tolerance) for shape in shapes
+                           for other_shape in other_shapes):
+                        problems[(name, other_name)] = name + " and " + other_name + " overlap at t = " + \
+                            str(round(float(t), 6)) + " s."
+
+        return list(problems.values())
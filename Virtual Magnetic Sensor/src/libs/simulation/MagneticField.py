@@ -21,6 +21,11 @@ class MagneticField(metaclass=abc.ABCMeta):
 
         pass
 
+    def close(self) -> None:
+        """Method to release the resources of the magnetic field, e.g. processes, once it is not used anymore."""
+
+        pass
+
     @abc.abstractmethod
     def draw(self) -> None:
         """Method to draw the magnetic field."""
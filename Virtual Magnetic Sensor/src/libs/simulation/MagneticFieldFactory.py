@@ -1,4 +1,10 @@
+from typing import List, Union
+
 from libs.simulation.ngsolve.NGField import NGField
+from libs.simulation.ngsolve.NGScalarField import NGScalarField
+from libs.simulation.ngsolve.NGPlanarField import NGPlanarField
+from libs.simulation.ngsolve.NGAxisymmetricField import NGAxisymmetricField
+from libs.simulation.Telemetry import Telemetry
 from libs.DataHandler import DataHandler
 
 
@@ -6,17 +12,42 @@ class MagneticFieldFactory:
     """Class handles the initialisation of the magnetic field based on the existing implementations."""
 
     @staticmethod
-    def init_field(field_type: str, data_handler: DataHandler) -> NGField:
-        """Initialize an object of the MagneticField class based on a subclass.
+    def init_field(field_type: str, data_handler: DataHandler, max_memory: Union[float, None] = None,
+                   telemetry: Union[Telemetry, None] = None, times: Union[List[float], None] = None) -> NGField:
+        """Initialize an object of the MagneticField class based on a subclass. For the ngsolve implementation, the
+            formulation is chosen by the simulation parameters. The automatic choice is the axisymmetric formulation
+            for coaxial rod magnets and shafts and the vector potential otherwise. If the planar or axisymmetric
+            formulation is requested for a scenery that can not be reduced to 2D, the reason is printed and the 3D
+            vector potential is used.
 
         :param field_type: Specifies the requested implementation.
         :type field_type: string
         :param data_handler: Object of the Data class containing all simulation relevant data.
         :type data_handler: DataHandler
+        :param max_memory: Memory limit in MB of the process computing the field. None if unlimited.
+        :type max_memory: Union[float, None]
+        :param telemetry: Collects the durations of the simulation stages and the solver statistics.
+        :type telemetry: Union[Telemetry, None]
+        :param times: Time stamps of the steps in the order they are simulated. None for the time stamps of the
+            simulation parameters.
+        :type times: Union[List[float], None]
 
         :return: Object of a certain magnetic field subclass.
         :rtype: NGField
         """
 
         if field_type == 'ngsolve':
-            return NGField(data_handler)
+            if data_handler.sim_params().formulation == 2:
+                return NGScalarField(data_handler, max_memory, telemetry, times=times)
+            if data_handler.sim_params().formulation == 3:
+                [valid, reason] = NGPlanarField.validity(data_handler)
+                if valid:
+                    return NGPlanarField(data_handler, max_memory, telemetry, times=times)
+                print(reason + " Falling back to the 3D vector potential formulation.")
+            if data_handler.sim_params().formulation in (0, 4):
+                [valid, reason] = NGAxisymmetricField.validity(data_handler)
+                if valid:
+                    return NGAxisymmetricField(data_handler, max_memory, telemetry, times=times)
+                if data_handler.sim_params().formulation == 4:
+                    print(reason + " Falling back to the 3D vector potential formulation.")
+            return NGField(data_handler, max_memory, telemetry, times=times)
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Union
+
+from libs.simulation.ngsolve.NGMesh import NGMesh
+
+from libs.DataHandler import DataHandler
+from libs.ConfigHandler import ConfigHandler
+
+
+class ResultCache:
+    """Persistent cache of the sampled outputs of the simulation steps. Each entry is addressed by a hash of the
+        physical state at the time stamp of the step: the poses of the components, the parameters of all objects, e.g.
+        sources, materials, sensors and mesh sizes, and the simulation parameters, e.g. solver settings. The time
+        dynamics, i.e. time range, speeds and the resulting time stamp, only enter by the poses, so runs reaching the
+        same poses share their entries. On a hit, meshing and solving of the step are skipped.
+
+        The entries are stored as files in a directory in the config directory. Once the size of the directory
+        exceeds the limit, the least recently used entries are removed.
+
+    :param max_size: Size limit of the cache in MB.
+    :type max_size: float
+    :param path: Directory of the cache entries.
+    :type path: Path
+    """
+
+    max_size: float
+    path: Path
+
+    # Parameters defining the time dynamics or the execution of the simulation, not the physical state. The angles and
+    # shifts resulting from the time dynamics are part of the poses.
+    time_parameters = ('t0', 't1', 'samples', 'omega', 'velocity', 'theta', 'shift', 'mesh_pipeline',
+                       'fourier_harmonics', 'fourier_tol', 'sampling_tol', 'sampling_stride')
+    # Significant digits floats are rounded to, so the same poses reached by different speeds share their entries.
+    digits = 12
+    # Increment to invalidate all entries, e.g. when the computation of the outputs changes.
+    version = 1
+
+    def __init__(self, max_size: float, path: Union[Path, None] = None) -> None:
+        """Constructor method."""
+
+        self.max_size = max_size
+        self.path = path if path is not None else ConfigHandler.get_config_path("result_cache")
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def canonical(value: any) -> any:
+        """Converts a value to a form with a unique JSON representation, i.e. arrays to lists and floats rounded.
+
+        :param value: Value to convert.
+        :type value: any
+        :return: The converted value.
+        :rtype: any
+        """
+
+        if isinstance(value, dict):
+            return {str(key): ResultCache.canonical(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return [ResultCache.canonical(item) for item in value]
+        if isinstance(value, (bool, np.bool_)):
+            return bool(value)
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        if isinstance(value, (float, np.floating)):
+            return float('{:.{}g}'.format(float(value), ResultCache.digits))
+        if value is None or isinstance(value, str):
+            return value
+
+        return str(value)
+
+    @staticmethod
+    def state(data_handler: DataHandler) -> Dict[str, any]:
+        """Collects the physical state of the scenery with the components at their current poses.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Poses of the components and the parameters of all objects.
+        :rtype: Dict[str, any]
+        """
+
+        objects: List[Dict[str, any]] = list()
+        for obj in data_handler.objects:
+            parameters = obj.gui_dict() if hasattr(obj, "gui_dict") else dict()
+            for key in ResultCache.time_parameters:
+                parameters.pop(key, None)
+            # The characteristic curve of GMR sensors is read from the config directory.
+            if hasattr(obj, "coeffs"):
+                parameters['coeffs'] = obj.coeffs
+            objects.append({'type': type(obj).__name__, 'parameters': parameters})
+
+        return ResultCache.canonical({'version': ResultCache.version, 'poses': NGMesh.motion_state(data_handler),
+                                      'objects': objects})
+
+    @staticmethod
+    def key(data_handler: DataHandler) -> str:
+        """Calculates the address of the current state of the scenery in the cache.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Hexadecimal SHA-256 hash of the state.
+        :rtype: str
+        """
+
+        return hashlib.sha256(json.dumps(ResultCache.state(data_handler), sort_keys=True).encode()).hexdigest()
+
+    def load(self, key: str) -> Union[List[Dict[str, list]], None]:
+        """Loads the outputs of a step and marks the entry as recently used.
+
+        :param key: Address of the state.
+        :type key: str
+        :return: Entries appended to the measurement data of each object in the step. None if the state is not cached.
+        :rtype: Union[List[Dict[str, list]], None]
+        """
+
+        filepath = self.path / (key + ".pkl")
+        try:
+            with open(filepath, 'rb') as file:
+                outputs = pickle.load(file)
+            self.touch(filepath)
+            return outputs
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def store(self, key: str, outputs: List[Dict[str, list]]) -> bool:
+        """Stores the outputs of a step and removes the least recently used entries beyond the size limit.
+
+        :param key: Address of the state.
+        :type key: str
+        :param outputs: Entries appended to the measurement data of each object in the step.
+        :type outputs: List[Dict[str, list]]
+        :return: True when the entry was written, false otherwise.
+        :rtype: bool
+        """
+
+        filepath = self.path / (key + ".pkl")
+        try:
+            # Written to a temporary file first, so other processes never load a partial entry.
+            temp_path = filepath.with_suffix(".tmp" + str(os.getpid()))
+            with open(temp_path, 'wb') as file:
+                pickle.dump(outputs, file)
+            os.replace(temp_path, filepath)
+            self.touch(filepath)
+        except IOError:
+            return False
+
+        self.evict()
+
+        return True
+
+    @staticmethod
+    def touch(filepath: Path) -> None:
+        """Marks an entry as recently used by its modification time. The time is set explicitly, since the file
+            system clock is too coarse to order entries used in quick succession.
+
+        :param filepath: Path of the entry.
+        :type filepath: Path
+        """
+
+        now = time.time_ns()
+        os.utime(filepath, ns=(now, now))
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits into the size limit."""
+
+        entries = list()
+        for filepath in self.path.glob("*.pkl"):
+            try:
+                stat = filepath.stat()
+                entries.append((stat.st_mtime, stat.st_size, filepath))
+            except OSError:
+                continue
+
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, filepath in sorted(entries):
+            if size <= self.max_size * 1024 ** 2:
+                break
+            try:
+                filepath.unlink()
+                size -= entry_size
+            except OSError:
+                continue
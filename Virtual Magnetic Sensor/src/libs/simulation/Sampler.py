@@ -0,0 +1,135 @@
+import abc
+import numpy as np
+from typing import Dict, List, Tuple
+
+from libs.DataHandler import DataHandler
+
+
+class Sampler(metaclass=abc.ABCMeta):
+    """Metaclass for samplers, which solve a subset of the time stamps of the simulation or other time stamps and
+        derive the measurement data at the time stamps of the simulation from them. The simulation asks the sampler
+        for the time stamps to solve next and adds the measurement data of the solved steps until no time stamps are
+        left.
+
+        The measurement data of a step holds a dictionary per object, mapping the name of each measurement to a list
+        with its value. Each measurement of each object is an output channel of the sampler. Channels without a value
+        in any of the solved steps are not sampled.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param solved: Measurement data of each object at each step solved so far.
+    :type solved: Dict[any, List[Dict[str, list]]]
+    """
+
+    data_handler: DataHandler
+    solved: Dict[any, List[Dict[str, list]]]
+
+    @abc.abstractmethod
+    def next_times(self) -> List[float]:
+        """Method to return the time stamps to solve next.
+
+        :return: Time stamps not solved yet, empty once the measurement data is sampled.
+        :rtype: List[float]
+        """
+
+        return list()
+
+    @abc.abstractmethod
+    def add(self, times: List[float], outputs: List[List[Dict[str, list]]]) -> None:
+        """Method to add the measurement data of solved time stamps.
+
+        :param times: The time stamps.
+        :type times: List[float]
+        :param outputs: Measurement data of each object at each of the time stamps.
+        :type outputs: List[List[Dict[str, list]]]
+        """
+
+        pass
+
+    @abc.abstractmethod
+    def result(self) -> List[Dict[str, list]]:
+        """Method to return the measurement data at the time stamps of the simulation.
+
+        :return: Measurement data of each object.
+        :rtype: List[Dict[str, list]]
+        """
+
+        return list()
+
+    def channels(self) -> List[Tuple[int, str]]:
+        """Method to list the output channels with a value in each solved step.
+
+        :return: Index of the object and name of the measurement of each channel.
+        :rtype: List[Tuple[int, str]]
+        """
+
+        outputs = list(self.solved.values())
+        if not outputs:
+            return list()
+
+        return [(num, key) for num, data_dict in enumerate(outputs[0]) for key in data_dict
+                if all(output[num].get(key) for output in outputs)]
+
+    def empty_result(self) -> List[Dict[str, list]]:
+        """Method to return measurement data without values, the structure of the result before the channels are
+            filled in.
+
+        :return: An empty list per measurement of each object.
+        :rtype: List[Dict[str, list]]
+        """
+
+        outputs = list(self.solved.values())
+
+        return [{key: list() for key in data_dict} for data_dict in outputs[0]] if outputs else list()
+
+    def values(self, steps: list, num: int, key: str) -> np.ndarray:
+        """Method to collect the values of an output channel at solved steps.
+
+        :param steps: Keys of the solved steps.
+        :type steps: list
+        :param num: Index of the object.
+        :type num: int
+        :param key: Name of the measurement.
+        :type key: str
+
+        :return: The values, the steps along the first axis.
+        :rtype: numpy.ndarray
+        """
+
+        return np.array([self.solved[step][num][key][0] for step in steps], dtype=float)
+
+    def amplitude(self, num: int, key: str) -> float:
+        """Method to return the amplitude of an output channel, i.e. its largest magnitude in all solved steps.
+
+        :param num: Index of the object.
+        :type num: int
+        :param key: Name of the measurement.
+        :type key: str
+
+        :return: The amplitude.
+        :rtype: float
+        """
+
+        return float(np.max(np.abs(self.values(list(self.solved), num, key))))
+
+    def deviation(self, num: int, key: str, values: np.ndarray, reference: np.ndarray) -> float:
+        """Method to calculate the largest deviation of values of an output channel from reference values relative to
+            the amplitude of the channel.
+
+        :param num: Index of the object.
+        :type num: int
+        :param key: Name of the measurement.
+        :type key: str
+        :param values: The values.
+        :type values: numpy.ndarray
+        :param reference: The reference values.
+        :type reference: numpy.ndarray
+
+        :return: The relative deviation.
+        :rtype: float
+        """
+
+        difference = float(np.max(np.abs(np.asarray(values, dtype=float) - np.asarray(reference, dtype=float))))
+        amplitude = self.amplitude(num, key)
+
+        return difference / amplitude if amplitude > 0 else difference
@@ -0,0 +1,264 @@
+import copy
+import numpy as np
+from typing import List, Tuple, Union
+
+from libs.elements.BoundingBox import BoundingBox
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.components.Gear import Gear
+from libs.elements.components.GearRack import GearRack
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.RodMagnet import RodMagnet
+from libs.elements.sensors.FieldRecorder import FieldRecorder
+from libs.elements.sensors.GMRSensor import GMRSensor
+from libs.elements.sensors.HallSensor import HallSensor
+
+from libs.DataHandler import DataHandler
+
+
+class SceneSizer:
+    """Proposes the simulation boundaries and the mesh sizes of a scenery from its geometry and estimates the size of
+        the resulting mesh. The boundaries enclose the bounding boxes of all components, magnets and sensors over the
+        trajectory plus a margin relative to their extent. The mesh sizes are graded from the sensors over the
+        components and magnets to the air: Sensors resolve the GMR element length or the air gap, components their
+        teeth, magnets their smallest dimension and the air a fraction of the box.
+
+        The element count is estimated from the volumes of the bodies and the grading layers around them, which grow
+        from the mesh size of a body to the one of the air with the grading of the meshing parameters. The constants
+        are fitted to meshes generated by NGMesh.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param boundaries: Proposed boundaries of the simulation.
+    :type boundaries: numpy.ndarray
+    :param maxh_global: Proposed mesh size of the air.
+    :type maxh_global: float
+    :param maxh: Proposed mesh sizes of the objects returned by objects().
+    :type maxh: List[float]
+    :param air_gap: Smallest distance between a sensor and a component or magnet. None if there is none.
+    :type air_gap: Union[float, None]
+    """
+
+    data_handler: DataHandler
+    boundaries: np.ndarray
+    maxh_global: float
+    maxh: List[float]
+    air_gap: Union[float, None]
+
+    # Margin around the bounding box of the scenery relative to its largest extent, for a closed box and with an open
+    # boundary shell (see CoordinateStretching).
+    margin_ratio = 0.5
+    shell_margin_ratio = 0.1
+    # Mesh size of the air relative to the largest extent of the box.
+    global_ratio = 0.125
+    # Volume of a tetrahedron relative to the cube of the mesh size, fitted to meshes generated by NGMesh.
+    element_volume = 0.2
+    # Grading of the mesh size away from finer regions (see NGMesh.mp).
+    grading = 0.3
+    # Degrees of freedom per tetrahedron of the order 3 spaces: HCurl without gradients and H1.
+    dofs_per_element = {"hcurl": 14.2, "h1": 4.5}
+
+    def __init__(self,
+                 data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.data_handler = data_handler
+        self.air_gap = self.gap()
+        self.boundaries = self.propose_boundaries()
+        self.maxh_global = self.global_ratio * float(np.max(self.boundaries[1] - self.boundaries[0]))
+        self.maxh = [min(self.feature_size(obj), self.maxh_global) for obj in self.objects()]
+
+    def objects(self) -> List[any]:
+        """Returns the objects of the scenery that are meshed with their own mesh size.
+
+        :return: Components, magnets, sensors and field recorders.
+        :rtype: List[any]
+        """
+
+        return self.data_handler.components() + self.data_handler.physical_magnets() + \
+            self.data_handler.physical_sensors() + self.data_handler.field_recorders()
+
+    def trajectory_boxes(self) -> List[np.ndarray]:
+        """Returns the bounding boxes of the objects enclosing their positions at all time stamps of the simulation.
+
+        :return: Lower and upper corner of each box.
+        :rtype: List[numpy.ndarray]
+        """
+
+        boxes: List[np.ndarray] = list()
+        for obj in self.objects():
+            if obj in self.data_handler.components():
+                obj = copy.deepcopy(obj)
+                positions = list()
+                for t in self.data_handler.sim_params().t:
+                    obj.update(t)
+                    positions.append(obj.bounding_box())
+                boxes.append(BoundingBox.union(positions))
+            else:
+                boxes.append(obj.bounding_box())
+
+        return boxes
+
+    def gap(self) -> Union[float, None]:
+        """Returns the smallest distance between the bounding boxes of a sensor and a component or magnet at the
+            start of the simulation.
+
+        :return: The air gap, None if there are no sensors or no other bodies apart from them.
+        :rtype: Union[float, None]
+        """
+
+        bodies = [obj.bounding_box() for obj in self.data_handler.components() + self.data_handler.physical_magnets()]
+        distances = [BoundingBox.distance(sensor.bounding_box(), body)
+                     for sensor in self.data_handler.physical_sensors() for body in bodies]
+        distances = [distance for distance in distances if distance > 0]
+
+        return min(distances) if distances else None
+
+    def propose_boundaries(self) -> np.ndarray:
+        """Returns the bounding box of the scenery over its trajectory, enlarged by the margin.
+
+        :return: Lower and upper corner of the simulation boundaries.
+        :rtype: numpy.ndarray
+        """
+
+        boxes = self.trajectory_boxes()
+        if not boxes:
+            return np.asarray(self.data_handler.sim_params().boundaries, dtype=float)
+
+        box = BoundingBox.union(boxes)
+        ratio = self.shell_margin_ratio if self.data_handler.sim_params().shell_thickness > 0 else self.margin_ratio
+
+        return box + np.array([-1.0, 1.0])[:, np.newaxis] * ratio * float(np.max(box[1] - box[0]))
+
+    def feature_size(self, obj: any) -> float:
+        """Returns the mesh size resolving the smallest feature of an object: the teeth of gears and gear racks, the
+            wall of shafts, the smallest dimension of magnets, the GMR elements or the body of Hall sensors limited by
+            the air gap, and the grid spacing of field recorders.
+
+        :param obj: Component, magnet, sensor or field recorder.
+        :type obj: any
+        :return: The mesh size.
+        :rtype: float
+        """
+
+        if isinstance(obj, Gear):
+            return max(obj.tooth_width, obj.tooth_height)
+        if isinstance(obj, EvoGear):
+            return obj.s
+        if isinstance(obj, GearRack):
+            return max(obj.tooth_width, obj.tooth_height) if obj.tooth_height > 0 else float(min(obj.dim)) / 2
+        if isinstance(obj, Shaft):
+            return float(obj.diameter[1] - obj.diameter[0]) / 2
+        if isinstance(obj, CuboidMagnet):
+            return float(min(obj.dim)) / 2
+        if isinstance(obj, RodMagnet):
+            return min(obj.radius, obj.length / 2)
+        if isinstance(obj, GMRSensor):
+            return min(obj.gmr_length, self.air_gap) if self.air_gap else obj.gmr_length
+        if isinstance(obj, HallSensor):
+            return min(float(max(obj.dim)) / 2, self.air_gap) if self.air_gap else float(max(obj.dim)) / 2
+        if isinstance(obj, FieldRecorder):
+            spacing = obj.h[obj.h > 0]
+            return float(spacing.min()) if spacing.size else obj.maxh
+
+        return obj.maxh
+
+    def regions(self, boundaries: np.ndarray, maxh_global: float,
+                maxh: List[float]) -> List[Tuple[np.ndarray, float, float]]:
+        """Returns the regions of the box that are meshed finer than the air, i.e. the bodies and the sampling points
+            the mesh size is restricted on. Netgen resolves the geometry regardless of the mesh size, so the surface
+            of a region is meshed at least with its feature size.
+
+        :param boundaries: Boundaries of the simulation.
+        :type boundaries: numpy.ndarray
+        :param maxh_global: Mesh size of the air.
+        :type maxh_global: float
+        :param maxh: Mesh sizes of the objects returned by objects().
+        :type maxh: List[float]
+        :return: Bounding box clipped at the boundaries, mesh size inside and at the surface of each region.
+        :rtype: List[Tuple[numpy.ndarray, float, float]]
+        """
+
+        regions: List[Tuple[np.ndarray, float, float]] = list()
+        for obj, h in zip(self.objects(), maxh):
+            box = np.array([np.maximum(obj.bounding_box()[0], boundaries[0]),
+                            np.minimum(obj.bounding_box()[1], boundaries[1])])
+            h = min(h, maxh_global)
+            surface = min(h, self.feature_size(obj))
+            if surface < maxh_global and np.all(box[1] >= box[0]):
+                regions.append((box, h, surface))
+
+        return regions
+
+    def estimate(self, boundaries: Union[np.ndarray, None] = None, maxh_global: Union[float, None] = None,
+                 maxh: Union[List[float], None] = None) -> Tuple[int, int]:
+        """Estimates the number of tetrahedra and degrees of freedom of the mesh. Without arguments, the current
+            settings of the scenery are estimated.
+
+        :param boundaries: Boundaries of the simulation.
+        :type boundaries: Union[numpy.ndarray, None]
+        :param maxh_global: Mesh size of the air.
+        :type maxh_global: Union[float, None]
+        :param maxh: Mesh sizes of the objects returned by objects().
+        :type maxh: Union[List[float], None]
+        :return: Number of elements and degrees of freedom of the formulation chosen by the simulation parameters.
+        :rtype: Tuple[int, int]
+        """
+
+        sim_params = self.data_handler.sim_params()
+        boundaries = np.asarray(sim_params.boundaries if boundaries is None else boundaries, dtype=float)
+        maxh_global = sim_params.maxh_global if maxh_global is None else maxh_global
+        maxh = [obj.maxh for obj in self.objects()] if maxh is None else maxh
+
+        shell = sim_params.shell_thickness
+        air = BoundingBox.volume(boundaries + np.array([[-shell], [shell]]))
+        elements = 0.0
+        for box, h, surface in self.regions(boundaries, maxh_global, maxh):
+            volume = BoundingBox.volume(box)
+            air -= volume
+            elements += volume / (self.element_volume * h ** 3)
+            # Grading layer: The mesh size grows linearly with the distance r from the surface of the region up to the
+            # one of the air or the boundaries.
+            half = (box[1] - box[0]) / 2
+            r = np.linspace(0.0, min((maxh_global - surface) / self.grading,
+                                     float(np.max(np.maximum(box[0] - boundaries[0], boundaries[1] - box[1])))), 100)
+            area = 8 * ((half[0] + r) * (half[1] + r) + (half[1] + r) * (half[2] + r) + (half[2] + r) * (half[0] + r))
+            layer = area / (self.element_volume * (surface + self.grading * r) ** 3)
+            elements += float(np.sum((layer[1:] + layer[:-1]) / 2 * np.diff(r)))
+        elements += max(air, 0.0) / (self.element_volume * maxh_global ** 3)
+
+        space = "h1" if sim_params.formulation == 2 else "hcurl"
+
+        return int(elements), int(elements * self.dofs_per_element[space])
+
+    def apply(self) -> None:
+        """Sets the proposed boundaries and mesh sizes in the scenery."""
+
+        self.data_handler.sim_params().boundaries = self.boundaries
+        self.data_handler.sim_params().maxh_global = self.maxh_global
+        for obj, h in zip(self.objects(), self.maxh):
+            obj.maxh = h
+
+    def report(self) -> str:
+        """Summarizes the current settings and the proposal with the estimated mesh sizes.
+
+        :return: The report.
+        :rtype: str
+        """
+
+        current = self.estimate()
+        proposed = self.estimate(self.boundaries, self.maxh_global, self.maxh)
+        sim_params = self.data_handler.sim_params()
+
+        lines = ["Boundaries: " + str(np.round(sim_params.boundaries, 3).tolist()) + " -> " +
+                 str(np.round(self.boundaries, 3).tolist()),
+                 "Global Mesh Size: " + str(round(sim_params.maxh_global, 4)) + " -> " +
+                 str(round(self.maxh_global, 4))]
+        for obj, h in zip(self.objects(), self.maxh):
+            lines.append(type(obj).__name__ + " Mesh Size: " + str(round(obj.maxh, 4)) + " -> " + str(round(h, 4)))
+        if self.air_gap is not None:
+            lines.append("Air Gap: " + str(round(self.air_gap, 4)))
+        lines.append("Estimated Elements: " + str(current[0]) + " -> " + str(proposed[0]))
+        lines.append("Estimated DOFs: " + str(current[1]) + " -> " + str(proposed[1]))
+
+        return "\n".join(lines)
@@ -1,12 +1,22 @@
-from tkinter.messagebox import showinfo, showerror
+from tkinter.messagebox import showinfo, showerror, askyesno
 from multiprocessing import Process, Queue, Manager
 from concurrent import futures
-from typing import List, Union
+from typing import Callable, Dict, List, Union
 import os
 import psutil
 from pathlib import Path
 
 from libs.simulation.MagneticFieldFactory import MagneticFieldFactory
+from libs.simulation.Telemetry import Telemetry
+from libs.simulation.SceneSizer import SceneSizer
+from libs.simulation.CostEstimator import CostEstimator
+from libs.simulation.ResultCache import ResultCache
+from libs.simulation.SnapshotStore import SnapshotStore
+from libs.simulation.FourierReconstruction import FourierReconstruction
+from libs.simulation.AdaptiveSampler import AdaptiveSampler
+from libs.simulation.Sampler import Sampler
+from libs.simulation.GeometryCheck import GeometryCheck
+from libs.simulation.FarFieldCheck import FarFieldCheck
 
 from libs.DataHandler import DataHandler
 from libs.ConfigHandler import ConfigHandler
@@ -24,33 +34,74 @@ class SimulationHandler:
         pass
 
     @staticmethod
-    def run_process(data_handler: DataHandler, max_memory: float, shared_list: Manager, queue: Queue) -> None:
+    def run_process(data_handler: DataHandler, max_memory: float, shared_list: Manager, queue: Queue,
+                    telemetry_list: Manager, cache_size: float = 0.0, snapshot_path: Union[Path, None] = None,
+                    times: Union[List[float], None] = None) -> None:
 
         n = queue.get()
 
-        field_factory = MagneticFieldFactory()
-        field = field_factory.init_field('ngsolve', data_handler)
-
-        temp_list = list([dict()] * len(data_handler.objects))
-
-        while n < data_handler.sim_params().samples and psutil.Process(
-                os.getpid()).memory_info().rss / 1024 ** 2 < max_memory:
+        cache = ResultCache(cache_size) if cache_size > 0 else None
+        store = SnapshotStore(snapshot_path) if snapshot_path is not None else None
 
-            t = data_handler.sim_params().t0 + n * data_handler.sim_params().dt
+        telemetry = Telemetry()
+        telemetry.step = n
 
-            for component in data_handler.components():
-                if hasattr(component, "update"):
-                    component.update(t)
+        with telemetry.stage("field initialization"):
+            field_factory = MagneticFieldFactory()
+            field = field_factory.init_field('ngsolve', data_handler, max_memory, telemetry, times)
 
-            field.create_field(data_handler, t)
-
-            for num, obj in enumerate(data_handler.objects):
-                if hasattr(obj, "set_data"):
-                    temp_list[num] = obj.set_data(temp_list[num].copy(), field)
-
-            n += 1
+        temp_list = list([dict()] * len(data_handler.objects))
 
-        shared_list.extend(temp_list)
+        steps = len(times) if times is not None else data_handler.sim_params().samples
+        # The upcoming meshes of the pipeline are not needed once the process ends.
+        try:
+            while n < steps and psutil.Process(os.getpid()).memory_info().rss / 1024 ** 2 < max_memory:
+
+                t = times[n] if times is not None else data_handler.sim_params().t0 + n * data_handler.sim_params().dt
+                telemetry.begin_step(n, t)
+
+                for component in data_handler.components():
+                    if hasattr(component, "update"):
+                        component.update(t)
+
+                key = ResultCache.key(data_handler) if cache is not None else None
+                # Steps taken from the cache have no field to store.
+                outputs = cache.load(key) if cache is not None and store is None else None
+                if outputs is not None:
+                    # Cache hit: the sampled outputs of the same physical state are appended without meshing and
+                    # solving.
+                    for num, step_dict in enumerate(outputs):
+                        temp_list[num] = {**temp_list[num], **{name: temp_list[num].get(name, list()) + values
+                                                               for name, values in step_dict.items()}}
+                    telemetry.record(cache_hit=1)
+                else:
+                    field.create_field(data_handler, t)
+
+                    if store is not None:
+                        with telemetry.stage("snapshot store"):
+                            store.save(n, t, field)
+
+                    lengths = [{name: len(values) for name, values in data_dict.items()} for data_dict in temp_list]
+                    for num, obj in enumerate(data_handler.objects):
+                        if hasattr(obj, "set_data"):
+                            with telemetry.stage("sampling " + type(obj).__name__ + str(num)):
+                                temp_list[num] = obj.set_data(temp_list[num].copy(), field)
+
+                    if cache is not None:
+                        with telemetry.stage("cache store"):
+                            cache.store(key, [{name: values[lengths[num].get(name, 0):]
+                                               for name, values in data_dict.items()}
+                                              for num, data_dict in enumerate(temp_list)])
+                        telemetry.record(cache_hit=0)
+
+                telemetry.end_step()
+                n += 1
+        finally:
+            field.close()
+
+        with telemetry.stage("ipc send"):
+            shared_list.extend(temp_list)
+        telemetry_list.append(telemetry.records())
         queue.put(n)
 
     @staticmethod
@@ -75,23 +126,66 @@ class SimulationHandler:
                 if hasattr(obj, "reset"):
                     obj.reset()
 
-            n = 0
-            measurement_data = list()
-            while n < data_handler.sim_params().samples:
-                with Manager() as manager:
-                    queue = Queue()
-                    queue.put(n)
-                    shared_list = manager.list()
-                    process = Process(target=multiprocessing_tasks.run_process,
-                                      args=(data_handler, config_handler.config['GENERAL']['max_process_memory'],
-                                            shared_list, queue))
-                    process.start()
-                    process.join()
-                    n = queue.get()
-                    measurement_data.append(list(shared_list))
-
+            problems = GeometryCheck.check(data_handler)
+            if problems and not askyesno(title="Geometry Check", message="\n".join(problems) + "\n\nRun anyway?"):
+                continue
+
+            if data_handler.sim_params().tooth_culling > 0 and config_handler.config['GENERAL']['check_tooth_culling']:
+                gui_handler.status_bar().set("Checking tooth culling...")
+                problems = FarFieldCheck.spawn_check(data_handler)
+                if problems and not askyesno(title="Tooth Culling", message="\n".join(problems) + "\n\nRun anyway?"):
+                    continue
+                gui_handler.status_bar().set("Working...")
+
+            cost_estimator = CostEstimator(data_handler)
+            if config_handler.config['GENERAL']['estimate_cost']:
+                gui_handler.status_bar().set("Estimating cost...")
+                estimate = cost_estimator.spawn_estimate()
+                if estimate is not None:
+                    report = cost_estimator.report(estimate, config_handler.config['GENERAL']['max_process_memory'])
+                    if not askyesno(title="Cost Estimate", message=report + "\n\nStart the simulation?"):
+                        continue
+                gui_handler.status_bar().set("Working...")
+
+            # The Fourier reconstruction and the adaptive sampling solve a subset of the time stamps or other angles.
+            sampler: Union[Sampler, None] = None
+            if data_handler.sim_params().fourier_harmonics > 0:
+                [valid, reason] = FourierReconstruction.validity(data_handler)
+                if valid:
+                    sampler = FourierReconstruction(data_handler)
+                else:
+                    print(reason + " Solving each sample instead of the Fourier reconstruction.")
+            if sampler is None and data_handler.sim_params().sampling_tol > 0:
+                sampler = AdaptiveSampler(data_handler)
+
+            # The stored steps are resampled as the time stamps of the simulation, they are not stored for a sampler.
+            snapshot_path = None
+            if config_handler.config['GENERAL']['store_snapshots'] and sampler is None:
+                snapshot_path = SnapshotStore.default_path(data_handler)
+                store = SnapshotStore(snapshot_path)
+                store.clear()
+                store.save_scene(data_handler)
+
+            def progress(n: int) -> None:
                 sim_tabs[num].progress_frame().refresh(data_handler, config_handler, gui_handler, n)
 
+            data_handler.telemetry = Telemetry()
+            if sampler is None:
+                measurement_data = SimulationHandler.run_steps(multiprocessing_tasks, data_handler, config_handler,
+                                                               progress, snapshot_path)
+            else:
+                times = sampler.next_times()
+                while times:
+                    sampler.add(times, SimulationHandler.split_steps(SimulationHandler.run_steps(
+                        multiprocessing_tasks, data_handler, config_handler, progress, times=times)))
+                    times = sampler.next_times()
+                measurement_data = [sampler.result()]
+                progress(data_handler.sim_params().samples)
+            print("Solved " + str(data_handler.telemetry.solves()) + " steps for " +
+                  str(data_handler.sim_params().samples) + " samples.")
+
+            cost_estimator.calibrate(data_handler.telemetry)
+
             for i, obj in enumerate(data_handler.objects):
                 if hasattr(obj, "get_data"):
                     for data in measurement_data:
@@ -108,6 +202,76 @@ class SimulationHandler:
         gui_handler.enable_gui_operation()
         gui_handler.status_bar().set("Finished")
 
+    @staticmethod
+    def run_steps(multiprocessing_tasks, data_handler: DataHandler, config_handler: ConfigHandler,
+                  progress: Callable[[int], None], snapshot_path: Union[Path, None] = None,
+                  times: Union[List[float], None] = None) -> List[List[Dict[str, list]]]:
+        """Method solves the time steps in worker processes. A new process continues with the remaining steps
+            whenever a process reaches the memory limit.
+
+        :param multiprocessing_tasks: Provides the run_process method started in the worker processes.
+        :type multiprocessing_tasks: any
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param config_handler: Object of the ConfigHandler class containing the configuration.
+        :type config_handler: ConfigHandler
+        :param progress: Called with the number of steps solved after each process.
+        :type progress: Callable[[int], None]
+        :param snapshot_path: Directory the solved fields are stored in. None if they are not stored.
+        :type snapshot_path: Union[Path, None]
+        :param times: Time stamps of the steps. None for the time stamps of the simulation parameters.
+        :type times: Union[List[float], None]
+
+        :return: Measurement data of each object for each process.
+        :rtype: List[List[Dict[str, list]]]
+        """
+
+        n = 0
+        steps = len(times) if times is not None else data_handler.sim_params().samples
+        measurement_data = list()
+        while n < steps:
+            with Manager() as manager:
+                queue = Queue()
+                queue.put(n)
+                shared_list = manager.list()
+                telemetry_list = manager.list()
+                process = Process(target=multiprocessing_tasks.run_process,
+                                  args=(data_handler, config_handler.config['GENERAL']['max_process_memory'],
+                                        shared_list, queue, telemetry_list,
+                                        config_handler.config['GENERAL']['result_cache_size'], snapshot_path, times))
+                data_handler.telemetry.step = n
+                with data_handler.telemetry.stage("worker process"):
+                    process.start()
+                    process.join()
+                n = queue.get()
+                with data_handler.telemetry.stage("ipc receive"):
+                    measurement_data.append(list(shared_list))
+                    for records in telemetry_list:
+                        data_handler.telemetry.merge(records)
+
+            progress(n)
+
+        return measurement_data
+
+    @staticmethod
+    def split_steps(measurement_data: List[List[Dict[str, list]]]) -> List[List[Dict[str, list]]]:
+        """Method splits the measurement data of the processes into the measurement data of each step.
+
+        :param measurement_data: Measurement data of each object for each process as returned by run_steps.
+        :type measurement_data: List[List[Dict[str, list]]]
+
+        :return: Measurement data of each object for each step.
+        :rtype: List[List[Dict[str, list]]]
+        """
+
+        steps = list()
+        for data in measurement_data:
+            count = max([len(values) for data_dict in data for values in data_dict.values()] + [0])
+            steps += [[{key: values[step:step + 1] for key, values in data_dict.items()} for data_dict in data]
+                      for step in range(count)]
+
+        return steps
+
     @staticmethod
     def run(multiprocessing_tasks, data_stack: List[DataHandler], config_handler: ConfigHandler,
             gui_handler: GUIHandler, idx: Union[int, None] = None) -> Union[None, futures.Future]:
@@ -125,6 +289,8 @@ class SimulationHandler:
 
         import netgen.gui
 
+        # Only the field at the start is drawn, no upcoming meshes.
+        data_handler.sim_params().mesh_pipeline = 0
         field_factory = MagneticFieldFactory()
         field = field_factory.init_field('ngsolve', data_handler)
         field.create_field(data_handler, data_handler.sim_params().t0)
@@ -160,3 +326,21 @@ class SimulationHandler:
         else:
             showerror(title="Error", message="No data to draw.")
             return
+
+    @staticmethod
+    def size_scene(data_stack: List[DataHandler], config_handler: ConfigHandler, gui_handler: GUIHandler,
+                   idx: int) -> None:
+        """Method updates the data handler with the entries in the gui, proposes boundaries and mesh sizes for the
+            scenery and applies them if the user accepts the estimated mesh size"""
+
+        if not data_stack:
+            showerror(title="Error", message="No data to size.")
+            return
+
+        data_handler = data_stack[idx]
+        data_handler.update_objects(gui_handler.tabs[idx].frames)
+
+        scene_sizer = SceneSizer(data_handler)
+        if askyesno(title="Size Scene", message=scene_sizer.report() + "\n\nApply the proposed sizes?"):
+            scene_sizer.apply()
+            gui_handler.tabs[idx].refresh_frames(data_handler, config_handler, gui_handler)
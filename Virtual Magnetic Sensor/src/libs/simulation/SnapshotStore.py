@@ -0,0 +1,282 @@
+import multiprocessing
+import os
+import pickle
+import numpy as np
+import netgen.meshing as msh
+from concurrent import futures
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from libs.simulation.MagneticFieldFactory import MagneticFieldFactory
+from libs.simulation.ngsolve.NGField import NGField
+
+from libs.DataHandler import DataHandler
+from libs.ConfigHandler import ConfigHandler
+
+
+class SnapshotStore:
+    """Stores the solved fields of the simulation steps on disk, so sensors can be sampled again without solving, e.g.
+        after adding a field recorder, moving a sensor that does not restrict the mesh or changing the characteristic
+        curve of the GMR sensors. A step is stored by the coefficient vector of its potential and its mesh. Meshes are
+        stored once per topology: While the mesh is only moved with the components, the steps store the coordinates
+        of its points instead.
+
+        The scenery of the run is stored along with the steps. The fields are restored for this scenery, the sensors
+        sampling them are taken from the scenery passed to resample.
+
+    :param path: Directory of the stored steps.
+    :type path: Path
+    :param meshes: Name, element nodes and point coordinates of the mesh stored last for the field and each submodel.
+    :type meshes: List[Tuple[str, Tuple[numpy.ndarray, numpy.ndarray], numpy.ndarray]]
+    """
+
+    path: Path
+    meshes: List[Tuple[str, Tuple[np.ndarray, np.ndarray], np.ndarray]]
+
+    def __init__(self, path: Path) -> None:
+        """Constructor method."""
+
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.meshes = list()
+
+    @staticmethod
+    def default_path(data_handler: DataHandler) -> Path:
+        """Method to return the directory of the stored steps next to the save file of the scenery. A scenery not
+            saved yet has no save file, its steps are stored in the configuration directory instead.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: The directory.
+        :rtype: Path
+        """
+
+        if not data_handler.filepath.stem:
+            return ConfigHandler.get_config_path("snapshots")
+
+        return data_handler.filepath.parent / (data_handler.filepath.stem + "_snapshots")
+
+    def clear(self) -> None:
+        """Method to remove the stored scenery and steps of a previous run."""
+
+        for filepath in self.path.glob("*.pkl"):
+            filepath.unlink()
+        self.meshes = list()
+
+    def steps(self) -> List[int]:
+        """Method to list the stored steps.
+
+        :return: Indices of the stored steps in ascending order.
+        :rtype: List[int]
+        """
+
+        return sorted(int(filepath.stem[4:]) for filepath in self.path.glob("step*.pkl"))
+
+    def save_scene(self, data_handler: DataHandler) -> bool:
+        """Method to store the scenery the steps are simulated for.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: True when the scenery was written, false otherwise.
+        :rtype: bool
+        """
+
+        return self.dump(self.path / "scene.pkl", data_handler)
+
+    def load_scene(self) -> Union[DataHandler, None]:
+        """Method to load the scenery the steps are simulated for.
+
+        :return: The scenery. None if no scenery is stored.
+        :rtype: Union[DataHandler, None]
+        """
+
+        return self.load(self.path / "scene.pkl")
+
+    def save(self, step: int, t: float, field: NGField) -> bool:
+        """Method to store the solved field of a step. The mesh is written if its topology differs from the mesh
+            stored last, otherwise the coordinates of its points are stored with the step if they moved.
+
+        :param step: Index of the step.
+        :type step: int
+        :param t: Time stamp of the step.
+        :type t: float
+        :param field: Solved field of the step.
+        :type field: NGField
+        :return: True when the step was written, false otherwise.
+        :rtype: bool
+        """
+
+        snapshot: Dict[str, any] = {'t': t, 'fields': list()}
+        for num, (netgen_mesh, vector, symmetry) in enumerate(field.snapshot()):
+            topology = (netgen_mesh.Elements3D().NumPy()['nodes'], netgen_mesh.Elements2D().NumPy()['nodes'])
+            points = netgen_mesh.Coordinates()
+            if num < len(self.meshes) and self.same_topology(topology, self.meshes[num][1]):
+                name = self.meshes[num][0]
+                moved = None if np.array_equal(points, self.meshes[num][2]) else points.copy()
+            else:
+                name = "mesh" + str(step) + "_" + str(num)
+                if not self.dump(self.path / (name + ".pkl"), netgen_mesh):
+                    return False
+                self.meshes[num:num + 1] = [(name, (topology[0].copy(), topology[1].copy()), points.copy())]
+                moved = None
+            snapshot['fields'].append({'mesh': name, 'points': moved, 'vector': vector, 'symmetry': symmetry})
+
+        return self.dump(self.path / ("step" + str(step) + ".pkl"), snapshot)
+
+    @staticmethod
+    def same_topology(topology: Tuple[np.ndarray, np.ndarray], other: Tuple[np.ndarray, np.ndarray]) -> bool:
+        """Method to compare the volume and surface elements of two meshes.
+
+        :param topology: Nodes of the volume and surface elements of a mesh.
+        :type topology: Tuple[numpy.ndarray, numpy.ndarray]
+        :param other: Nodes of the volume and surface elements of another mesh.
+        :type other: Tuple[numpy.ndarray, numpy.ndarray]
+        :return: True if the elements are equal.
+        :rtype: bool
+        """
+
+        return all(np.array_equal(nodes, other_nodes) for nodes, other_nodes in zip(topology, other))
+
+    def restore(self, field: NGField, scene: DataHandler, step: int,
+                meshes: Dict[str, Tuple[msh.Mesh, np.ndarray]]) -> Union[float, None]:
+        """Method to set a field to a stored step.
+
+        :param field: Field created for the stored scenery.
+        :type field: NGField
+        :param scene: The stored scenery.
+        :type scene: DataHandler
+        :param step: Index of the step.
+        :type step: int
+        :param meshes: Meshes loaded so far with the coordinates of their points as stored, extended by the meshes of
+            the step.
+        :type meshes: Dict[str, Tuple[netgen.meshing.Mesh, numpy.ndarray]]
+        :return: Time stamp of the step. None if the step could not be loaded.
+        :rtype: Union[float, None]
+        """
+
+        snapshot = self.load(self.path / ("step" + str(step) + ".pkl"))
+        if snapshot is None:
+            return None
+
+        states = list()
+        for entry in snapshot['fields']:
+            if entry['mesh'] not in meshes:
+                netgen_mesh = self.load(self.path / (entry['mesh'] + ".pkl"))
+                if netgen_mesh is None:
+                    return None
+                meshes[entry['mesh']] = (netgen_mesh, netgen_mesh.Coordinates().copy())
+            [netgen_mesh, points] = meshes[entry['mesh']]
+            netgen_mesh.Coordinates()[:] = entry['points'] if entry['points'] is not None else points
+            states.append((netgen_mesh, entry['vector'], entry['symmetry']))
+        field.restore(scene, states)
+
+        return snapshot['t']
+
+    @staticmethod
+    def sample(path: Path, data_handler: DataHandler, steps: List[int]) -> Union[List[Dict[str, list]], None]:
+        """Method to sample the stored fields of consecutive steps with the sensors of a scenery. Called in a separate
+            process by resample.
+
+        :param path: Directory of the stored steps.
+        :type path: Path
+        :param data_handler: Scenery with the sensors.
+        :type data_handler: DataHandler
+        :param steps: Indices of the steps.
+        :type steps: List[int]
+        :return: Measurement data of each object. None if a step could not be loaded.
+        :rtype: Union[List[Dict[str, list]], None]
+        """
+
+        store = SnapshotStore(path)
+        scene = store.load_scene()
+        if scene is None:
+            return None
+        # The field is only restored, upcoming meshes are not needed.
+        scene.sim_params().mesh_pipeline = 0
+        field = MagneticFieldFactory.init_field('ngsolve', scene)
+
+        meshes: Dict[str, Tuple[msh.Mesh, np.ndarray]] = dict()
+        data: List[Dict[str, list]] = [dict() for _ in data_handler.objects]
+        for step in steps:
+            if store.restore(field, scene, step, meshes) is None:
+                return None
+            for num, obj in enumerate(data_handler.objects):
+                if hasattr(obj, "set_data"):
+                    data[num] = obj.set_data(data[num], field)
+
+        return data
+
+    def resample(self, data_handler: DataHandler, workers: Union[int, None] = None) -> bool:
+        """Method to sample the stored fields of all steps with the sensors of a scenery and to pass the measurement
+            data to the sensors like a simulation run. The steps are split into consecutive chunks sampled in parallel,
+            so each process loads the meshes of its chunk once.
+
+        :param data_handler: Scenery with the sensors, e.g. the stored one with changed or additional sensors.
+        :type data_handler: DataHandler
+        :param workers: Number of processes. Defaults to the number of CPUs.
+        :type workers: Union[int, None]
+        :return: True when all steps were sampled, false otherwise.
+        :rtype: bool
+        """
+
+        steps = self.steps()
+        if not steps:
+            print("No stored steps in " + str(self.path) + ".")
+            return False
+
+        for obj in data_handler.objects:
+            if hasattr(obj, "reset"):
+                obj.reset()
+
+        chunks = [chunk.tolist() for chunk in np.array_split(steps, min(workers or os.cpu_count() or 1, len(steps)))]
+        # Forking the threads of the Ngsolve task manager is unsafe, the processes are spawned instead.
+        with futures.ProcessPoolExecutor(max_workers=len(chunks),
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(SnapshotStore.sample, [self.path] * len(chunks), [data_handler] * len(chunks),
+                                        chunks))
+
+        if any(result is None for result in results):
+            print("Stored steps in " + str(self.path) + " could not be loaded.")
+            return False
+
+        for num, obj in enumerate(data_handler.objects):
+            if hasattr(obj, "get_data"):
+                for data in results:
+                    obj.get_data(**data[num])
+
+        return True
+
+    @staticmethod
+    def dump(filepath: Path, item: any) -> bool:
+        """Method to write an item to a file.
+
+        :param filepath: Path of the file.
+        :type filepath: Path
+        :param item: Item to write.
+        :type item: any
+        :return: True when the item was written, false otherwise.
+        :rtype: bool
+        """
+
+        try:
+            with open(filepath, 'wb') as file:
+                pickle.dump(item, file)
+            return True
+        except IOError:
+            return False
+
+    @staticmethod
+    def load(filepath: Path) -> any:
+        """Method to read an item from a file.
+
+        :param filepath: Path of the file.
+        :type filepath: Path
+        :return: The item. None if the file could not be read.
+        :rtype: any
+        """
+
+        try:
+            with open(filepath, 'rb') as file:
+                return pickle.load(file)
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
@@ -0,0 +1,216 @@
+from __future__ import annotations
+from contextlib import contextmanager
+import json
+import os
+import sys
+import time
+import numpy as np
+import psutil
+from pathlib import Path
+from typing import List, Dict, Iterator
+
+
+class Telemetry:
+    """Collects the durations of the simulation stages and per step statistics of the solver. Each worker process
+        fills its own instance, the records are merged in the main process and stored with the results.
+
+    :param events: Timed stages with name, start time in s since epoch, duration in s, time step index and process id.
+    :type events: List[Dict[str, any]]
+    :param steps: Statistics of each time step, e.g. time stamp, number of dofs, solver iterations, memory usage and
+        peak memory usage.
+    :type steps: List[Dict[str, any]]
+    :param step: Index of the time step currently processed, -1 before the first step.
+    :type step: int
+    """
+
+    events: List[Dict[str, any]]
+    steps: List[Dict[str, any]]
+    step: int
+
+    def __init__(self) -> None:
+        """Constructor method."""
+
+        self.events = list()
+        self.steps = list()
+        self.step = -1
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Context manager timing the enclosed code as stage of the current time step.
+
+        :param name: Name of the stage.
+        :type name: str
+        """
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.events.append({'name': name, 'start': start, 'duration': time.time() - start, 'step': self.step,
+                                'pid': os.getpid()})
+
+    def begin_step(self, step: int, t: float) -> None:
+        """Starts the statistics of a new time step.
+
+        :param step: Index of the time step.
+        :type step: int
+        :param t: Time stamp of the step.
+        :type t: float
+        """
+
+        self.step = step
+        self.steps.append({'step': step, 't': t, 'start': time.time()})
+
+    def record(self, **values: float) -> None:
+        """Adds values to the statistics of the current time step."""
+
+        if self.steps:
+            self.steps[-1].update(values)
+
+    def end_step(self) -> None:
+        """Completes the statistics of the current time step by its duration, the memory used by the process and the
+            peak memory used by the process so far."""
+
+        self.record(duration=time.time() - self.steps[-1]['start'],
+                    rss=psutil.Process(os.getpid()).memory_info().rss / 1024 ** 2,
+                    peak_rss=self.peak_rss())
+
+    @staticmethod
+    def peak_rss() -> float:
+        """Returns the peak resident memory of the process since its start. Its increase over a time step shows the
+            memory the step needed beyond the previous steps.
+
+        :return: Peak resident memory in MB.
+        :rtype: float
+        """
+
+        memory = psutil.Process(os.getpid()).memory_info()
+        if hasattr(memory, 'peak_wset'):
+            return memory.peak_wset / 1024 ** 2
+
+        # The resource module is not available on Windows, where psutil reports the peak.
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # Linux reports kB, macOS bytes. Linux updates the peak lazily, it may lag behind the current memory.
+        return max(peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024, memory.rss / 1024 ** 2)
+
+    def solves(self) -> int:
+        """Returns the number of time steps whose field was solved, i.e. the steps not taken from the result cache.
+
+        :return: Number of solved steps.
+        :rtype: int
+        """
+
+        return len([step for step in self.steps if step.get('cache_hit', 0) != 1])
+
+    def records(self) -> Dict[str, List[Dict[str, any]]]:
+        """Returns the collected data in a form that can be passed between processes.
+
+        :return: Events and step statistics.
+        :rtype: Dict[str, List[Dict[str, any]]]
+        """
+
+        return {'events': self.events, 'steps': self.steps}
+
+    def merge(self, records: Dict[str, List[Dict[str, any]]]) -> None:
+        """Appends the data collected by another instance, e.g. in a worker process.
+
+        :param records: Events and step statistics as returned by the records method.
+        :type records: Dict[str, List[Dict[str, any]]]
+        """
+
+        self.events.extend(records['events'])
+        self.steps.extend(records['steps'])
+
+    def to_dict(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Method creates a dictionary of arrays that will be stored in the HDF5 file. Statistics missing in a step
+            are stored as NaN.
+
+        :return: The dictionary of the events and step statistics.
+        :rtype: Dict[str, Dict[str, np.ndarray]]
+        """
+
+        events: Dict[str, np.ndarray] = dict()
+        if self.events:
+            events['name'] = np.array([event['name'].encode() for event in self.events])
+            for key in ['start', 'duration', 'step', 'pid']:
+                events[key] = np.array([event[key] for event in self.events])
+
+        steps: Dict[str, np.ndarray] = dict()
+        for step in self.steps:
+            for key in step:
+                if key not in steps:
+                    steps[key] = np.array([entry.get(key, np.nan) for entry in self.steps], dtype=float)
+
+        return {'events': events, 'steps': steps}
+
+    @classmethod
+    def from_dict(cls, dictionary: Dict[str, Dict[str, np.ndarray]]) -> Telemetry:
+        """Method to init an instance of the Telemetry class by passing a dictionary as created by the to_dict method.
+
+        :return: Instance of the Telemetry class.
+        :rtype: Telemetry
+        """
+
+        telemetry = cls()
+        events = dictionary.get('events', dict())
+        for idx, name in enumerate(events.get('name', list())):
+            telemetry.events.append({'name': name.decode() if isinstance(name, bytes) else str(name),
+                                     'start': float(events['start'][idx]),
+                                     'duration': float(events['duration'][idx]),
+                                     'step': int(events['step'][idx]),
+                                     'pid': int(events['pid'][idx])})
+        steps = dictionary.get('steps', dict())
+        for idx in range(len(steps.get('step', list()))):
+            telemetry.steps.append({key: float(value[idx]) for key, value in steps.items()
+                                    if not np.isnan(value[idx])})
+
+        return telemetry
+
+    def chrome_trace(self) -> Dict[str, List[Dict[str, any]]]:
+        """Converts the collected data to the Chrome trace event format, viewable in chrome://tracing or Perfetto.
+            Stages become complete events per process, the step statistics become counter tracks.
+
+        :return: Trace in the Chrome trace event format.
+        :rtype: Dict[str, List[Dict[str, any]]]
+        """
+
+        starts = [event['start'] for event in self.events] + [step['start'] for step in self.steps if 'start' in step]
+        t_ref = min(starts, default=0.0)
+
+        trace_events: List[Dict[str, any]] = list()
+        for event in self.events:
+            trace_events.append({'name': event['name'], 'cat': 'stage', 'ph': 'X',
+                                 'ts': (event['start'] - t_ref) * 1e6, 'dur': event['duration'] * 1e6,
+                                 'pid': event['pid'], 'tid': 0, 'args': {'step': event['step']}})
+        for step in self.steps:
+            if 'start' not in step:
+                continue
+            for key, value in step.items():
+                if key not in ['step', 't', 'start', 'duration']:
+                    trace_events.append({'name': key, 'ph': 'C', 'ts': (step['start'] - t_ref) * 1e6, 'pid': 0,
+                                         'args': {key: value}})
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def save_trace(self, path: Path) -> bool:
+        """Writes the collected data as Chrome trace JSON file.
+
+        :param path: Path to the file.
+        :type path: Path
+
+        :return: True when the process is successful, false otherwise.
+        :rtype: bool
+        """
+
+        try:
+            if not os.path.exists(path.parent):
+                os.makedirs(path.parent)
+
+            with open(path, 'w') as file:
+                json.dump(self.chrome_trace(), file)
+
+            return True
+        except IOError:
+            return False
@@ -0,0 +1,166 @@
+import netgen.geom2d as geom2d
+import numpy as np
+from typing import Dict, List, Tuple
+
+from libs.DataHandler import DataHandler
+
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.RodMagnet import RodMagnet
+
+
+class AxisymmetricGeometry:
+    """Generates the 2D geometry of the meridian half plane of a rotationally symmetric scenery with
+        netgen.geom2d.CSG2d elements. The first coordinate is the distance r from the common axis of the rod magnets
+        and shafts, the second one the position s along the axis. The domain is the smallest cylinder about the axis
+        that contains the simulation boundaries, so every point of the 3D scenery has a counterpart in the half plane.
+        Only rod magnets and shafts sharing the same axis are supported, see NGAxisymmetricField.validity.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    """
+
+    materials: Dict[str, str]
+    origin: np.ndarray
+    direction: np.ndarray
+    geometry: geom2d.CSG2d
+
+    def __init__(self,
+                 data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.materials = {
+            "component": "iron",
+            "magnet": "magnet",
+            "outer": "air"
+        }
+
+        [self.origin, self.direction] = self.axis(data_handler)
+        self.geometry = self.init_geometry(data_handler)
+
+    @staticmethod
+    def axis(data_handler: DataHandler) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the axis of the first rod magnet or shaft of the scenery.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: A point on the axis and the unit direction of the axis. None if there are neither rod magnets nor
+            shafts.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        for obj in data_handler.physical_magnets() + data_handler.components():
+            if isinstance(obj, (RodMagnet, Shaft)):
+                direction = np.asarray(obj.axis, dtype=float)
+                return np.asarray(obj.pos, dtype=float), direction / np.linalg.norm(direction)
+
+        return None, None
+
+    @staticmethod
+    def cylindrical(points: np.ndarray, origin: np.ndarray, direction: np.ndarray) -> Tuple[np.ndarray, np.ndarray,
+                                                                                           np.ndarray]:
+        """Maps 3D points to cylindrical coordinates about the axis.
+
+        :param points: Array of shape (n, 3) with the points.
+        :type points: numpy.ndarray
+        :param origin: A point on the axis.
+        :type origin: numpy.ndarray
+        :param direction: Unit direction of the axis.
+        :type direction: numpy.ndarray
+        :return: Distance r from the axis, position s along the axis and the radial unit vectors of shape (n, 3). The
+            radial unit vector of points on the axis is zero.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+
+        relative = points - origin
+        s = relative.dot(direction)
+        radial = relative - np.outer(s, direction)
+        r = np.linalg.norm(radial, axis=1)
+        e_r = np.zeros_like(radial)
+        off_axis = r > 1e-12 * max(1.0, np.abs(relative).max(initial=0.0))
+        e_r[off_axis] = radial[off_axis] / r[off_axis, np.newaxis]
+
+        return r, s, e_r
+
+    @staticmethod
+    def extent(data_handler: DataHandler, origin: np.ndarray, direction: np.ndarray) -> np.ndarray:
+        """Returns the smallest cylinder about the axis containing all corners of the simulation boundaries.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param origin: A point on the axis.
+        :type origin: numpy.ndarray
+        :param direction: Unit direction of the axis.
+        :type direction: numpy.ndarray
+        :return: Lower and upper corner of the cylinder in the half plane, i.e. [[0, s_min], [r_max, s_max]].
+        :rtype: numpy.ndarray
+        """
+
+        boundaries = np.asarray(data_handler.sim_params().boundaries, dtype=float)
+        corners = np.array([[x, y, z] for x in boundaries[:, 0] for y in boundaries[:, 1] for z in boundaries[:, 2]])
+        [r, s, _] = AxisymmetricGeometry.cylindrical(corners, origin, direction)
+
+        return np.array([[0.0, s.min()], [r.max(), s.max()]])
+
+    def init_geometry(self, data_handler: DataHandler) -> geom2d.CSG2d:
+        """Creates the overall 2D geometry of all elements of the simulation.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Geometry of the meridian half plane of the scenery.
+        :rtype: netgen.geom2d.CSG2d
+        """
+
+        geometry: geom2d.CSG2d = geom2d.CSG2d()
+        bodies_list: List[geom2d.Solid2d] = list()
+
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            magnet_body = self.rectangle(magnet.pos, 0.0, magnet.radius, magnet.length)
+            for body in bodies_list:
+                magnet_body = magnet_body - body
+            bodies_list.append(magnet_body)
+            geometry.Add(magnet_body.Mat(self.materials["magnet"] + str(num)).Maxh(magnet.maxh))
+
+        for num, component in enumerate(data_handler.components()):
+            component_body = self.rectangle(component.pos, component.diameter[0] / 2, component.diameter[1] / 2,
+                                            component.length)
+            for body in bodies_list:
+                component_body = component_body - body
+            bodies_list.append(component_body)
+            geometry.Add(component_body.Mat(self.materials["component"] + str(num)).Maxh(component.maxh))
+
+        extent = self.extent(data_handler, self.origin, self.direction)
+        shell = data_handler.sim_params().shell_thickness
+        outer_body = geom2d.Rectangle(pmin=tuple(extent[0]), pmax=tuple(extent[1]),
+                                      bc="shell" if shell > 0 else "outer", left="axis")
+        if shell > 0:
+            # The open boundary shell is a separate domain around the cylinder except at the axis.
+            shell_body = geom2d.Rectangle(pmin=(0.0, extent[0][1] - shell),
+                                          pmax=(extent[1][0] + shell, extent[1][1] + shell), bc="outer",
+                                          left="axis") - outer_body
+            for body in bodies_list:
+                shell_body = shell_body - body
+            geometry.Add(shell_body.Mat(self.materials["outer"]).Maxh(data_handler.sim_params().maxh_global))
+        for body in bodies_list:
+            outer_body = outer_body - body
+        geometry.Add(outer_body.Mat(self.materials["outer"]).Maxh(data_handler.sim_params().maxh_global))
+
+        return geometry
+
+    def rectangle(self, pos: np.ndarray, r_min: float, r_max: float, length: float) -> geom2d.Solid2d:
+        """Builds the cross-section of a cylinder or tube centered at pos in the half plane.
+
+        :param pos: Center of the cylinder on the axis.
+        :type pos: numpy.ndarray
+        :param r_min: Inner radius, 0 for a solid cylinder.
+        :type r_min: float
+        :param r_max: Outer radius.
+        :type r_max: float
+        :param length: Length of the cylinder along the axis.
+        :type length: float
+        :return: Cross-section geometry.
+        :rtype: netgen.geom2d.Solid2d
+        """
+
+        s = (np.asarray(pos, dtype=float) - self.origin).dot(self.direction)
+
+        return geom2d.Rectangle(pmin=(r_min, s - length / 2), pmax=(r_max, s + length / 2))
@@ -1,5 +1,5 @@
 import netgen.csg as csg
-from typing import List
+from typing import List, Union
 
 from libs.elements.Component import Component
 
@@ -12,6 +12,7 @@ from libs.simulation.ngsolve.CSGeometries.CSGGear import CSGGear
 from libs.simulation.ngsolve.CSGeometries.CSGEvoGear import CSGEvoGear
 from libs.simulation.ngsolve.CSGeometries.CSGShaft import CSGShaft
 from libs.simulation.ngsolve.CSGeometries.CSGGearRack import CSGGearRack
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
 
 
 class CSGComponents:
@@ -20,39 +21,46 @@ class CSGComponents:
 
     :param components: List of components parameters.
     :type components: List[Component]
+    :param culling: Selection of the teeth built for gears and gear racks. None builds all teeth.
+    :type culling: Union[ToothCulling, None]
     """
 
     components: List[Component]
+    culling: Union[ToothCulling, None]
     bodies: List[csg.Solid]
 
     def __init__(self,
-                 components: List[Component]) -> None:
+                 components: List[Component],
+                 culling: Union[ToothCulling, None] = None) -> None:
         """Constructor method."""
 
         self.components = components
+        self.culling = culling
         self.bodies: List[csg.Solid] = list()
         for component in self.components:
-            self.bodies.append(self.build_component_body(component))
+            self.bodies.append(self.build_component_body(component, self.culling))
 
     @staticmethod
-    def build_component_body(component: Component) -> csg.Solid:
+    def build_component_body(component: Component, culling: Union[ToothCulling, None] = None) -> csg.Solid:
         """Method to generate the geometry of a component with the parameters specified in the committed component
             object.
 
         :param component: Component parameters.
         :type component: Component
+        :param culling: Selection of the teeth built for gears and gear racks. None builds all teeth.
+        :type culling: Union[ToothCulling, None]
         :return: Component geometry.
         :rtype: netgen.csg.Solid
         """
 
         component_geometry = csg.Solid
         if isinstance(component, Gear):
-            component_geometry = CSGGear(component)
+            component_geometry = CSGGear(component, culling)
         elif isinstance(component, EvoGear):
-            component_geometry = CSGEvoGear(component)
+            component_geometry = CSGEvoGear(component, culling)
         elif isinstance(component, Shaft):
             component_geometry = CSGShaft(component)
         elif isinstance(component, GearRack):
-            component_geometry = CSGGearRack(component)
+            component_geometry = CSGGearRack(component, culling)
 
         return component_geometry.body
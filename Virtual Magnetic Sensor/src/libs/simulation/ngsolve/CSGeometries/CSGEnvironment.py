@@ -1,6 +1,9 @@
 import netgen.csg as csg
+import numpy as np
+from typing import List, Union
 
 from libs.elements.SimParams import SimParams
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
 
 
 class CSGEnvironment:
@@ -8,17 +11,26 @@ class CSGEnvironment:
 
     :param sim_params: Object of the SimParams class.
     :type sim_params: SimParams
+    :param symmetry: Symmetry planes the box is clipped at.
+    :type symmetry: List[SymmetryPlane]
+    :param shell: Open boundary shell around the simulation boundaries, None if the shell thickness is 0.
+    :type shell: Union[netgen.csg.Solid, None]
     """
 
     sim_params: SimParams
+    symmetry: List[SymmetryPlane]
     body: csg.Solid
+    shell: Union[csg.Solid, None]
 
     def __init__(self,
-                 sim_params: SimParams) -> None:
+                 sim_params: SimParams,
+                 symmetry: List[SymmetryPlane] = None) -> None:
         """Constructor method."""
 
         self.sim_params = sim_params
+        self.symmetry = symmetry if symmetry is not None else list()
         self.body = self.build_body()
+        self.shell = self.build_shell()
 
     def build_body(self) -> csg.Solid:
         """Builds the body of the bounding environment of the scenery.
@@ -27,7 +39,47 @@ class CSGEnvironment:
         :rtype: tuple
         """
 
-        body: csg.Solid = csg.OrthoBrick(csg.Pnt(self.sim_params.boundaries[0]),
-                                         csg.Pnt(self.sim_params.boundaries[1])).bc("outer")
+        return self.clip(self.brick(0.0, "shell" if self.sim_params.shell_thickness > 0 else "outer"))
+
+    def build_shell(self) -> Union[csg.Solid, None]:
+        """Builds the open boundary shell around the bounding environment. The shell is a separate domain, so the
+            boundaries of the coordinate stretching coincide with faces of the mesh.
+
+        :return: Geometry of the shell, None if the shell thickness is 0.
+        :rtype: Union[netgen.csg.Solid, None]
+        """
+
+        if self.sim_params.shell_thickness <= 0:
+            return None
+
+        return self.clip(self.brick(self.sim_params.shell_thickness, "outer")) - self.body
+
+    def brick(self, margin: float, bc: str) -> csg.Solid:
+        """Builds the simulation box enlarged by a margin on each side.
+
+        :param margin: Margin added on each side.
+        :type margin: float
+        :param bc: Name of the boundary condition on the faces.
+        :type bc: str
+        :return: Geometry of the box.
+        :rtype: netgen.csg.Solid
+        """
+
+        return csg.OrthoBrick(csg.Pnt(np.array(self.sim_params.boundaries[0], dtype=float) - margin),
+                              csg.Pnt(np.array(self.sim_params.boundaries[1], dtype=float) + margin)).bc(bc)
+
+    def clip(self, body: csg.Solid) -> csg.Solid:
+        """Clips a body at the symmetry planes.
+
+        :param body: Geometry to clip.
+        :type body: netgen.csg.Solid
+        :return: Part of the geometry on the kept side of all symmetry planes.
+        :rtype: netgen.csg.Solid
+        """
+
+        for plane in self.symmetry:
+            support = np.array(self.sim_params.boundaries[0], dtype=float)
+            support[plane.axis] = plane.offset
+            body *= csg.Plane(csg.Pnt(support), csg.Vec(plane.normal)).bc(plane.bc)
 
         return body
@@ -1,7 +1,10 @@
 import netgen.csg as csg
 import numpy as np
+from typing import Union
 
+from libs.elements.BoundingBox import BoundingBox
 from libs.elements.components.EvoGear import EvoGear
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
 
 
 class CSGEvoGear:
@@ -24,6 +27,9 @@ class CSGEvoGear:
     
     :param involute_points: n Points to calculate the involute function n=7 is sufficiant
     :type involute_points: int
+
+    :param culling: Selection of the teeth built. None builds all teeth.
+    :type culling: Union[ToothCulling, None]
     """
     
     EvoTooth_ini: EvoGear #ini/calc data
@@ -32,11 +38,13 @@ class CSGEvoGear:
     segs_2d: list 
     delta_alpha: float
     involute_points: int
+    culling: Union[ToothCulling, None]
     
-    def __init__(self, EvoTooth_ini: EvoGear) -> None:
+    def __init__(self, EvoTooth_ini: EvoGear, culling: Union[ToothCulling, None] = None) -> None:
         """Constructor method."""
 
         self.EvoTooth_ini = EvoTooth_ini
+        self.culling = culling
         self.delta_alpha = 2*self.EvoTooth_ini.m*np.pi*np.cos(self.EvoTooth_ini.alpha)/self.EvoTooth_ini.d_b
         self.body = self.build_evogear(EvoTooth_ini.involute_points)
         
@@ -56,8 +64,11 @@ class CSGEvoGear:
         back = csg.Plane(csg.Pnt(0, 0, (-1)*self.EvoTooth_ini.length), csg.Vec(0, 0, -1))
         front = csg.Plane(csg.Pnt(0, 0, 0), csg.Vec(0, 0, 1))
 
+        #One extrusion per tooth: Netgen reduces the geometry to the teeth within each box of the mesh generation, a
+        #single extrusion of the outline of all teeth is evaluated as a whole everywhere and meshes slower
+        csg_evotooth = None
         for extrusion in extrude_list:
-            if 'csg_evotooth' in locals():
+            if csg_evotooth is not None:
                 csg_evotooth += csg.Extrusion(extrusion[1], extrusion[2], csg.Vec(
                     extrusion[3][0], extrusion[3][1], extrusion[3][2]))
             else:
@@ -70,6 +81,10 @@ class CSGEvoGear:
                               self.EvoTooth_ini.d_f/2)-csg.Cylinder(csg.Pnt(0, 0, 0),
                                                                     csg.Pnt(0, 0, (-1)*self.EvoTooth_ini.length),
                                                                     self.EvoTooth_ini.diameter[0])
+
+        #All teeth may be culled
+        if csg_evotooth is None:
+            return gearbody*front*back
         
         return (csg_evotooth+gearbody)*front*back
     
@@ -105,18 +120,10 @@ class CSGEvoGear:
         :rtype: np.array
         """
         
-        delta_alpha = self.delta_alpha
-        rotation_angle = np.radians(0)
-        dirvec_list = []
-        for i in range(self.EvoTooth_ini.n):#self.EvoTooth_ini.n-1
-            if i == 0:
-                dirvec_list.append(((self.EvoTooth_ini.d_b/2)*np.cos(rotation_angle+self.EvoTooth_ini.theta),
-                                    (self.EvoTooth_ini.d_b/2)*np.sin(rotation_angle+self.EvoTooth_ini.theta), 0))
-            else:
-                rotation_angle += delta_alpha
-                dirvec_list.append(((self.EvoTooth_ini.d_b/2)*np.cos(rotation_angle+self.EvoTooth_ini.theta),
-                                    (self.EvoTooth_ini.d_b/2)*np.sin(rotation_angle+self.EvoTooth_ini.theta), 0))
-        return np.array(dirvec_list)
+        angles = self.EvoTooth_ini.theta + np.arange(self.EvoTooth_ini.n)*self.delta_alpha
+        
+        return np.column_stack(((self.EvoTooth_ini.d_b/2)*np.cos(angles), (self.EvoTooth_ini.d_b/2)*np.sin(angles),
+                                np.zeros(self.EvoTooth_ini.n)))
     
     def path_list(self) -> tuple:
         """The path along which the spline geometry is being extruded
@@ -136,7 +143,7 @@ class CSGEvoGear:
         :param involute_points: Points to calculate the involute function
         :type: int 
         
-        :return: Puts every gear tooth in an easy accessible list,
+        :return: Puts every gear tooth in an easy accessible list, culled teeth are left out,
         :rtype: list
         """
         evotooth_spline_array = self.evotooth_2dpoint_array(involute_points)[0]
@@ -169,9 +176,32 @@ class CSGEvoGear:
             tooth_path.AddSegment(*seg)
         
         #Adding entries to extrude list, dont forget to add a Front and Back Plane
+        #Teeth rotating into the culling radius before a rotated mesh is rebuilt are kept as well
+        padding = self.EvoTooth_ini.d_a/2*self.EvoTooth_ini.rotate_mesh_max_angle \
+            if self.EvoTooth_ini.rotate_mesh else 0.0
+        dirvec_array = self.dirvec_array()
         for i in range(self.EvoTooth_ini.n):
-            extrude_list.append(["evotooth", tooth_path, tooth_spline, (self.dirvec_array()[i, 0],
-                                                                        self.dirvec_array()[i, 1],
-                                                                        self.dirvec_array()[i, 2])])
+            if self.culling is not None and not self.culling.relevant(self.tooth_box(dirvec_array[i]), padding):
+                continue
+            extrude_list.append(["evotooth", tooth_path, tooth_spline, (dirvec_array[i, 0],
+                                                                        dirvec_array[i, 1],
+                                                                        dirvec_array[i, 2])])
         
         return extrude_list
+
+    def tooth_box(self, dirvec: np.array) -> np.array:
+        """Box enclosing the tooth extruded along a direction vector
+
+        :param dirvec: Direction vector of the tooth as returned by dirvec_array
+        :type dirvec: np.array
+
+        :return: Lower and upper corner of the box
+        :rtype: np.array
+        """
+
+        center = (self.EvoTooth_ini.d_a + self.EvoTooth_ini.d_f)/4*np.asarray(dirvec)/np.linalg.norm(dirvec)
+        center[2] = (-1)*self.EvoTooth_ini.length/2
+        
+        return BoundingBox.cylinder(center, np.array([0.0, 0.0, 1.0]),
+                                    (self.EvoTooth_ini.d_a - self.EvoTooth_ini.d_f)/4 + self.EvoTooth_ini.s,
+                                    self.EvoTooth_ini.length)
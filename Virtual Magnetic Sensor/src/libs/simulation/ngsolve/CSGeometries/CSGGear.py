@@ -1,8 +1,11 @@
 import netgen.csg as csg
 from math import pi, sin, cos, tan
 import numpy as np
+from typing import Dict, List, Tuple, Union
 
+from libs.elements.BoundingBox import BoundingBox
 from libs.elements.components.Gear import Gear
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
 
 
 class CSGGear:
@@ -10,16 +13,21 @@ class CSGGear:
 
     :param gear: Object of the gear class.
     :type gear: Gear
+    :param culling: Selection of the teeth built. None builds all teeth within the display angle.
+    :type culling: Union[ToothCulling, None]
     """
 
     gear: Gear
+    culling: Union[ToothCulling, None]
     body: csg.Solid
 
     def __init__(self,
-                 gear: Gear) -> None:
+                 gear: Gear,
+                 culling: Union[ToothCulling, None] = None) -> None:
         """Constructor method."""
 
         self.gear = gear
+        self.culling = culling
 
         self.body = self.build_body()
 
@@ -50,76 +58,126 @@ class CSGGear:
                                 csg.Pnt(position + self.gear.length/2 * axis),
                                 self.gear.diameter[1] / 2 - self.gear.tooth_height / 2) * front * back
 
+        for phi, n_idx in self.teeth():
+            planes = {name: csg.Plane(csg.Pnt(support), csg.Vec(normal))
+                      for name, (support, normal) in self.tooth_planes(phi, n_idx).items()}
+
+            if np.isclose(self.gear.chamfer_depth, 0.0):
+                tooth = planes['top'] * front * back * planes['left_flank'] * planes['right_flank'] * planes['bottom']
+            else:
+                tooth = planes['top'] * front * back * planes['left_flank'] * planes['right_flank'] * \
+                        planes['left_chamfer'] * planes['right_chamfer'] * planes['bottom']
+
+            body += tooth
+
+        return body
+
+    def teeth(self) -> List[Tuple[float, int]]:
+        """Method to list the teeth of the gear drawn within the display angle and not culled. If the mesh of the
+            gear is rotated, the teeth rotating into the culling radius before the mesh is rebuilt are kept as well.
+
+        :return: Angle and index of each drawn tooth.
+        :rtype: List[Tuple[float, int]]
+        """
+
+        teeth: List[Tuple[float, int]] = list()
         n_idx = 0
-        phi = angle
+        phi = self.gear.theta
+        padding = (self.gear.diameter[1] + self.gear.tooth_height) / 2 * self.gear.rotate_mesh_max_angle \
+            if self.gear.rotate_mesh else 0.0
 
         if self.gear.n > 0:
             while n_idx < self.gear.n:
-                if self.gear.display_teeth_angle[0] <= phi % (2*pi) <= self.gear.display_teeth_angle[1]:
-                    phi_vec = np.array([cos(phi), sin(phi), 0.0])
-
-                    top_support = csg.Pnt(position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2 + (
-                        self.gear.tooth_deviations[1] if n_idx == self.gear.dev_tooth_num else 0)) * trans_matrix.dot(
-                        phi_vec))
-                    top_normal = csg.Vec(trans_matrix.dot(phi_vec))
-                    top = csg.Plane(top_support, top_normal)
-
-                    bottom_support = csg.Pnt(position + (
-                            self.gear.diameter[1] / 2 - self.gear.tooth_height) * trans_matrix.dot(phi_vec))
-                    bottom_normal = csg.Vec(trans_matrix.dot(-phi_vec))
-                    bottom = csg.Plane(bottom_support, bottom_normal)
-
-                    left_flank_support = csg.Pnt(position + trans_matrix.dot(
-                        (self.gear.tooth_width / 2 + self.gear.diameter[1] / 2 * tan(self.gear.tooth_flank_angle + (
-                            self.gear.tooth_deviations[0] if n_idx == self.gear.dev_tooth_num else 0.0))) * np.array(
-                            [-sin(phi), cos(phi), 0.0])))
-                    left_flank_normal = csg.Vec(trans_matrix.dot(np.array([-sin(phi - self.gear.tooth_flank_angle),
-                                                                           cos(phi - self.gear.tooth_flank_angle),
-                                                                           0.0])))
-                    left_flank = csg.Plane(left_flank_support, left_flank_normal)
-
-                    right_flank_support = csg.Pnt(position - trans_matrix.dot(
-                        (self.gear.tooth_width / 2 + self.gear.diameter[1] / 2 * tan(self.gear.tooth_flank_angle + (
-                            self.gear.tooth_deviations[2] if n_idx == self.gear.dev_tooth_num else 0.0))) * np.array(
-                            [-sin(phi), cos(phi), 0.0])))
-                    right_flank_normal = csg.Vec(trans_matrix.dot(np.array([sin(phi + self.gear.tooth_flank_angle),
-                                                                            -cos(phi + self.gear.tooth_flank_angle),
-                                                                            0.0])))
-                    right_flank = csg.Plane(right_flank_support, right_flank_normal)
-
-                    left_chamfer_support = csg.Pnt(
-                        position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2) * trans_matrix.dot(phi_vec)
-                        + (self.gear.tooth_width / 2 - sin(self.gear.tooth_flank_angle) * self.gear.tooth_height / 2)
-                        * trans_matrix.dot(
-                            np.array([-sin(phi), cos(phi), 0.0])
-                            + (self.gear.chamfer_depth * trans_matrix.dot(
-                                np.array([-sin(self.gear.chamfer_angle), -cos(self.gear.chamfer_angle), 0.0]))
-                               * trans_matrix.dot(phi_vec))))
-                    left_chamfer_normal = csg.Vec(
-                        trans_matrix.dot(np.array(
-                            [cos(phi + self.gear.chamfer_angle), sin(phi + self.gear.chamfer_angle), 0.0])))
-                    left_chamfer = csg.Plane(left_chamfer_support, left_chamfer_normal)
-
-                    right_chamfer_support = csg.Pnt(
-                        position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2) * trans_matrix.dot(phi_vec)
-                        - (self.gear.tooth_width / 2 - sin(self.gear.tooth_flank_angle) * self.gear.tooth_height / 2)
-                        * trans_matrix.dot(
-                            np.array([-sin(phi), cos(phi), 0.0])
-                            - (self.gear.chamfer_depth * trans_matrix.dot(
-                                np.array([-sin(self.gear.chamfer_angle), -cos(self.gear.chamfer_angle), 0.0]))
-                               * trans_matrix.dot(phi_vec))))
-                    right_chamfer_normal = csg.Vec(trans_matrix.dot(np.array(
-                        [cos(phi - self.gear.chamfer_angle), sin(phi - self.gear.chamfer_angle), 0.0])))
-                    right_chamfer = csg.Plane(right_chamfer_support, right_chamfer_normal)
-
-                    if np.isclose(self.gear.chamfer_depth, 0.0):
-                        tooth = top * front * back * left_flank * right_flank * bottom
-                    else:
-                        tooth = top * front * back * left_flank * right_flank * left_chamfer * right_chamfer * bottom
-
-                    body += tooth
+                if self.gear.display_teeth_angle[0] <= phi % (2*pi) <= self.gear.display_teeth_angle[1] and \
+                        (self.culling is None or self.culling.relevant(self.tooth_box(phi), padding)):
+                    teeth.append((phi, n_idx))
 
                 phi += 2 * pi / self.gear.n
                 n_idx += 1
 
-        return body
+        return teeth
+
+    def tooth_box(self, phi: float) -> np.ndarray:
+        """Method to calculate a box enclosing a tooth.
+
+        :param phi: Angle of the tooth.
+        :type phi: float
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        axis: np.ndarray = self.gear.rotation_axis(self.gear.theta)
+        center: np.ndarray = self.gear.position(self.gear.theta) + self.gear.diameter[1] / 2 * \
+            self.gear.transformation_matrix(axis).dot(np.array([cos(phi), sin(phi), 0.0]))
+
+        return BoundingBox.cylinder(center, axis, self.gear.tooth_width / 2 + self.gear.tooth_height +
+                                    max(float(np.max(self.gear.tooth_deviations)), 0.0), self.gear.length)
+
+    def tooth_planes(self, phi: float, n_idx: int) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Method to calculate the planes bounding a tooth. The tooth is the intersection of the half spaces behind
+            the planes and the front and back plane of the gear. The chamfer planes are only part of the tooth if the
+            chamfer depth is not zero.
+
+        :param phi: Angle of the tooth.
+        :type phi: float
+        :param n_idx: Index of the tooth.
+        :type n_idx: int
+
+        :return: Support point and outer normal of each plane.
+        :rtype: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+
+        angle: float = self.gear.theta
+        position: np.ndarray = self.gear.position(angle)
+        axis: np.ndarray = self.gear.rotation_axis(angle)
+        trans_matrix: np.ndarray = self.gear.transformation_matrix(axis)
+
+        phi_vec = np.array([cos(phi), sin(phi), 0.0])
+        planes: Dict[str, Tuple[np.ndarray, np.ndarray]] = dict()
+
+        planes['top'] = (position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2 + (
+            self.gear.tooth_deviations[1] if n_idx == self.gear.dev_tooth_num else 0)) * trans_matrix.dot(phi_vec),
+                         trans_matrix.dot(phi_vec))
+
+        planes['bottom'] = (position + (self.gear.diameter[1] / 2 - self.gear.tooth_height) * trans_matrix.dot(phi_vec),
+                            trans_matrix.dot(-phi_vec))
+
+        planes['left_flank'] = (position + trans_matrix.dot(
+            (self.gear.tooth_width / 2 + self.gear.diameter[1] / 2 * tan(self.gear.tooth_flank_angle + (
+                self.gear.tooth_deviations[0] if n_idx == self.gear.dev_tooth_num else 0.0))) * np.array(
+                [-sin(phi), cos(phi), 0.0])),
+                                trans_matrix.dot(np.array([-sin(phi - self.gear.tooth_flank_angle),
+                                                           cos(phi - self.gear.tooth_flank_angle), 0.0])))
+
+        planes['right_flank'] = (position - trans_matrix.dot(
+            (self.gear.tooth_width / 2 + self.gear.diameter[1] / 2 * tan(self.gear.tooth_flank_angle + (
+                self.gear.tooth_deviations[2] if n_idx == self.gear.dev_tooth_num else 0.0))) * np.array(
+                [-sin(phi), cos(phi), 0.0])),
+                                 trans_matrix.dot(np.array([sin(phi + self.gear.tooth_flank_angle),
+                                                            -cos(phi + self.gear.tooth_flank_angle), 0.0])))
+
+        if not np.isclose(self.gear.chamfer_depth, 0.0):
+            planes['left_chamfer'] = (
+                position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2) * trans_matrix.dot(phi_vec)
+                + (self.gear.tooth_width / 2 - sin(self.gear.tooth_flank_angle) * self.gear.tooth_height / 2)
+                * trans_matrix.dot(
+                    np.array([-sin(phi), cos(phi), 0.0])
+                    + (self.gear.chamfer_depth * trans_matrix.dot(
+                        np.array([-sin(self.gear.chamfer_angle), -cos(self.gear.chamfer_angle), 0.0]))
+                       * trans_matrix.dot(phi_vec))),
+                trans_matrix.dot(np.array([cos(phi + self.gear.chamfer_angle), sin(phi + self.gear.chamfer_angle),
+                                           0.0])))
+
+            planes['right_chamfer'] = (
+                position + (self.gear.diameter[1] / 2 + self.gear.tooth_height / 2) * trans_matrix.dot(phi_vec)
+                - (self.gear.tooth_width / 2 - sin(self.gear.tooth_flank_angle) * self.gear.tooth_height / 2)
+                * trans_matrix.dot(
+                    np.array([-sin(phi), cos(phi), 0.0])
+                    - (self.gear.chamfer_depth * trans_matrix.dot(
+                        np.array([-sin(self.gear.chamfer_angle), -cos(self.gear.chamfer_angle), 0.0]))
+                       * trans_matrix.dot(phi_vec))),
+                trans_matrix.dot(np.array([cos(phi - self.gear.chamfer_angle), sin(phi - self.gear.chamfer_angle),
+                                           0.0])))
+
+        return planes
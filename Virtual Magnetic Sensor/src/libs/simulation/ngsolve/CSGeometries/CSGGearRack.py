@@ -1,8 +1,11 @@
 import netgen.csg as csg
 from math import sin, cos
 import numpy as np
+from typing import Dict, List, Tuple, Union
 
+from libs.elements.BoundingBox import BoundingBox
 from libs.elements.components.GearRack import GearRack
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
 
 
 class CSGGearRack:
@@ -10,16 +13,21 @@ class CSGGearRack:
 
     :param gear_rack: Object of the gear rack class.
     :type gear_rack: GearRack
+    :param culling: Selection of the teeth built. None builds all teeth.
+    :type culling: Union[ToothCulling, None]
     """
 
     gear_rack: GearRack
+    culling: Union[ToothCulling, None]
     body: csg.Solid
 
     def __init__(self,
-                 gear_rack: GearRack) -> None:
+                 gear_rack: GearRack,
+                 culling: Union[ToothCulling, None] = None) -> None:
         """Constructor method."""
 
         self.gear_rack = gear_rack
+        self.culling = culling
 
         self.body = self.build_body()
 
@@ -53,41 +61,81 @@ class CSGGearRack:
 
         body: csg.Solid = left * right * bottom * top * back * front
 
-        if self.gear_rack.tooth_height > 0 and self.gear_rack.tooth_width > 0:
-            tooth_top: csg.Solid = csg.Plane(
-                csg.Pnt(self.gear_rack.position() + trans_matrix.dot(
-                    self.gear_rack.dim / 2 + np.array([0.0, self.gear_rack.tooth_height, 0.0]))),
-                csg.Vec(trans_matrix.dot(np.array([0, 1, 0]))))
-            tooth_bottom: csg.Solid = csg.Plane(
-                csg.Pnt(self.gear_rack.position() + trans_matrix.dot(self.gear_rack.dim / 2)),
-                csg.Vec(trans_matrix.dot(np.array([0, -1, 0]))))
-
-            idx: int = 0
-            while self.gear_rack.tooth_width + idx*self.gear_rack.tooth_pitch <= self.gear_rack.dim[0]:
-                left_flank_support = csg.Pnt(self.gear_rack.position() + trans_matrix.dot(
-                    (-self.gear_rack.dim / 2 + np.array([idx * self.gear_rack.tooth_pitch + sin(
-                        self.gear_rack.tooth_flank_angle) * self.gear_rack.tooth_height / 2,
-                                                         self.gear_rack.dim[1] + self.gear_rack.tooth_height / 2,
-                                                         0.0]))))
-                left_flank_normal = csg.Vec(trans_matrix.dot(np.array([-cos(self.gear_rack.tooth_flank_angle),
-                                                                       sin(self.gear_rack.tooth_flank_angle),
-                                                                       0.0])))
-                left_flank = csg.Plane(left_flank_support, left_flank_normal)
-
-                right_flank_support = csg.Pnt(self.gear_rack.position() + trans_matrix.dot(
-                    (-self.gear_rack.dim / 2 + np.array(
-                        [self.gear_rack.tooth_width + idx * self.gear_rack.tooth_pitch + sin(
-                            self.gear_rack.tooth_flank_angle) * self.gear_rack.tooth_height / 2,
-                         self.gear_rack.dim[1] + self.gear_rack.tooth_height / 2,
-                         0.0]))))
-                right_flank_normal = csg.Vec(trans_matrix.dot(np.array([cos(self.gear_rack.tooth_flank_angle),
-                                                                       sin(self.gear_rack.tooth_flank_angle),
-                                                                       0.0])))
-                right_flank = csg.Plane(right_flank_support, right_flank_normal)
-
-                tooth = tooth_top * tooth_bottom * back * front * left_flank * right_flank
-
-                body += tooth
-                idx += 1
+        for idx in self.teeth():
+            planes = {name: csg.Plane(csg.Pnt(support), csg.Vec(normal))
+                      for name, (support, normal) in self.tooth_planes(idx).items()}
+            body += planes['top'] * planes['bottom'] * back * front * planes['left_flank'] * planes['right_flank']
 
         return body
+
+    def teeth(self) -> List[int]:
+        """Method to list the indices of the teeth fitting on the gear rack and not culled. If the mesh of the gear rack
+            is moved, the teeth moving into the culling radius before the mesh is rebuilt are kept as well.
+
+        :return: Index of each built tooth.
+        :rtype: List[int]
+        """
+
+        teeth: List[int] = list()
+        if self.gear_rack.tooth_height <= 0 or self.gear_rack.tooth_width <= 0:
+            return teeth
+
+        padding = self.gear_rack.move_mesh_max_shift if self.gear_rack.move_mesh else 0.0
+        idx: int = 0
+        while self.gear_rack.tooth_width + idx*self.gear_rack.tooth_pitch <= self.gear_rack.dim[0]:
+            if self.culling is None or self.culling.relevant(self.tooth_box(idx), padding):
+                teeth.append(idx)
+            idx += 1
+
+        return teeth
+
+    def tooth_planes(self, idx: int) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Method to calculate the planes bounding a tooth. The tooth is the intersection of the half spaces behind
+            the planes and the front and back plane of the gear rack.
+
+        :param idx: Index of the tooth.
+        :type idx: int
+        :return: Support point and outer normal of each plane.
+        :rtype: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+
+        trans_matrix = self.gear_rack.transformation_matrix()
+        planes: Dict[str, Tuple[np.ndarray, np.ndarray]] = dict()
+
+        planes['top'] = (self.gear_rack.position() + trans_matrix.dot(
+            self.gear_rack.dim / 2 + np.array([0.0, self.gear_rack.tooth_height, 0.0])),
+                         trans_matrix.dot(np.array([0.0, 1.0, 0.0])))
+        planes['bottom'] = (self.gear_rack.position() + trans_matrix.dot(self.gear_rack.dim / 2),
+                            trans_matrix.dot(np.array([0.0, -1.0, 0.0])))
+
+        planes['left_flank'] = (self.gear_rack.position() + trans_matrix.dot(
+            -self.gear_rack.dim / 2 + np.array([idx * self.gear_rack.tooth_pitch + sin(
+                self.gear_rack.tooth_flank_angle) * self.gear_rack.tooth_height / 2,
+                                                self.gear_rack.dim[1] + self.gear_rack.tooth_height / 2, 0.0])),
+                                trans_matrix.dot(np.array([-cos(self.gear_rack.tooth_flank_angle),
+                                                           sin(self.gear_rack.tooth_flank_angle), 0.0])))
+
+        planes['right_flank'] = (self.gear_rack.position() + trans_matrix.dot(
+            -self.gear_rack.dim / 2 + np.array([self.gear_rack.tooth_width + idx * self.gear_rack.tooth_pitch + sin(
+                self.gear_rack.tooth_flank_angle) * self.gear_rack.tooth_height / 2,
+                                                self.gear_rack.dim[1] + self.gear_rack.tooth_height / 2, 0.0])),
+                                 trans_matrix.dot(np.array([cos(self.gear_rack.tooth_flank_angle),
+                                                            sin(self.gear_rack.tooth_flank_angle), 0.0])))
+
+        return planes
+
+    def tooth_box(self, idx: int) -> np.ndarray:
+        """Method to calculate a box enclosing a tooth.
+
+        :param idx: Index of the tooth.
+        :type idx: int
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        lower = -self.gear_rack.dim / 2 + np.array([idx * self.gear_rack.tooth_pitch - self.gear_rack.tooth_height,
+                                                    self.gear_rack.dim[1], 0.0])
+        upper = lower + np.array([self.gear_rack.tooth_width + 2 * self.gear_rack.tooth_height,
+                                  self.gear_rack.tooth_height, self.gear_rack.dim[2]])
+
+        return BoundingBox.cuboid(self.gear_rack.position(), self.gear_rack.transformation_matrix(), lower, upper)
@@ -0,0 +1,53 @@
+import numpy as np
+from typing import List
+
+from libs.DataHandler import DataHandler
+from libs.elements.BoundingBox import BoundingBox
+
+
+class ToothCulling:
+    """Selects the teeth of gears and gear racks that are built in the geometry. A tooth is built if its bounding box
+        lies within the culling radius of the simulation parameters around a magnet, sensor or field recorder. Distant
+        teeth hardly change the field at the sensors but dominate the number of CSG primitives and the mesh size of
+        large gears. The selection is repeated whenever the geometry is rebuilt, so the teeth follow the motion of the
+        components. A radius of 0 keeps all teeth.
+
+    :param radius: Culling radius in mm.
+    :type radius: float
+    :param regions: Bounding boxes of the magnets, sensors and field recorders.
+    :type regions: List[numpy.ndarray]
+    """
+
+    radius: float
+    regions: List[np.ndarray]
+
+    def __init__(self,
+                 data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.radius = data_handler.sim_params().tooth_culling
+        self.regions = [obj.bounding_box() for obj in data_handler.physical_magnets() +
+                        data_handler.physical_sensors() + data_handler.field_recorders()]
+
+    @property
+    def active(self) -> bool:
+        """True if teeth are culled at all."""
+
+        return self.radius > 0
+
+    def relevant(self, box: np.ndarray, padding: float = 0.0) -> bool:
+        """Method to decide whether a tooth is built.
+
+        :param box: Bounding box of the tooth.
+        :type box: numpy.ndarray
+        :param padding: Distance added to the culling radius, e.g. to cover the rotation of a gear mesh before it is
+            rebuilt.
+        :type padding: float
+        :return: True if the tooth is built.
+        :rtype: bool
+        """
+
+        if not self.active:
+            return True
+
+        return any(BoundingBox.distance(box, region) <= self.radius + padding for region in self.regions)
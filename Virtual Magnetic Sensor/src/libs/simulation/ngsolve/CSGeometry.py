@@ -1,12 +1,17 @@
+import sys
 import netgen.csg as csg
+import numpy as np
 from typing import Dict, List
 
 from libs.DataHandler import DataHandler
+from libs.elements.BoundingBox import BoundingBox
 
 from libs.simulation.ngsolve.CSGeometries.CSGComponents import CSGComponents
 from libs.simulation.ngsolve.CSGeometries.CSGMagnets import CSGMagnets
 from libs.simulation.ngsolve.CSGeometries.CSGEnvironment import CSGEnvironment
 from libs.simulation.ngsolve.CSGeometries.CSGSensors import CSGSensors
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
 
 
 class CSGeometry:
@@ -15,15 +20,25 @@ class CSGeometry:
 
     :param data_handler: Object of the Data class containing all simulation relevant data.
     :type data_handler: DataHandler
+    :param crop: Intersect all bodies with the simulation boundaries, e.g. for a submodel covering only a part of the
+        scenery.
+    :type crop: bool
+    :param symmetry: Symmetry planes the scenery is clipped at, the bodies are cropped to the remaining box.
+    :type symmetry: List[SymmetryPlane]
     """
 
     data_handler: DataHandler
     materials: Dict[str, str]
+    crop: bool
 
     def __init__(self,
-                 data_handler: DataHandler) -> None:
+                 data_handler: DataHandler,
+                 crop: bool = False,
+                 symmetry: List[SymmetryPlane] = None) -> None:
         """Constructor method."""
 
+        self.crop = crop or bool(symmetry)
+
         self.materials = {
             "component": "iron",
             "magnet": "magnet",
@@ -31,16 +46,20 @@ class CSGeometry:
             "outer": "air"
         }
 
-        self.border_geometry = CSGEnvironment(data_handler.sim_params())
-        self.components_geometries = CSGComponents(data_handler.components())
+        self.border_geometry = CSGEnvironment(data_handler.sim_params(), symmetry)
+        self.components_geometries = CSGComponents(data_handler.components(), ToothCulling(data_handler))
         self.magnet_geometries = CSGMagnets(data_handler.physical_magnets())
         self.sensor_geometries = CSGSensors(data_handler.physical_sensors())
 
         self.geometry = self.init_geometry(data_handler)
-        self.geometry.Draw()
+        # Drawing keeps the geometry referenced by the visualization, so it is only done if the Netgen gui is loaded.
+        if 'netgen.gui' in sys.modules:
+            self.geometry.Draw()
 
     def init_geometry(self, data_handler: DataHandler) -> csg.CSGeometry:
         """Creates the overall geometry of all elements of the simulation. Result can be displayed in the netgen gui.
+            Earlier bodies are only subtracted from a body if their bounding boxes overlap, and from the open boundary
+            shell if they reach the simulation boundaries.
 
         :param data_handler: Object of the Data class containing all simulation relevant data.
         :type data_handler: DataHandler
@@ -50,26 +69,42 @@ class CSGeometry:
 
         geometry: csg.CSGeometry = csg.CSGeometry()
         bodies_list: List[csg.Solid] = list()
+        boxes_list: List[np.ndarray] = list()
 
         for num, magnet_body in enumerate(self.magnet_geometries.bodies):
-            for body in bodies_list:
-                magnet_body -= body
+            if self.crop:
+                magnet_body *= self.border_geometry.body
+            box = data_handler.physical_magnets()[num].bounding_box()
+            for body, other_box in zip(bodies_list, boxes_list):
+                if self.overlapping(box, other_box):
+                    magnet_body -= body
             bodies_list.append(magnet_body)
+            boxes_list.append(box)
             geometry.Add(magnet_body.mat(self.materials["magnet"] + str(num)),
                          maxh=data_handler.physical_magnets()[num].maxh,
                          col=(0.5, 0.5, 0.5))
 
         for num, component_body in enumerate(self.components_geometries.bodies):
-            for body in bodies_list:
-                component_body -= body
+            if self.crop:
+                component_body *= self.border_geometry.body
+            box = data_handler.components()[num].bounding_box()
+            for body, other_box in zip(bodies_list, boxes_list):
+                if self.overlapping(box, other_box):
+                    component_body -= body
             bodies_list.append(component_body)
+            boxes_list.append(box)
             geometry.Add(component_body.mat(self.materials["component"] + str(num)),
                          maxh=data_handler.components()[num].maxh, col=(0.9, 0.9, 0.9))
 
         for num, sensor_body in enumerate(self.sensor_geometries.bodies):
-            for body in bodies_list:
-                sensor_body -= body
+            if self.crop:
+                sensor_body *= self.border_geometry.body
+            box = data_handler.physical_sensors()[num].bounding_box()
+            for body, other_box in zip(bodies_list, boxes_list):
+                if self.overlapping(box, other_box):
+                    sensor_body -= body
             bodies_list.append(sensor_body)
+            boxes_list.append(box)
             geometry.Add(sensor_body.mat(self.materials["sensor"]), maxh=data_handler.physical_sensors()[num].maxh,
                          col=(0.2, 0.2, 0.2))
 
@@ -79,4 +114,28 @@ class CSGeometry:
         geometry.Add(outer_body.mat(self.materials["outer"]), maxh=data_handler.sim_params().maxh_global,
                      transparent=True)
 
+        if self.border_geometry.shell is not None:
+            shell_body = self.border_geometry.shell
+            boundaries = np.asarray(data_handler.sim_params().boundaries, dtype=float)
+            for body, box in zip(bodies_list, boxes_list):
+                if np.any(box[0] <= boundaries[0]) or np.any(box[1] >= boundaries[1]):
+                    shell_body -= body
+            geometry.Add(shell_body.mat(self.materials["outer"]), maxh=data_handler.sim_params().maxh_global,
+                         transparent=True)
+
         return geometry
+
+    @staticmethod
+    def overlapping(box: np.ndarray, other: np.ndarray) -> bool:
+        """Checks if the bounding boxes of two bodies overlap or touch, i.e. if one body has to be subtracted from the
+            other one.
+
+        :param box: Lower and upper corner of the first box.
+        :type box: numpy.ndarray
+        :param other: Lower and upper corner of the second box.
+        :type other: numpy.ndarray
+        :return: True if the boxes share at least one point.
+        :rtype: bool
+        """
+
+        return BoundingBox.distance(box, other) == 0
@@ -0,0 +1,111 @@
+import ngsolve as ng
+import numpy as np
+from typing import List
+
+
+class CoordinateStretching:
+    """Open boundary treatment by a coordinate stretching shell around the simulation box. The mesh covers the box and
+        a shell of the given thickness around it. Within the shell, the distance to the box is stretched by the
+        rational mapping x -> a + d * xi / (1 - c * xi) with xi = (x - a) / d and c = 1 - 1 / stretch, so the shell
+        represents a layer stretch times as thick as the meshed one. The mapping and its derivative are continuous at
+        the box, where the derivative is 1, so the box itself is not distorted. The finite element forms are evaluated
+        in the physical coordinates by transforming the gradients, curls and the volume element with the Jacobian of
+        the mapping, which is diagonal.
+
+    :param pmin: Lower corner of the box in mesh coordinates.
+    :type pmin: numpy.ndarray
+    :param pmax: Upper corner of the box in mesh coordinates.
+    :type pmax: numpy.ndarray
+    :param thickness: Thickness of the meshed shell.
+    :type thickness: float
+    :param stretch: Ratio of the represented to the meshed thickness of the shell.
+    :type stretch: float
+    :param mapped: Physical coordinate of each axis as function of the mesh coordinates.
+    :type mapped: List[ngsolve.CoefficientFunction]
+    :param derivatives: Derivative of the physical coordinate of each axis, i.e. the diagonal of the Jacobian.
+    :type derivatives: List[ngsolve.CoefficientFunction]
+    """
+
+    pmin: np.ndarray
+    pmax: np.ndarray
+    thickness: float
+    stretch: float
+    mapped: List[ng.CoefficientFunction]
+    derivatives: List[ng.CoefficientFunction]
+
+    def __init__(self,
+                 pmin: np.ndarray,
+                 pmax: np.ndarray,
+                 thickness: float,
+                 stretch: float) -> None:
+        """Constructor method."""
+
+        self.pmin = np.asarray(pmin, dtype=float)
+        self.pmax = np.asarray(pmax, dtype=float)
+        self.thickness = thickness
+        self.stretch = max(stretch, 1.0)
+
+        self.mapped = list()
+        self.derivatives = list()
+        c = 1 - 1 / self.stretch
+        for coordinate, lower, upper in zip([ng.x, ng.y, ng.z], self.pmin, self.pmax):
+            xi_upper = (coordinate - upper) / thickness
+            xi_lower = (lower - coordinate) / thickness
+            self.mapped.append(ng.IfPos(xi_upper, upper + thickness * xi_upper / (1 - c * xi_upper),
+                                        ng.IfPos(xi_lower, lower - thickness * xi_lower / (1 - c * xi_lower),
+                                                 coordinate)))
+            self.derivatives.append(ng.IfPos(xi_upper, 1 / (1 - c * xi_upper) ** 2,
+                                             ng.IfPos(xi_lower, 1 / (1 - c * xi_lower) ** 2, 1)))
+
+    @property
+    def dim(self) -> int:
+        """Dimension of the mesh."""
+
+        return len(self.pmin)
+
+    @property
+    def det(self) -> ng.CoefficientFunction:
+        """Determinant of the Jacobian, i.e. the ratio of the physical to the mesh volume element."""
+
+        det = self.derivatives[0]
+        for derivative in self.derivatives[1:]:
+            det = det * derivative
+
+        return det
+
+    def diagonal(self, exponent: int) -> ng.CoefficientFunction:
+        """Diagonal matrix with the derivatives to the given power.
+
+        :param exponent: Power of the derivatives, 1 for the Jacobian and -1 for its inverse.
+        :type exponent: int
+        :return: Matrix valued coefficient function.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        entries = [0] * self.dim ** 2
+        for idx, derivative in enumerate(self.derivatives):
+            entries[idx * (self.dim + 1)] = derivative ** exponent
+
+        return ng.CoefficientFunction(tuple(entries), dims=(self.dim, self.dim))
+
+    def grad(self, grad: ng.CoefficientFunction) -> ng.CoefficientFunction:
+        """Transforms the gradient with respect to the mesh coordinates into the physical gradient.
+
+        :param grad: Gradient in mesh coordinates.
+        :type grad: ngsolve.CoefficientFunction
+        :return: Physical gradient.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        return self.diagonal(-1) * grad
+
+    def curl(self, curl: ng.CoefficientFunction) -> ng.CoefficientFunction:
+        """Transforms the curl with respect to the mesh coordinates into the physical curl (Piola transformation).
+
+        :param curl: Curl in mesh coordinates.
+        :type curl: ngsolve.CoefficientFunction
+        :return: Physical curl.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        return self.diagonal(1) * curl / self.det
@@ -0,0 +1,173 @@
+import ngsolve as ng
+import numpy as np
+from math import sqrt
+from typing import List
+
+
+class DeflatedCG:
+    """Preconditioned conjugate gradient method with a recycled deflation space. The solutions of the previous solves
+        span a small subspace which is solved for exactly by a Galerkin projection, while the CG iterations are kept
+        A-orthogonal to it. Since consecutive time steps solve nearly identical systems, most of the new solution lies
+        in this subspace and the remaining iterations only have to resolve the difference.
+
+    :param size: Maximum number of vectors kept in the recycle space.
+    :type size: int
+    :param space: Recycled vectors, oldest first.
+    :type space: List[ngsolve.BaseVector]
+    :param iterations: Number of CG iterations of the last solve.
+    :type iterations: int
+    :param residual: Preconditioned residual of the last solve relative to the right hand side.
+    :type residual: float
+    """
+
+    size: int
+    space: List[ng.BaseVector]
+    iterations: int
+    residual: float
+
+    def __init__(self, size: int) -> None:
+        """Constructor method."""
+
+        self.size = size
+        self.space = list()
+        self.iterations = 0
+        self.residual = 0.0
+
+    def dim(self) -> int:
+        """Returns the current dimension of the recycle space."""
+
+        return len(self.space)
+
+    def reset(self) -> None:
+        """Discards the recycle space, e.g. after the finite element space changed its dimension."""
+
+        self.space = list()
+
+    def add(self, vec: ng.BaseVector) -> None:
+        """Adds a solution vector to the recycle space. The oldest vector is dropped if the space is full.
+
+        :param vec: Solution of the last solve.
+        :type vec: ngsolve.BaseVector
+        """
+
+        if self.size < 1:
+            return
+        if self.space and len(self.space[0]) != len(vec):
+            self.reset()
+
+        new_vec = vec.CreateVector()
+        new_vec.data = vec
+        self.space.append(new_vec)
+        if len(self.space) > self.size:
+            self.space.pop(0)
+
+    def basis(self, mat: ng.BaseMatrix) -> List[List[ng.BaseVector]]:
+        """Creates an A-orthonormal basis of the recycle space for the current system matrix. Directions that are
+            numerically linearly dependent are dropped.
+
+        :param mat: System matrix.
+        :type mat: ngsolve.BaseMatrix
+
+        :return: The basis vectors W and their images A*W.
+        :rtype: List[List[ngsolve.BaseVector]]
+        """
+
+        if not self.space:
+            return [list(), list()]
+
+        a_space: List[ng.BaseVector] = list()
+        for vec in self.space:
+            a_vec = vec.CreateVector()
+            a_vec.data = mat * vec
+            a_space.append(a_vec)
+
+        gram = np.array([[ng.InnerProduct(w, a_w) for a_w in a_space] for w in self.space])
+        gram = (gram + gram.T) / 2
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        keep = eigenvalues > 1e-12 * eigenvalues.max()
+
+        w_basis: List[ng.BaseVector] = list()
+        a_w_basis: List[ng.BaseVector] = list()
+        for eigenvalue, eigenvector in zip(eigenvalues[keep], eigenvectors.T[keep]):
+            coefficients = eigenvector / sqrt(eigenvalue)
+            w = self.space[0].CreateVector()
+            a_w = self.space[0].CreateVector()
+            w[:] = 0
+            a_w[:] = 0
+            for coefficient, vec, a_vec in zip(coefficients, self.space, a_space):
+                w.data += coefficient * vec
+                a_w.data += coefficient * a_vec
+            w_basis.append(w)
+            a_w_basis.append(a_w)
+
+        return [w_basis, a_w_basis]
+
+    def solve(self, mat: ng.BaseMatrix, pre: ng.BaseMatrix, rhs: ng.BaseVector, sol: ng.BaseVector, tol: float,
+              maxsteps: int) -> int:
+        """Solves the system mat * sol = rhs and adds the solution to the recycle space. The stopping criterion is the
+            one of ngsolve.solvers.CG started from zero, i.e. the preconditioned residual is reduced by tol relative to
+            the right hand side, so results match the plain CG method.
+
+        :param mat: System matrix.
+        :type mat: ngsolve.BaseMatrix
+        :param pre: Preconditioner.
+        :type pre: ngsolve.BaseMatrix
+        :param rhs: Right hand side of the equation.
+        :type rhs: ngsolve.BaseVector
+        :param sol: Vector the solution is written to.
+        :type sol: ngsolve.BaseVector
+        :param tol: Tolerance of the residuum relative to the right hand side.
+        :type tol: float
+        :param maxsteps: Number of maximal steps.
+        :type maxsteps: int
+
+        :return: Number of CG iterations needed.
+        :rtype: int
+        """
+
+        if self.space and len(self.space[0]) != len(rhs):
+            self.reset()
+
+        [w_basis, a_w_basis] = self.basis(mat)
+
+        r = rhs.CreateVector()
+        z = rhs.CreateVector()
+        p = rhs.CreateVector()
+        a_p = rhs.CreateVector()
+
+        z.data = pre * rhs
+        target = tol * sqrt(abs(ng.InnerProduct(rhs, z)))
+
+        # Galerkin projection onto the recycle space as initial guess. The residual is then orthogonal to it.
+        sol[:] = 0
+        for w in w_basis:
+            sol.data += ng.InnerProduct(w, rhs) * w
+        r.data = rhs - mat * sol
+
+        z.data = pre * r
+        rz = ng.InnerProduct(r, z)
+        p.data = z
+        for w, a_w in zip(w_basis, a_w_basis):
+            p.data -= ng.InnerProduct(a_w, z) * w
+
+        self.iterations = 0
+        while sqrt(abs(rz)) > target and self.iterations < maxsteps:
+            a_p.data = mat * p
+            alpha = rz / ng.InnerProduct(p, a_p)
+            sol.data += alpha * p
+            r.data -= alpha * a_p
+            z.data = pre * r
+            rz_new = ng.InnerProduct(r, z)
+            beta = rz_new / rz
+            rz = rz_new
+            p *= beta
+            p.data += z
+            # Keep the search direction A-orthogonal to the recycle space.
+            for w, a_w in zip(w_basis, a_w_basis):
+                p.data -= ng.InnerProduct(a_w, z) * w
+            self.iterations += 1
+
+        self.residual = sqrt(abs(rz)) * tol / target if target > 0 else 0.0
+        self.add(sol)
+
+        return self.iterations
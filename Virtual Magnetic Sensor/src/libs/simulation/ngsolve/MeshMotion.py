@@ -0,0 +1,252 @@
+import ngsolve as ng
+import netgen.meshing as msh
+import numpy as np
+from typing import List, Tuple
+
+from libs.DataHandler import DataHandler
+from libs.elements.Component import Component
+
+from libs.elements.components.Gear import Gear
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.components.GearRack import GearRack
+
+
+class MeshMotion:
+    """Moves the mesh with the components instead of rebuilding it. The points of the elements of each moving
+        component get the exact rigid motion of the component between two motion states: the rotation about the
+        eccentric and wobbling axis of gears and the translation of gear racks. The points of the air elements around
+        them follow the harmonic extension of the motion, with the Laplacian of each element weighted with its inverse
+        volume, so small elements deform less than large ones. The points on the faces of the geometry, e.g. the
+        simulation boundaries, magnets and sensors, and the points of the resting bodies keep their positions. If an
+        element is inverted or squeezed by the motion, the mesh has to be rebuilt.
+    """
+
+    # Smallest accepted ratio of the volume of an element after the motion to its volume before.
+    min_volume_ratio = 0.1
+
+    @staticmethod
+    def movable(component: Component) -> bool:
+        """Method to decide whether the mesh of a component can follow its motion.
+
+        :param component: Component parameters.
+        :type component: Component
+        :return: True if the component moves with its mesh.
+        :rtype: bool
+        """
+
+        if isinstance(component, (Gear, EvoGear)):
+            return bool(component.rotate_mesh)
+        elif isinstance(component, GearRack):
+            return bool(component.move_mesh)
+
+        return False
+
+    @staticmethod
+    def within_limits(component: Component, state: tuple, init_state: tuple) -> bool:
+        """Method to check whether the motion of a component since the mesh got rebuilt stays within the permissible
+            rotation angle or shift.
+
+        :param component: Component parameters.
+        :type component: Component
+        :param state: Current motion state of the component, see NGMesh.motion_state.
+        :type state: tuple
+        :param init_state: Motion state of the component when the mesh got rebuilt.
+        :type init_state: tuple
+        :return: True if the mesh can follow the motion.
+        :rtype: bool
+        """
+
+        if isinstance(component, (Gear, EvoGear)):
+            return abs(state[0] - init_state[0]) < component.rotate_mesh_max_angle
+        elif isinstance(component, GearRack):
+            return float(np.linalg.norm(np.subtract(state[1], init_state[1]))) < component.move_mesh_max_shift
+
+        return False
+
+    @staticmethod
+    def supported(data_handler: DataHandler, state: tuple, init_state: tuple) -> bool:
+        """Method to check whether the mesh built for the initial motion state can follow the components to the
+            current one, i.e. whether all components that moved are movable and within their limits.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param state: Current motion states of the components, see NGMesh.motion_state.
+        :type state: tuple
+        :param init_state: Motion states of the components when the mesh got rebuilt.
+        :type init_state: tuple
+        :return: True if the mesh can follow the components.
+        :rtype: bool
+        """
+
+        if len(state) != len(init_state):
+            return False
+
+        for component, current, initial in zip(data_handler.components(), state, init_state):
+            if current != initial and not (MeshMotion.movable(component) and
+                                           MeshMotion.within_limits(component, current, initial)):
+                return False
+
+        return True
+
+    @staticmethod
+    def rigid_motion(component: Component, state: tuple, new_state: tuple) -> Tuple[np.ndarray, np.ndarray]:
+        """Method to calculate the rigid motion of a component from one motion state to another.
+
+        :param component: Component parameters.
+        :type component: Component
+        :param state: Motion state the points are at.
+        :type state: tuple
+        :param new_state: Motion state the points are moved to.
+        :type new_state: tuple
+        :return: Matrix and offset mapping a point p to matrix.dot(p) + offset.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        if isinstance(component, Gear):
+            [theta, new_theta] = [state[0], new_state[0]]
+            trans_matrix = component.transformation_matrix(component.rotation_axis(theta))
+            new_trans_matrix = component.transformation_matrix(component.rotation_axis(new_theta))
+            matrix = new_trans_matrix.dot(component.rotation_matrix(new_theta - theta)).dot(
+                np.linalg.inv(trans_matrix))
+            return matrix, component.position(new_theta) - matrix.dot(component.position(theta))
+        elif isinstance(component, EvoGear):
+            # Like its geometry (see CSGEvoGear), the evolvent gear rotates about the z-axis through the origin.
+            return component.rotation_matrix(new_state[0] - state[0]), np.zeros(3)
+        elif isinstance(component, GearRack):
+            return np.eye(3), np.subtract(new_state[1], state[1])
+
+        return np.eye(3), np.zeros(3)
+
+    @staticmethod
+    def volumes(points: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """Method to calculate the signed volumes of tetrahedra.
+
+        :param points: Array of shape (n, 3) with the coordinates of the points.
+        :type points: numpy.ndarray
+        :param nodes: Array of shape (m, 4) with the 0-based point indices of the tetrahedra.
+        :type nodes: numpy.ndarray
+        :return: Signed volume of each tetrahedron.
+        :rtype: numpy.ndarray
+        """
+
+        edges = points[nodes[:, 1:]] - points[nodes[:, :1]]
+
+        return np.linalg.det(edges) / 6
+
+    @staticmethod
+    def displacement(mesh: msh.Mesh, data_handler: DataHandler, state: tuple, new_state: tuple) -> np.ndarray:
+        """Method to calculate the displacement of the mesh points from one motion state of the components to another.
+
+        :param mesh: Netgen mesh of the scenery at the motion state.
+        :type mesh: netgen.meshing.Mesh
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param state: Motion states of the components the mesh was generated for.
+        :type state: tuple
+        :param new_state: Motion states of the components the mesh is moved to.
+        :type new_state: tuple
+        :return: Array of shape (n, 3) with the displacement of each point.
+        :rtype: numpy.ndarray
+        """
+
+        points = mesh.Coordinates()
+        elements = mesh.Elements3D().NumPy()
+        nodes = elements['nodes'] - 1
+        materials = [mesh.GetMaterial(idx) for idx in range(1, mesh.GetNDomains() + 1)]
+        element_materials = np.array(materials, dtype=object)[elements['index'] - 1]
+
+        displacement = np.zeros(points.shape)
+        prescribed = np.zeros(len(points), dtype=bool)
+        prescribed[np.ravel(mesh.Elements2D().NumPy()['nodes']) - 1] = True
+        prescribed[np.ravel(nodes[element_materials != "air"])] = True
+
+        for num, component in enumerate(data_handler.components()):
+            if state[num] == new_state[num]:
+                continue
+            body = np.unique(nodes[element_materials == "iron" + str(num)])
+            [matrix, offset] = MeshMotion.rigid_motion(component, state[num], new_state[num])
+            displacement[body] = points[body].dot(matrix.T) + offset - points[body]
+
+        free: List[bool] = (~prescribed).tolist()
+        if not any(free):
+            return displacement
+
+        ng_mesh = ng.Mesh(mesh)
+        fes = ng.H1(ng_mesh, order=1)
+        u, v = fes.TnT()
+        weight = ng.GridFunction(ng.L2(ng_mesh, order=0))
+        weight.vec.FV().NumPy()[:] = 1 / np.abs(MeshMotion.volumes(points, nodes))
+        stiffness = ng.BilinearForm(fes, symmetric=True)
+        stiffness += weight * ng.grad(u) * ng.grad(v) * ng.dx
+        stiffness.Assemble()
+        inverse = stiffness.mat.Inverse(ng.BitArray(free), inverse="sparsecholesky")
+
+        component_gfu = ng.GridFunction(fes)
+        residual = component_gfu.vec.CreateVector()
+        for axis in range(3):
+            component_gfu.vec.FV().NumPy()[:] = displacement[:, axis]
+            residual.data = -stiffness.mat * component_gfu.vec
+            component_gfu.vec.data += inverse * residual
+            displacement[:, axis] = component_gfu.vec.FV().NumPy()
+
+        return displacement
+
+    @staticmethod
+    def band(mesh: msh.Mesh, displacement: np.ndarray) -> np.ndarray:
+        """Method to find the elements changed by a displacement of the points, i.e. the moving components and the band
+            of air around them. The quality of all other elements is unchanged by the motion.
+
+        :param mesh: Netgen mesh of the scenery.
+        :type mesh: netgen.meshing.Mesh
+        :param displacement: Array of shape (n, 3) with the displacement of each point.
+        :type displacement: numpy.ndarray
+        :return: Indices of the elements with at least one displaced point.
+        :rtype: numpy.ndarray
+        """
+
+        nodes = mesh.Elements3D().NumPy()['nodes'][:, :4] - 1
+
+        return np.flatnonzero(np.any(np.any(displacement != 0, axis=1)[nodes], axis=1))
+
+    @staticmethod
+    def apply(mesh: msh.Mesh, displacement: np.ndarray) -> bool:
+        """Method to displace the points of a mesh. The mesh is left unchanged if the displacement inverts or squeezes
+            an element.
+
+        :param mesh: Netgen mesh of the scenery, moved in place.
+        :type mesh: netgen.meshing.Mesh
+        :param displacement: Array of shape (n, 3) with the displacement of each point.
+        :type displacement: numpy.ndarray
+        :return: True if the mesh got moved.
+        :rtype: bool
+        """
+
+        points = mesh.Coordinates()
+        nodes = mesh.Elements3D().NumPy()['nodes'] - 1
+
+        ratio = MeshMotion.volumes(points + displacement, nodes) / MeshMotion.volumes(points, nodes)
+        if np.min(ratio) < MeshMotion.min_volume_ratio:
+            return False
+
+        points += displacement
+
+        return True
+
+    @staticmethod
+    def move(mesh: msh.Mesh, data_handler: DataHandler, state: tuple, new_state: tuple) -> bool:
+        """Method to move the points of a mesh with the components. The mesh is left unchanged if the motion inverts or
+            squeezes an element.
+
+        :param mesh: Netgen mesh of the scenery at the motion state, moved in place.
+        :type mesh: netgen.meshing.Mesh
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param state: Motion states of the components the mesh was generated for.
+        :type state: tuple
+        :param new_state: Motion states of the components the mesh is moved to.
+        :type new_state: tuple
+        :return: True if the mesh got moved.
+        :rtype: bool
+        """
+
+        return MeshMotion.apply(mesh, MeshMotion.displacement(mesh, data_handler, state, new_state))
@@ -0,0 +1,140 @@
+import multiprocessing
+import multiprocessing.pool
+import os
+import psutil
+from typing import Callable, List, Tuple, Union
+
+
+class MeshPipeline:
+    """Generates the meshes of upcoming time steps in separate processes while the current time step is solved, so
+        that mesh generation and solver hide each other's latency on machines with several cores. The meshes are
+        requested for a motion state of the components and taken when the simulation reaches that state. The number
+        of meshes generated at once is bounded by the pipeline depth and by the memory left below the memory limit of
+        the process, estimated from the peak memory of the processes generating the meshes.
+
+    :param depth: Maximum number of meshes generated at once.
+    :type depth: int
+    :param max_memory: Memory limit in MB of the process computing the field. None if unlimited.
+    :type max_memory: Union[float, None]
+    :param mesh_memory: Largest peak memory in MB of a mesh generation so far, 0 before the first mesh is received.
+    :type mesh_memory: float
+    :param pool: Pool of the processes generating the meshes.
+    :type pool: multiprocessing.pool.Pool
+    :param pending: Time stamp, motion state and result of each requested mesh in the order of the requests.
+    :type pending: List[Tuple[float, tuple, multiprocessing.pool.AsyncResult]]
+    """
+
+    depth: int
+    max_memory: Union[float, None]
+    mesh_memory: float
+    pool: multiprocessing.pool.Pool
+    pending: List[Tuple[float, tuple, multiprocessing.pool.AsyncResult]]
+
+    def __init__(self, depth: int, max_memory: Union[float, None] = None) -> None:
+        """Constructor method."""
+
+        self.depth = depth
+        self.max_memory = max_memory
+        self.mesh_memory = 0.0
+        # Forking the threads of the Ngsolve task manager is unsafe, the processes are spawned instead.
+        self.pool = multiprocessing.get_context('spawn').Pool(depth)
+        self.pending = list()
+
+    def capacity(self) -> int:
+        """Method to calculate how many meshes can be generated at once, limited by the depth of the pipeline and the
+            memory left below the memory limit. As long as the memory demand of a mesh is unknown, one mesh is
+            generated at a time.
+
+        :return: Number of meshes.
+        :rtype: int
+        """
+
+        if self.max_memory is None:
+            return self.depth
+        if self.mesh_memory <= 0:
+            return min(self.depth, 1)
+
+        available = self.max_memory - psutil.Process(os.getpid()).memory_info().rss / 1024 ** 2
+
+        return max(0, min(self.depth, int(available / self.mesh_memory)))
+
+    def requested(self, state: tuple) -> bool:
+        """Method to check whether the mesh of a motion state is already requested.
+
+        :param state: Motion states of the components.
+        :type state: tuple
+
+        :return: True if the mesh is requested.
+        :rtype: bool
+        """
+
+        return any(pending_state == state for _, pending_state, _ in self.pending)
+
+    def request(self, t: float, state: tuple, function: Callable, *args) -> bool:
+        """Method to start the generation of the mesh of an upcoming time step if the pipeline has capacity left.
+
+        :param t: Time stamp of the time step.
+        :type t: float
+        :param state: Motion states of the components at the time step.
+        :type state: tuple
+        :param function: Function generating the mesh in a separate process, called with args. It has to return the
+            mesh, its badness, the telemetry records and the peak memory in MB of the process.
+        :type function: Callable
+
+        :return: True if the mesh is requested.
+        :rtype: bool
+        """
+
+        if self.requested(state):
+            return True
+        if len(self.pending) >= self.capacity():
+            return False
+
+        self.pending.append((t, state, self.pool.apply_async(function, args)))
+
+        return True
+
+    def discard(self, t: float) -> None:
+        """Method to drop the requests for time steps before the current one, e.g. if the mesh could be moved instead.
+            Meshes already being generated are completed by the pool, their results are ignored.
+
+        :param t: Time stamp of the current time step.
+        :type t: float
+        """
+
+        self.pending = [pending for pending in self.pending if pending[0] >= t]
+
+    def take(self, t: float, state: tuple) -> Union[list, None]:
+        """Method to take the mesh of the current time step, waiting for its generation if necessary. Requests for
+            earlier time steps are dropped.
+
+        :param t: Time stamp of the current time step.
+        :type t: float
+        :param state: Motion states of the components at the current time step.
+        :type state: tuple
+
+        :return: Mesh, its badness and the telemetry records of its generation. None if the mesh was not requested or
+            its generation failed.
+        :rtype: Union[list, None]
+        """
+
+        self.discard(t)
+        for pending in self.pending:
+            if pending[1] == state:
+                self.pending.remove(pending)
+                try:
+                    [mesh, badness, records, peak_rss] = pending[2].get()
+                except Exception as error:
+                    print("Pipelined mesh generation failed: " + str(error))
+                    return None
+                self.mesh_memory = max(self.mesh_memory, peak_rss)
+                return [mesh, badness, records]
+
+        return None
+
+    def close(self) -> None:
+        """Method to drop the pending requests and stop the processes. Meshes still being generated are not needed
+            anymore, so the processes are terminated instead of waited for."""
+
+        self.pending = list()
+        self.pool.terminate()
@@ -0,0 +1,217 @@
+import ngsolve as ng
+import numpy as np
+from typing import Union, Tuple, List
+
+from libs.simulation.ngsolve.NGScalarField import NGScalarField
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
+from libs.simulation.ngsolve.NGAxisymmetricMesh import NGAxisymmetricMesh
+from libs.simulation.ngsolve.AxisymmetricGeometry import AxisymmetricGeometry
+
+from libs.DataHandler import DataHandler
+
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.RodMagnet import RodMagnet
+
+
+class NGAxisymmetricField(NGScalarField):
+    """Implementation of MagneticField for rotationally symmetric sceneries of coaxial rod magnets and shafts. The
+        total scalar potential does not depend on the angle about the axis, so the problem is solved on the meridian
+        half plane with the coordinates r and s, where the volume element r dr ds enters the weak form through the
+        volume method of the scalar potential formulation. The field
+        strength and flux density only have a radial and an axial component, which are mapped back to the 3D
+        positions passed to get_h_field and get_b_field.
+
+    :param ng_mesh: Object of the mesh class handling the 2D mesh of the half plane.
+    :type ng_mesh: NGAxisymmetricMesh
+    """
+
+    ng_mesh: NGAxisymmetricMesh
+
+    @staticmethod
+    def validity(data_handler: DataHandler) -> Tuple[bool, str]:
+        """Checks whether the scenery is rotationally symmetric: All magnets are rod magnets and all components are
+            shafts, their axes coincide, and the magnetisations and uniform fields point along the axis. Submodels and
+            adaptive refinements are not supported.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Whether the axisymmetric formulation is valid and the reason if not.
+        :rtype: Tuple[bool, str]
+        """
+
+        if data_handler.sim_params().submodel_margin > 0:
+            return False, "Submodels are not supported by the axisymmetric formulation."
+        if data_handler.sim_params().adaptive_tol > 0:
+            return False, "The adaptive refinement is not supported by the axisymmetric formulation."
+
+        for component in data_handler.components():
+            if not isinstance(component, Shaft):
+                return False, "Components of type " + type(component).__name__ + \
+                    " are not supported by the axisymmetric formulation."
+        for magnet in data_handler.physical_magnets():
+            if not isinstance(magnet, RodMagnet):
+                return False, "Magnets of type " + type(magnet).__name__ + \
+                    " are not supported by the axisymmetric formulation."
+
+        [origin, direction] = AxisymmetricGeometry.axis(data_handler)
+        if origin is None:
+            return False, "The scenery contains neither rod magnets nor shafts defining the axis."
+
+        for obj in data_handler.physical_magnets() + data_handler.components():
+            axis = np.asarray(obj.axis, dtype=float)
+            if not np.allclose(np.cross(axis / np.linalg.norm(axis), direction), 0.0) or \
+                    not np.allclose(np.cross(np.asarray(obj.pos, dtype=float) - origin, direction), 0.0, atol=1e-9):
+                return False, "The axes of the rod magnets and shafts do not coincide."
+
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            if not np.allclose(np.cross(magnet.m_vec, direction), 0.0, atol=1e-9 * np.linalg.norm(magnet.m_vec)):
+                return False, "The magnetisation of magnet " + str(num) + " does not point along the axis."
+
+        for field in data_handler.uni_fields():
+            if not np.allclose(np.cross(field.h_vec, direction), 0.0, atol=1e-9 * np.linalg.norm(field.h_vec)):
+                return False, "The uniform field does not point along the axis."
+
+        return True, ""
+
+    def create_mesh(self, data_handler: DataHandler, crop: bool = False) -> NGAxisymmetricMesh:
+        """Method to create the object handling the 2D mesh of the half plane.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param crop: Not supported by the axisymmetric formulation.
+        :type crop: bool
+
+        :return: Mesh of the half plane.
+        :rtype: NGAxisymmetricMesh
+        """
+
+        return NGAxisymmetricMesh(data_handler, self.telemetry)
+
+    def symmetry_planes(self, data_handler: DataHandler) -> List[SymmetryPlane]:
+        """The half plane is not reduced further by symmetry planes.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: An empty list.
+        :rtype: List[SymmetryPlane]
+        """
+
+        return list()
+
+    def stretching_box(self, data_handler: DataHandler) -> np.ndarray:
+        """Method to return the box the open boundary shell is wrapped around in the coordinates of the mesh.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Lower and upper corner of the half plane in r and s.
+        :rtype: numpy.ndarray
+        """
+
+        return AxisymmetricGeometry.extent(data_handler, *AxisymmetricGeometry.axis(data_handler))
+
+    def volume(self) -> ng.CoefficientFunction:
+        """Method to return the ratio of the physical volume element r dr ds (without the constant factor 2 pi) to
+            the mesh area element.
+
+        :return: The volume element.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        if self.stretching is None:
+            return ng.x
+
+        return self.stretching.mapped[0] * self.stretching.det
+
+    def linear_form(self, data_handler: DataHandler) -> ng.LinearForm:
+        """Method to define the right hand side of the PDE, i.e. the sources of the magnetisation and the uniform
+            fields. Both are reduced to their components along the axis.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The linear form, not yet assembled.
+        :rtype: ngsolve.LinearForm
+        """
+
+        v = self.fes.TestFunction()
+        direction = self.ng_mesh.direction
+
+        mag_dict = {}
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            mag_dict["magnet" + str(num)] = (0, float(np.dot(magnet.m_vec, direction)))
+        self.mag = self.ng_mesh.mesh.MaterialCF(mag_dict, default=(0, 0))
+
+        self.h_uni = ng.CoefficientFunction((0, sum(float(np.dot(field.h_vec, direction))
+                                                    for field in data_handler.uni_fields())))
+
+        f = ng.LinearForm(self.fes)
+        for num, _ in enumerate(data_handler.physical_magnets()):
+            f += self.mu0 * self.mur * self.mag * self.physical_grad(v) * self.volume() * ng.dx("magnet" + str(num))
+        if data_handler.uni_fields():
+            f += self.mu0 * (self.mur - 1) * self.h_uni * self.physical_grad(v) * self.volume() * ng.dx
+
+        return f
+
+    def evaluate(self, cf: ng.CoefficientFunction, x: np.ndarray, y: np.ndarray,
+                 z: np.ndarray) -> Union[np.ndarray, None]:
+        """Method to evaluate a field of the half plane on positions defined by a grid on x, y and z. The radial and
+            axial components are mapped back to 3D vectors.
+
+        :param cf: Field with the radial and the axial component.
+        :type cf: ngsolve.CoefficientFunction
+        :param x: x grid.
+        :type x: numpy.ndarray
+        :param y: y grid.
+        :type y: numpy.ndarray
+        :param z: z grid.
+        :type z: numpy.ndarray
+
+        :return: Field on the grid passed.
+        :rtype: Union[np.ndarray, None]
+        """
+
+        [x, y, z] = [np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)]
+        if x.shape != y.shape or x.shape != z.shape or y.shape != z.shape:
+            return None
+
+        points = np.column_stack([x.flatten(), y.flatten(), z.flatten()])
+        [r, s, e_r] = AxisymmetricGeometry.cylindrical(points, self.ng_mesh.origin, self.ng_mesh.direction)
+        values = cf(self.ng_mesh.mesh(r, s))
+        field = values[:, 0, np.newaxis] * e_r + values[:, 1, np.newaxis] * self.ng_mesh.direction
+
+        return field.reshape(x.shape + (3,))
+
+    def get_h_field(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Union[np.ndarray, None]:
+        """Method to extract the magnetic field strength on positions defined by a grid on x, y and z.
+
+        :param x: x grid.
+        :type x: numpy.ndarray
+        :param y: y grid.
+        :type y: numpy.ndarray
+        :param z: z grid.
+        :type z: numpy.ndarray
+
+        :return: Magnetic field strength on the grid passed.
+        :rtype: Union[np.ndarray, None]
+        """
+
+        return self.evaluate(self.h_field, x, y, z)
+
+    def get_b_field(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Union[np.ndarray, None]:
+        """Method to extract the magnetic flux density on positions defined by a grid on x, y and z.
+
+        :param x: x grid.
+        :type x: numpy.ndarray
+        :param y: y grid.
+        :type y: numpy.ndarray
+        :param z: z grid.
+        :type z: numpy.ndarray
+
+        :return: Magnetic flux density on the grid passed.
+        :rtype: Union[np.ndarray, None]
+        """
+
+        return self.evaluate(self.b_field, x, y, z)
@@ -0,0 +1,55 @@
+import netgen.geom2d as geom2d
+import numpy as np
+from typing import Union
+
+from libs.DataHandler import DataHandler
+from libs.simulation.Telemetry import Telemetry
+
+from libs.simulation.ngsolve.NGPlanarMesh import NGPlanarMesh
+from libs.simulation.ngsolve.AxisymmetricGeometry import AxisymmetricGeometry
+
+
+class NGAxisymmetricMesh(NGPlanarMesh):
+    """Generates the 2D mesh of the meridian half plane of a rotationally symmetric scenery. The mesh coordinates are
+        the distance r from the axis and the position s along the axis.
+
+    :param origin: A point on the common axis of the scenery.
+    :type origin: numpy.ndarray
+    :param direction: Unit direction of the common axis.
+    :type direction: numpy.ndarray
+    """
+
+    origin: np.ndarray
+    direction: np.ndarray
+
+    def __init__(self,
+                 data_handler: DataHandler,
+                 telemetry: Union[Telemetry, None] = None) -> None:
+        """Constructor method."""
+
+        [self.origin, self.direction] = AxisymmetricGeometry.axis(data_handler)
+        super().__init__(data_handler, telemetry)
+
+    def plane_points(self, points: np.ndarray) -> np.ndarray:
+        """Maps 3D points to the half plane of the mesh.
+
+        :param points: Array of shape (n, 3) with the points.
+        :type points: numpy.ndarray
+        :return: Array of shape (n, 2) with the coordinates r and s.
+        :rtype: numpy.ndarray
+        """
+
+        [r, s, _] = AxisymmetricGeometry.cylindrical(points, self.origin, self.direction)
+
+        return np.column_stack([r, s])
+
+    def build_geometry(self, data_handler: DataHandler) -> geom2d.CSG2d:
+        """Creates the 2D geometry the mesh is generated from.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Geometry of the meridian half plane of the scenery.
+        :rtype: netgen.geom2d.CSG2d
+        """
+
+        return AxisymmetricGeometry(data_handler).geometry
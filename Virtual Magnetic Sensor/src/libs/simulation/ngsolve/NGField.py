@@ -1,12 +1,21 @@
+from __future__ import annotations
 from abc import ABC
+import copy
 import ngsolve as ng
+import netgen.meshing as msh
 from math import pi
 import numpy as np
-from typing import Union
+import os
+import psutil
+from typing import Union, Tuple, Dict, List
 
 from libs.simulation.MagneticField import MagneticField
+from libs.simulation.Telemetry import Telemetry
 
 from libs.simulation.ngsolve.NGMesh import NGMesh
+from libs.simulation.ngsolve.DeflatedCG import DeflatedCG
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
+from libs.simulation.ngsolve.CoordinateStretching import CoordinateStretching
 
 from libs.DataHandler import DataHandler
 
@@ -24,12 +33,49 @@ class NGField(MagneticField, ABC):
     :type b_field: ngsolve.CoefficientFunction
     :param h_field: Magnetic field strength field defined on the created mesh.
     :type h_field: ngsolve.CoefficientFunction
-    :param gfu: Vector potential.
+    :param gfu: Vector potential of the field besides the uniform fields.
     :type gfu: ngsolve.GridFunction
     :param mag: Magnetisation of the objects in the scenery.
     :type mag: ngsolve.CoefficientFunction
+    :param h_uni: Sum of the uniform magnetic field strengths in the scenery.
+    :type h_uni: ngsolve.CoefficientFunction
     :param ng_mesh: Object of the mesh class handling the CSGeometries.
     :type ng_mesh: NGMesh
+    :param max_memory: Memory limit in MB of the process computing the field. None if unlimited.
+    :type max_memory: Union[float, None]
+    :param direct: Solve the system by a sparse Cholesky factorization instead of CG with BDDC preconditioner.
+    :type direct: bool
+    :param fes: Finite element space of the current system.
+    :type fes: ngsolve.FESpace
+    :param a: Assembled left hand side of the current system.
+    :type a: ngsolve.BilinearForm
+    :param solver: Inverse (direct) or preconditioner (iterative) of the current system.
+    :type solver: ngsolve.BaseMatrix
+    :param system_key: Mesh version and materials the current system was assembled for.
+    :type system_key: tuple
+    :param recycler: Deflated CG method recycling the solutions of previous time steps. None if disabled.
+    :type recycler: Union[DeflatedCG, None]
+    :param iterations: Number of CG iterations of each solve, 0 for direct solves.
+    :type iterations: List[int]
+    :param recycle_dims: Dimension of the recycle space used in each solve.
+    :type recycle_dims: List[int]
+    :param telemetry: Collects the durations of the simulation stages and the solver statistics.
+    :type telemetry: Telemetry
+    :param boundary_field: Coarse global field whose vector potential is imposed as Dirichlet condition on the outer
+        boundary of this field, which is then a local submodel. None for a field of the whole scenery.
+    :type boundary_field: Union[NGField, None]
+    :param submodels: Fine local fields around the sensors if submodeling is enabled.
+    :type submodels: List[NGField]
+    :param boxes: Boundaries of the submodels, each of shape (2, 3).
+    :type boxes: List[numpy.ndarray]
+    :param symmetry: Symmetry planes the scenery is reduced at, empty if the full scenery is simulated.
+    :type symmetry: List[SymmetryPlane]
+    :param stretching: Coordinate stretching of the open boundary shell around the simulation box. None if the box is
+        closed.
+    :type stretching: Union[CoordinateStretching, None]
+    :param times: Time stamps of the steps in the order they are simulated. None for the time stamps of the simulation
+        parameters.
+    :type times: Union[List[float], None]
     """
 
     data_handler: DataHandler
@@ -39,14 +85,155 @@ class NGField(MagneticField, ABC):
     h_field: ng.CoefficientFunction
     gfu: ng.GridFunction
     mag: ng.CoefficientFunction
+    h_uni: ng.CoefficientFunction
     ng_mesh: NGMesh
-
-    def __init__(self, data_handler: DataHandler) -> None:
+    max_memory: Union[float, None]
+    direct: bool
+    fes: ng.FESpace
+    a: ng.BilinearForm
+    solver: ng.BaseMatrix
+    system_key: tuple
+    recycler: Union[DeflatedCG, None]
+    iterations: List[int]
+    recycle_dims: List[int]
+    telemetry: Telemetry
+    boundary_field: Union[NGField, None]
+    submodels: List[NGField]
+    boxes: List[np.ndarray]
+    symmetry: List[SymmetryPlane]
+    stretching: Union[CoordinateStretching, None]
+    times: Union[List[float], None]
+
+    # Empirical memory demand of the sparse Cholesky factor per non-zero entry of the system matrix (3D, order 3).
+    factor_bytes_per_nze = 100
+
+    def __init__(self, data_handler: DataHandler, max_memory: Union[float, None] = None,
+                 telemetry: Union[Telemetry, None] = None, boundary_field: Union[NGField, None] = None,
+                 times: Union[List[float], None] = None) -> None:
         """Constructor method."""
 
         self.mu0 = 4 * pi * 1e-7
+        self.times = times
+
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        self.boundary_field = boundary_field
+        self.boxes = list()
+        self.submodels = list()
+        self.symmetry = self.symmetry_planes(data_handler) if boundary_field is None else list()
+        self.max_memory = max_memory
+        if data_handler.sim_params().shell_thickness > 0 and boundary_field is None:
+            self.stretching = CoordinateStretching(*self.stretching_box(data_handler),
+                                                   data_handler.sim_params().shell_thickness,
+                                                   data_handler.sim_params().shell_stretch)
+        else:
+            self.stretching = None
+        if data_handler.sim_params().submodel_margin > 0:
+            # The sensors and their mesh restrictions are left to the submodels, the global mesh stays coarse.
+            self.ng_mesh = self.create_mesh(self.global_scene(data_handler))
+            for sensor in data_handler.sensors():
+                box = self.submodel_box(data_handler, sensor)
+                self.boxes.append(box)
+                self.submodels.append(type(self)(self.local_scene(data_handler, sensor, box), max_memory,
+                                                 self.telemetry, boundary_field=self, times=times))
+        else:
+            self.ng_mesh = self.create_mesh(data_handler, crop=boundary_field is not None)
+
+        self.direct = data_handler.sim_params().solver == 1
+        self.system_key = tuple()
+        if data_handler.sim_params().recycle > 0:
+            self.recycler = DeflatedCG(data_handler.sim_params().recycle)
+        else:
+            self.recycler = None
+        self.iterations = list()
+        self.recycle_dims = list()
+
+    def create_mesh(self, data_handler: DataHandler, crop: bool = False) -> NGMesh:
+        """Method to create the object handling the mesh of the field.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param crop: Clip the bodies at the simulation boundaries.
+        :type crop: bool
+
+        :return: Mesh of the field.
+        :rtype: NGMesh
+        """
+
+        return NGMesh(data_handler, self.telemetry, crop, self.symmetry, self.max_memory, self.times)
+
+    def symmetry_planes(self, data_handler: DataHandler) -> List[SymmetryPlane]:
+        """Method to detect the symmetry planes the scenery is reduced at if enabled in the simulation parameters.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The symmetry planes.
+        :rtype: List[SymmetryPlane]
+        """
+
+        if not data_handler.sim_params().symmetry:
+            return list()
+
+        return SymmetryPlane.detect(data_handler)
+
+    def stretching_box(self, data_handler: DataHandler) -> np.ndarray:
+        """Method to return the box the open boundary shell is wrapped around in the coordinates of the mesh.
 
-        self.ng_mesh = NGMesh(data_handler)
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return np.asarray(data_handler.sim_params().boundaries, dtype=float)
+
+    def volume(self) -> Union[ng.CoefficientFunction, float]:
+        """Method to return the ratio of the physical to the mesh volume element.
+
+        :return: The volume element.
+        :rtype: Union[ngsolve.CoefficientFunction, float]
+        """
+
+        return self.stretching.det if self.stretching is not None else 1
+
+    def physical_curl(self, u: ng.CoefficientFunction) -> ng.CoefficientFunction:
+        """Method to return the curl of a vector field with respect to the physical coordinates.
+
+        :param u: Vector field on the mesh.
+        :type u: ngsolve.CoefficientFunction
+
+        :return: The physical curl.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        return self.stretching.curl(ng.curl(u)) if self.stretching is not None else ng.curl(u)
+
+    def physical_grad(self, u: ng.CoefficientFunction) -> ng.CoefficientFunction:
+        """Method to return the gradient of a scalar field with respect to the physical coordinates.
+
+        :param u: Scalar field on the mesh.
+        :type u: ngsolve.CoefficientFunction
+
+        :return: The physical gradient.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        return self.stretching.grad(ng.grad(u)) if self.stretching is not None else ng.grad(u)
+
+    @staticmethod
+    def uniform_field(data_handler: DataHandler) -> np.ndarray:
+        """Method to return the sum of the uniform magnetic field strengths in the scenery.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The field strength.
+        :rtype: numpy.ndarray
+        """
+
+        return np.sum([np.asarray(field.h_vec, dtype=float) for field in data_handler.uni_fields()] + [np.zeros(3)],
+                      axis=0)
 
     def create_field(self, data_handler: DataHandler, t: float) -> None:
         """Method to initialize and calculate the magnetic field based on the given parameters.
@@ -58,20 +245,125 @@ class NGField(MagneticField, ABC):
 
         """
 
+        scene = self.global_scene(data_handler) if self.submodels else data_handler
+
+        # The gears may only be symmetric at the time stamps of the simulation.
+        for plane in self.symmetry:
+            [symmetric, reason] = plane.components_symmetric(scene, [t])
+            if not symmetric:
+                print(reason + " Continuing with the full scenery.")
+                self.symmetry = list()
+                self.ng_mesh.close()
+                self.ng_mesh = self.create_mesh(scene)
+                self.system_key = tuple()
+                break
+
         # Update the mesh
-        self.ng_mesh.update(data_handler, t)
+        with self.telemetry.stage("mesh update"):
+            self.ng_mesh.update(scene, t)
+
+        self.solve(scene)
+
+        # Refinements are kept while the mesh is rotated, so the adaptive loop only runs on freshly built meshes.
+        if scene.sim_params().adaptive_tol > 0 and self.ng_mesh.rebuilt:
+            self.adapt(scene)
+
+        # The fine local fields around the sensors take their boundary values from the global field. They share its
+        # telemetry, so their stages are timed within the step. The statistics of the step stay those of the global
+        # field, the submodels are summarized separately.
+        statistics = dict(self.telemetry.steps[-1]) if self.telemetry.steps else None
+        for num, (sensor, box, submodel) in enumerate(zip(data_handler.sensors(), self.boxes, self.submodels)):
+            with self.telemetry.stage("submodel " + str(num)):
+                submodel.create_field(self.local_scene(data_handler, sensor, box), t)
+        if self.submodels:
+            if statistics is not None:
+                self.telemetry.steps[-1] = statistics
+            self.telemetry.record(submodel_ndof=sum(submodel.fes.ndof for submodel in self.submodels),
+                                  submodel_iterations=sum(submodel.iterations[-1] for submodel in self.submodels))
+
+    def solve(self, data_handler: DataHandler) -> None:
+        """Method to calculate the magnetic field on the current mesh.
 
-        # Declare finite element space.
-        fes = ng.HCurl(self.ng_mesh.mesh, order=3, nograds=True)
-        # order:     Polynomial degree on each mesh element.
-        # dirichlet: dirichlet="outer": Dirichlet boundary conditions on specified ("outer") elements.
-        # nograds:   Remove higher order gradients of H1 basis functions from HCurl FESpace.
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        """
 
-        # Return a tuple of trial and test-function
-        u, v = fes.TnT()
+        [mur_dict, mag_dict] = self.materials(data_handler)
 
-        # Store the left hand side of the PDE.
-        a = ng.BilinearForm(fes)
+        # The left hand side only depends on the mesh and the materials. As long as both are unchanged, the assembled
+        # system and its factorization or preconditioner are reused and only the right hand side is rebuilt.
+        system_key = (self.ng_mesh.version, tuple(sorted(mur_dict.items())))
+        if system_key != self.system_key:
+            self.assemble_system(mur_dict)
+            self.system_key = system_key
+
+        self.mag = self.ng_mesh.mesh.MaterialCF(mag_dict, default=(0, 0, 0))
+
+        f = self.linear_form(data_handler)
+
+        # Assemble linear form
+        with self.telemetry.stage("rhs assembly"), ng.TaskManager():
+            f.Assemble()
+
+        # GridFunction(): A field approximated in some finite element space.
+        self.gfu = ng.GridFunction(self.fes)
+
+        # Submodel: Impose the potential of the global field on the outer boundary and solve for the remaining part with
+        # homogeneous boundary values.
+        if self.boundary_field is not None:
+            with self.telemetry.stage("boundary transfer"), ng.TaskManager():
+                self.gfu.Set(self.boundary_field.gfu, ng.BND, definedon=self.ng_mesh.mesh.Boundaries("outer"))
+                f.vec.data -= self.a.mat * self.gfu.vec
+        free_dofs = ng.Projector(self.fes.FreeDofs(), True)
+        f.vec.data = free_dofs * f.vec
+        sol = self.gfu.vec.CreateVector()
+        sol[:] = 0
+
+        # Return solution vector.
+        with self.telemetry.stage("solve"), ng.TaskManager():
+            if self.direct:
+                sol.data = self.solver * f.vec
+                self.iterations.append(0)
+                self.recycle_dims.append(0)
+                residual = f.vec.CreateVector()
+                residual.data = free_dofs * (f.vec - self.a.mat * sol)
+                final_residual = residual.Norm() / f.vec.Norm() if f.vec.Norm() > 0 else 0.0
+            elif self.recycler is not None:
+                self.recycle_dims.append(self.recycler.dim())
+                self.iterations.append(self.recycler.solve(mat=self.a.mat, pre=self.solver, rhs=f.vec,
+                                                           sol=sol, tol=data_handler.sim_params().tol,
+                                                           maxsteps=data_handler.sim_params().maxit))
+                final_residual = self.recycler.residual
+            else:
+                cg = ng.krylovspace.CGSolver(mat=self.a.mat, pre=self.solver, tol=data_handler.sim_params().tol,
+                                             maxiter=data_handler.sim_params().maxit)
+                cg.Solve(rhs=f.vec, sol=sol)
+                self.iterations.append(cg.GetSteps())
+                self.recycle_dims.append(0)
+                final_residual = cg.residuals[-1] / cg.residuals[0] if cg.residuals and cg.residuals[0] > 0 else 0.0
+                # mat        : Left hand side of the equation.
+                # pre        : Preconditioner.
+                # tol        : Tolerance of the residuum. CG stops if tolerance is reached.
+                # maxiter    : Number of maximal steps fo CG. If the maximal number is reached before the tolerance is
+                #              reached CG stops.
+                # rhs        : Right hand side of the equation.
+                # sol        : Vector the solution is written to.
+            self.gfu.vec.data += sol
+        self.telemetry.record(ndof=self.fes.ndof, iterations=self.iterations[-1], residual=final_residual,
+                              recycle_dim=self.recycle_dims[-1], direct=int(self.direct))
+
+        self.set_fields()
+
+    @staticmethod
+    def materials(data_handler: DataHandler) -> Tuple[Dict[str, float], Dict[str, tuple]]:
+        """Method to collect the material parameters of the magnets and components in the mesh.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Relative permeability and magnetisation of each material.
+        :rtype: Tuple[Dict[str, float], Dict[str, tuple]]
+        """
 
         # Store the material specific mu_r in a dict.
         mur_dict = {}
@@ -79,54 +371,412 @@ class NGField(MagneticField, ABC):
             mur_dict["magnet" + str(num)] = magnet.mu_r
         for num, component in enumerate(data_handler.components()):
             mur_dict["iron" + str(num)] = component.mu_r
-        self.mur = self.ng_mesh.mesh.MaterialCF(mur_dict, default=1)
-
-        # Define the left side of the partial differential equation (PDE)
-        a += 1 / (self.mu0 * self.mur) * ng.curl(u) * ng.curl(v) * ng.dx + 1e-8 / (
-                    self.mu0 * self.mur) * u * v * ng.dx  # 1e-8...  -> regularization term
-
-        # Preconditioner: Reshapes the system of equations in such a way that better conditions are created, but the
-        # solution remains the same
-        c = ng.Preconditioner(a, "bddc")
-
-        # Store the right hand side of the PDE.
-        f = ng.LinearForm(fes)
 
         # Store the magnetisation of the particular elements in the simulation in a dict.
         mag_dict = {}
         for num, magnet in enumerate(data_handler.physical_magnets()):
             mag_dict["magnet" + str(num)] = tuple(magnet.m_vec)
-        self.mag = self.ng_mesh.mesh.MaterialCF(mag_dict, default=(0, 0, 0))
+
+        return mur_dict, mag_dict
+
+    def linear_form(self, data_handler: DataHandler) -> ng.LinearForm:
+        """Method to define the right hand side of the PDE, i.e. the sources of the magnetisation and the uniform
+            fields.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The linear form, not yet assembled.
+        :rtype: ngsolve.LinearForm
+        """
+
+        v = self.fes.TestFunction()
+
+        # The flux density of the uniform fields is known, only the remaining field is solved for. Its sources are the
+        # magnetisation and the uniform fields magnetising the magnetic materials, so they vanish in air.
+        self.h_uni = ng.CoefficientFunction(tuple(self.uniform_field(data_handler)))
+
+        # Store the right hand side of the PDE.
+        f = ng.LinearForm(self.fes)
 
         # Define the right side of the pde
         for num, _ in enumerate(data_handler.physical_magnets()):
-            f += self.mag * ng.curl(v) * ng.dx("magnet" + str(num))
-        for field in data_handler.uni_fields():
-            f += ng.CoefficientFunction(tuple(field.h_vec)) * ng.curl(v) * ng.dx
+            f += self.mag * self.physical_curl(v) * self.volume() * ng.dx("magnet" + str(num))
+        if data_handler.uni_fields():
+            f += (1 - 1 / self.mur) * self.h_uni * self.physical_curl(v) * self.volume() * ng.dx
+
+        return f
+
+    def set_fields(self) -> None:
+        """Method to derive the magnetic flux density and field strength from the solved vector potential."""
+
+        # Create B- and H-field
+        self.b_field: ng.comp.CoefficientFunction = self.physical_curl(self.gfu) + self.mu0 * self.h_uni
+        self.h_field: ng.fem.CoefficientFunction = self.b_field / (self.mu0 * self.mur) - self.mag
 
-        # Assemble linear and bi-linear form
+    def adapt(self, data_handler: DataHandler) -> None:
+        """Goal oriented adaptive mesh refinement. The elements contributing most to the error estimate weighted by
+            their distance to the sampling points of the sensors are refined and the field is recalculated until the
+            quantities of interest of all sensors change less than adaptive_tol relative to their norm or
+            adaptive_maxit refinements are reached.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        """
+
+        sensors = data_handler.sensors()
+        if not sensors:
+            return
+
+        points = np.unique(self.reflect(np.vstack([sensor.sampling_points() for sensor in sensors]))[0], axis=0)
+        quantities = np.concatenate([sensor.quantities(self) for sensor in sensors])
+
+        for num in range(data_handler.sim_params().adaptive_maxit):
+            with self.telemetry.stage("error estimation"):
+                indicators = self.error_estimate() * self.goal_weights(points)
+            with self.telemetry.stage("mesh refinement"):
+                self.ng_mesh.refine(self.mark(indicators))
+
+            self.solve(data_handler)
+
+            new_quantities = np.concatenate([sensor.quantities(self) for sensor in sensors])
+            norm = np.linalg.norm(new_quantities)
+            change = np.linalg.norm(new_quantities - quantities) / norm if norm > 0 else 0.0
+            quantities = new_quantities
+
+            print("Refinement " + str(num + 1) + ": " + str(self.ng_mesh.mesh.ne) + " Elements, Change: " +
+                  str(change))
+            self.telemetry.record(refinements=num + 1, refinement_change=change, elements=self.ng_mesh.mesh.ne)
+            if change < data_handler.sim_params().adaptive_tol:
+                break
+
+    def error_estimate(self) -> np.ndarray:
+        """Zienkiewicz-Zhu type error estimator. The tangential component of the magnetic field strength is continuous
+            in the exact solution, but not in the discrete one. The field strength is therefore interpolated into a
+            tangentially continuous HCurl space and the energy of the difference is integrated on each element.
+
+        :return: Error indicator of each volume element.
+        :rtype: numpy.ndarray
+        """
+
+        mesh = self.ng_mesh.mesh
+        h_recovered = ng.GridFunction(ng.HCurl(mesh, order=2))
         with ng.TaskManager():
-            a.Assemble()
-            f.Assemble()
+            h_recovered.Set(self.h_field)
+            indicators = ng.Integrate(self.mu0 * self.mur * (self.h_field - h_recovered) ** 2, mesh, ng.VOL,
+                                      element_wise=True)
 
-        # GridFunction(): A field approximated in some finite element space.
-        self.gfu = ng.GridFunction(fes)
+        return indicators.NumPy().copy()
+
+    def goal_weights(self, points: np.ndarray) -> np.ndarray:
+        """Weights the elements by their influence on the field at the sampling points of the sensors. The weight
+            decays with the third power of the distance relative to the element size, like the field of a dipole.
+
+        :param points: Array of shape (n, 3) with the sampling points of the sensors.
+        :type points: numpy.ndarray
+
+        :return: Weight of each volume element between 0 and 1.
+        :rtype: numpy.ndarray
+        """
+
+        coordinates = self.ng_mesh.mesh.ngmesh.Coordinates()
+        vertices = coordinates[self.ng_mesh.mesh.ngmesh.Elements3D().NumPy()['nodes'] - 1]
+        centers = vertices.mean(axis=1)
+        edges = vertices[:, 1:, :] - vertices[:, :1, :]
+        # Edge length of a regular tetrahedron with the same volume.
+        size = np.cbrt(np.abs(np.linalg.det(edges)) * np.sqrt(2))
+
+        distance = np.empty(len(centers))
+        chunk = max(1, 2 ** 22 // len(points))
+        for start in range(0, len(centers), chunk):
+            distance[start:start + chunk] = np.min(np.linalg.norm(
+                centers[start:start + chunk, np.newaxis, :] - points[np.newaxis, :, :], axis=2), axis=1)
+
+        return (size / (size + distance)) ** 3
+
+    @staticmethod
+    def mark(indicators: np.ndarray, theta: float = 0.5) -> np.ndarray:
+        """Doerfler marking: Selects the smallest set of elements whose indicators sum up to the fraction theta of the
+            total estimated error.
+
+        :param indicators: Error indicator of each volume element.
+        :type indicators: numpy.ndarray
+        :param theta: Fraction of the total error covered by the marked elements.
+        :type theta: float
+
+        :return: Refinement flag of each volume element.
+        :rtype: numpy.ndarray
+        """
+
+        order = np.argsort(indicators)[::-1]
+        cumulative = np.cumsum(indicators[order])
+        flags = np.zeros(len(indicators), dtype=bool)
+        flags[order[:np.searchsorted(cumulative, theta * cumulative[-1]) + 1]] = True
+
+        return flags
+
+    def assemble_system(self, mur_dict: Dict[str, float]) -> None:
+        """Method to declare the finite element space on the current mesh, assemble the left hand side of the PDE and
+            prepare its factorization or preconditioner. If the estimated memory of the factorization exceeds the
+            memory left to the process, the system is solved iteratively instead.
+
+        :param mur_dict: Relative permeability of each material in the mesh.
+        :type mur_dict: Dict[str, float]
+        """
+
+        self.fes = self.finite_element_space()
+
+        self.mur = self.ng_mesh.mesh.MaterialCF(mur_dict, default=1)
+
+        # The preconditioner is set up during the assembly of the bilinear form.
+        with self.telemetry.stage("assembly" if self.direct else "assembly + preconditioner"):
+            [self.a, c] = self.bilinear_form(preconditioner=not self.direct)
+
+        if self.direct:
+            [fits, required] = self.factorization_fits(self.a)
+            if fits:
+                with self.telemetry.stage("factorization"), ng.TaskManager():
+                    self.solver = self.a.mat.Inverse(self.fes.FreeDofs(), inverse="sparsecholesky")
+                return
+            print("Sparse factorization requires approx. " + str(round(required)) +
+                  " MB and exceeds the process memory. Falling back to the iterative solver.")
+            self.direct = False
+            with self.telemetry.stage("assembly + preconditioner"):
+                [self.a, c] = self.bilinear_form(preconditioner=True)
+
+        self.solver = c.mat
+
+    def finite_element_space(self) -> ng.FESpace:
+        """Method to declare the finite element space of the vector potential on the current mesh. Submodels take
+            their boundary values from the global field.
+
+        :return: The finite element space.
+        :rtype: ngsolve.FESpace
+        """
+
+        # The flux density is tangential on symmetry planes of an even field, i.e. n x A = 0. On the planes of an odd
+        # field the natural boundary condition n x H = 0 holds.
+        dirichlet = [plane.bc for plane in self.symmetry if not plane.odd]
+        if self.boundary_field is not None:
+            dirichlet.append("outer")
+
+        # Declare finite element space.
+        # order:     Polynomial degree on each mesh element.
+        # dirichlet: dirichlet="outer": Dirichlet boundary conditions on specified ("outer") elements.
+        # nograds:   Remove higher order gradients of H1 basis functions from HCurl FESpace.
+        return ng.HCurl(self.ng_mesh.mesh, order=3, nograds=True, dirichlet="|".join(dirichlet))
+
+    def bilinear_form(self, preconditioner: bool) -> Tuple[ng.BilinearForm, Union[ng.Preconditioner, None]]:
+        """Method to define and assemble the left hand side of the PDE.
+
+        :param preconditioner: Register a BDDC preconditioner with the bilinear form before assembling.
+        :type preconditioner: bool
+
+        :return: The assembled bilinear form and its preconditioner if requested.
+        :rtype: Tuple[ngsolve.BilinearForm, Union[ngsolve.Preconditioner, None]]
+        """
+
+        # Return a tuple of trial and test-function
+        u, v = self.fes.TnT()
+
+        # Store the left hand side of the PDE.
+        a = ng.BilinearForm(self.fes)
+
+        # Define the left side of the partial differential equation (PDE)
+        a += 1 / (self.mu0 * self.mur) * self.physical_curl(u) * self.physical_curl(v) * self.volume() * ng.dx \
+            + 1e-8 / (self.mu0 * self.mur) * u * v * ng.dx  # 1e-8...  -> regularization term
+
+        # Preconditioner: Reshapes the system of equations in such a way that better conditions are created, but the
+        # solution remains the same
+        c = ng.Preconditioner(a, "bddc") if preconditioner else None
 
-        # Return solution vector.
         with ng.TaskManager():
-            ng.solvers.CG(sol=self.gfu.vec, rhs=f.vec, mat=a.mat, pre=c.mat, tol=data_handler.sim_params().tol,
-                          maxsteps=data_handler.sim_params().maxit)
-            # sol        : Start vector for CG method. Gets overwritten by the solution vector.
-            # rhs        : Right hand side of the equation.
-            # mat        : Left hand side of the equation.
-            # pre        : Preconditioner.
-            # tol        : Tolerance of the residuum. CG stops if tolerance is reached.
-            # maxsteps   : Number of maximal steps fo CG. If the maximal number is reached before the tolerance is
-            #              reached CG stops.
+            a.Assemble()
 
-        # Create B- and H-field
-        self.b_field: ng.comp.CoefficientFunction = ng.curl(self.gfu)
-        self.h_field: ng.fem.CoefficientFunction = self.b_field / (self.mu0 * self.mur) - self.mag
+        return a, c
+
+    def factorization_fits(self, a: ng.BilinearForm) -> Tuple[bool, float]:
+        """Estimates the memory of the sparse Cholesky factorization of the assembled system and compares it to the
+            memory left to the process.
+
+        :param a: Assembled bilinear form.
+        :type a: ngsolve.BilinearForm
+
+        :return: Whether the factorization fits into the memory limit and the estimated memory in MB.
+        :rtype: Tuple[bool, float]
+        """
+
+        required = a.mat.nze * self.factor_bytes_per_nze / 1024 ** 2
+        if self.max_memory is None:
+            return True, required
+
+        available = self.max_memory - psutil.Process(os.getpid()).memory_info().rss / 1024 ** 2
+        return required < available, required
+
+    @staticmethod
+    def submodel_box(data_handler: DataHandler, sensor: any) -> np.ndarray:
+        """Method to determine the boundaries of the submodel of a sensor: The bounding box of its sampling points
+            extended by the submodel margin and clipped at the simulation boundaries.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param sensor: Sensor or field recorder.
+        :type sensor: Union[Sensor, FieldRecorder]
+
+        :return: Lower and upper corner of the box.
+        :rtype: numpy.ndarray
+        """
+
+        points = np.asarray(sensor.sampling_points(), dtype=float).reshape(-1, 3)
+        margin = data_handler.sim_params().submodel_margin
+        boundaries = np.asarray(data_handler.sim_params().boundaries, dtype=float)
+
+        return np.array([np.maximum(points.min(axis=0) - margin, boundaries[0]),
+                         np.minimum(points.max(axis=0) + margin, boundaries[1])])
+
+    @staticmethod
+    def global_scene(data_handler: DataHandler) -> DataHandler:
+        """Method to create the scenery of the coarse global field, i.e. all objects except the sensors. Without the
+            sensors, the teeth close to them would be culled, so the global field keeps all teeth.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Data handler sharing the objects of the scenery without the sensors.
+        :rtype: DataHandler
+        """
+
+        sensors = data_handler.sensors()
+        objects = [obj for obj in data_handler.objects if not any(obj is sensor for sensor in sensors)]
+        if data_handler.sim_params().tooth_culling > 0:
+            sim_params = copy.copy(data_handler.sim_params())
+            sim_params.tooth_culling = 0.0
+            objects = [sim_params if obj is data_handler.sim_params() else obj for obj in objects]
+
+        return DataHandler(objects, data_handler.filepath)
+
+    @staticmethod
+    def local_scene(data_handler: DataHandler, sensor: any, box: np.ndarray) -> DataHandler:
+        """Method to create the scenery of a submodel: The objects of the scenery and the sensor itself, bounded by
+            the box of the submodel. Gears are cropped by the box and can not be rotated in the mesh, so the submodel
+            mesh is rebuilt whenever they move.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param sensor: Sensor or field recorder of the submodel.
+        :type sensor: Union[Sensor, FieldRecorder]
+        :param box: Boundaries of the submodel.
+        :type box: numpy.ndarray
+
+        :return: Data handler of the submodel.
+        :rtype: DataHandler
+        """
+
+        sim_params = copy.copy(data_handler.sim_params())
+        sim_params.boundaries = box
+        sim_params.submodel_margin = 0.0
+        sim_params.shell_thickness = 0.0
+
+        objects: List[any] = [sim_params]
+        sensors = data_handler.sensors()
+        for obj in data_handler.objects:
+            if obj is data_handler.sim_params() or (any(obj is other for other in sensors) and obj is not sensor):
+                continue
+            if type(obj).__name__ == "Gear":
+                obj = copy.copy(obj)
+                obj.rotate_mesh = False
+            objects.append(obj)
+
+        return DataHandler(objects, data_handler.filepath)
+
+    def local_field(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> NGField:
+        """Method to select the field the positions are evaluated on: The first submodel containing all of them, the
+            global field otherwise.
+
+        :param x: x grid.
+        :type x: numpy.ndarray
+        :param y: y grid.
+        :type y: numpy.ndarray
+        :param z: z grid.
+        :type z: numpy.ndarray
+
+        :return: Field covering the positions.
+        :rtype: NGField
+        """
+
+        points = np.column_stack([np.ravel(x), np.ravel(y), np.ravel(z)])
+        for box, submodel in zip(self.boxes, self.submodels):
+            if np.all(points >= box[0]) and np.all(points <= box[1]):
+                return submodel
+
+        return self
+
+    def reflect(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Method to map positions on the far side of the symmetry planes to their mirror images in the simulated
+            part of the scenery.
+
+        :param points: Array of shape (n, 3) with the positions.
+        :type points: numpy.ndarray
+
+        :return: The mapped positions and the factors of shape (n, 3) to mirror the field vectors back.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        factors = np.ones(np.shape(points))
+        for plane in self.symmetry:
+            [points, plane_factors] = plane.reflect(points)
+            factors *= plane_factors
+
+        return points, factors
+
+    def snapshot(self) -> List[Tuple[msh.Mesh, np.ndarray, List[SymmetryPlane]]]:
+        """Method to collect the state of the solved field needed to evaluate it again without solving.
+
+        :return: Netgen mesh, coefficient vector of the potential and symmetry planes of the field and of each
+            submodel.
+        :rtype: List[Tuple[netgen.meshing.Mesh, numpy.ndarray, List[SymmetryPlane]]]
+        """
+
+        return [(field.ng_mesh.mesh.ngmesh, field.gfu.vec.FV().NumPy().copy(), list(field.symmetry))
+                for field in [self] + self.submodels]
+
+    def restore(self, data_handler: DataHandler,
+                states: List[Tuple[msh.Mesh, np.ndarray, List[SymmetryPlane]]]) -> None:
+        """Method to set the field to a state collected by snapshot instead of meshing and solving. The field has to
+            be created for the scenery the state was collected from.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param states: Netgen mesh, coefficient vector of the potential and symmetry planes of the field and of each
+            submodel.
+        :type states: List[Tuple[netgen.meshing.Mesh, numpy.ndarray, List[SymmetryPlane]]]
+        """
+
+        scene = self.global_scene(data_handler) if self.submodels else data_handler
+
+        [netgen_mesh, vector, self.symmetry] = states[0]
+        self.ng_mesh.mesh = ng.Mesh(netgen_mesh)
+        self.system_key = tuple()
+
+        # The coefficient functions are rebuilt like in solve, only the potential is taken from the state.
+        self.fes = self.finite_element_space()
+        [mur_dict, mag_dict] = self.materials(scene)
+        self.mur = self.ng_mesh.mesh.MaterialCF(mur_dict, default=1)
+        self.mag = self.ng_mesh.mesh.MaterialCF(mag_dict, default=(0, 0, 0))
+        self.linear_form(scene)
+        self.gfu = ng.GridFunction(self.fes)
+        self.gfu.vec.FV().NumPy()[:] = vector
+        self.set_fields()
+
+        for sensor, box, submodel, state in zip(data_handler.sensors(), self.boxes, self.submodels, states[1:]):
+            submodel.restore(self.local_scene(data_handler, sensor, box), [state])
+
+    def close(self) -> None:
+        """Method to stop the mesh pipelines of the field and its submodels."""
+
+        self.ng_mesh.close()
+        for submodel in self.submodels:
+            submodel.close()
 
     def draw(self) -> None:
         """Method to draw the magnetic field strength and the magnetic flux density in the Netgen gui."""
@@ -152,7 +802,10 @@ class NGField(MagneticField, ABC):
         if x.shape != y.shape or x.shape != z.shape or y.shape != z.shape:
             return None
         else:
-            return self.h_field(self.ng_mesh.mesh(x.flatten(), y.flatten(), z.flatten())).reshape(x.shape + (3,))
+            field = self.local_field(x, y, z)
+            [points, factors] = self.reflect(np.column_stack([np.ravel(x), np.ravel(y), np.ravel(z)]))
+            return (field.h_field(field.ng_mesh.mesh(points[:, 0], points[:, 1], points[:, 2])) * factors).reshape(
+                x.shape + (3,))
 
     def get_b_field(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Union[np.ndarray, None]:
         """Method to extract the magnetic flux density on positions defined by a grid on x, y and z.
@@ -171,4 +824,7 @@ class NGField(MagneticField, ABC):
         if x.shape != y.shape or x.shape != z.shape or y.shape != z.shape:
             return None
         else:
-            return self.b_field(self.ng_mesh.mesh(x.flatten(), y.flatten(), z.flatten())).reshape(x.shape+(3,))
+            field = self.local_field(x, y, z)
+            [points, factors] = self.reflect(np.column_stack([np.ravel(x), np.ravel(y), np.ravel(z)]))
+            return (field.b_field(field.ng_mesh.mesh(points[:, 0], points[:, 1], points[:, 2])) * factors).reshape(
+                x.shape + (3,))
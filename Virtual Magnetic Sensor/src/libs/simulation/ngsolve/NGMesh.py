@@ -1,13 +1,19 @@
+import copy
+import sys
 import ngsolve as ng
 import netgen.meshing as msh
-from math import sqrt
 import numpy as np
 from typing import Union, List, Tuple, Dict
 from pyngcore import TaskManager
 
 from libs.DataHandler import DataHandler
+from libs.simulation.Telemetry import Telemetry
 
 from libs.simulation.ngsolve.CSGeometry import CSGeometry
+from libs.simulation.ngsolve.MeshMotion import MeshMotion
+from libs.simulation.ngsolve.MeshPipeline import MeshPipeline
+from libs.simulation.ngsolve.OCCGeometry import OCCGeometry
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
 
 
 class NGMesh:
@@ -18,28 +24,106 @@ class NGMesh:
     :type data_handler: DataHandler
     :param mp: Meshing parameters.
     :type mp: netgen.meshing.MeshingParameters
-    :param netgen_mesh: Full mesh in Netgen.
+    :param netgen_mesh: Full mesh in Netgen, shared with the Ngsolve mesh.
     :type netgen_mesh: netgen.meshing.Mesh
     :param mesh_badness: Initial badness of unrotated automatically generated netgen mesh.
     :type mesh_badness: float
+    :param current_badness: Badness of the current mesh. While the mesh is moved without optimization, it is updated
+        from the badness of the elements changed by the motion.
+    :type current_badness: float
     :param mesh:  Full mesh converted to Ngsolve.
     :type mesh: ngsolve.Mesh
     :param init_mesh_t: Time stamp of the frame the mesh got rebuilt.
     :type init_mesh_t: float
+    :param init_state: Motion states of the time dependent components the mesh got rebuilt for.
+    :type init_state: tuple
+    :param version: Counter incremented whenever the mesh is rebuilt or its points are moved. Used by the field to
+        decide whether assembled systems and factorizations can be reused.
+    :type version: int
+    :param geometry_state: Motion states of the time dependent components the current mesh was generated for.
+    :type geometry_state: tuple
+    :param telemetry: Collects the durations of the mesh operations.
+    :type telemetry: Telemetry
+    :param rebuilt: True if the mesh got rebuilt during the last update.
+    :type rebuilt: bool
+    :param crop: Clip the bodies at the simulation boundaries when building the geometry. The meshes of the components
+        are not moved in this case, since the cropped bodies end on the boundaries.
+    :type crop: bool
+    :param symmetry: Symmetry planes the geometry is clipped at. The meshes of the components are not moved in this
+        case, since the motion would move the nodes off the planes.
+    :type symmetry: List[SymmetryPlane]
+    :param pipeline: Generates the meshes of upcoming time steps in separate processes if enabled in the simulation
+        parameters, None otherwise.
+    :type pipeline: Union[MeshPipeline, None]
+    :param times: Time stamps of the steps in the order they are simulated, e.g. the angles of a Fourier
+        reconstruction. None for the time stamps of the simulation parameters.
+    :type times: Union[List[float], None]
     """
 
     data_handler: DataHandler
     mp: msh.MeshingParameters
     mesh_badness: float
+    current_badness: float
     netgen_mesh: msh.Mesh
     mesh: ng.Mesh
     init_mesh_t: float
+    init_state: tuple
+    version: int
+    geometry_state: tuple
+    telemetry: Telemetry
+    rebuilt: bool
+    crop: bool
+    symmetry: List[SymmetryPlane]
+    pipeline: Union[MeshPipeline, None]
+    times: Union[List[float], None]
+
+    # Moved meshes are optimized once their badness exceeds the initial badness by this factor. Below it, the
+    # optimization pass is skipped.
+    optimize_badness_factor = 1.05
 
     def __init__(self,
-                 data_handler: DataHandler) -> None:
+                 data_handler: DataHandler,
+                 telemetry: Union[Telemetry, None] = None,
+                 crop: bool = False,
+                 symmetry: Union[List[SymmetryPlane], None] = None,
+                 max_memory: Union[float, None] = None,
+                 times: Union[List[float], None] = None) -> None:
         """Constructor method."""
 
-        self.mp = msh.MeshingParameters(
+        self.mp = self.meshing_parameters(data_handler)
+        self.times = times
+
+        self.netgen_mesh = msh.Mesh()
+        self.mesh_badness = 0
+        self.current_badness = 0
+        self.mesh = ng.Mesh(self.netgen_mesh)
+        self.init_mesh_t = data_handler.sim_params().t0
+        self.init_state = tuple()
+        self.version = 0
+        self.geometry_state = tuple()
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        self.rebuilt = False
+        self.crop = crop
+        self.symmetry = symmetry if symmetry is not None else list()
+        # The pipelined meshes come without their geometry, which the adaptive refinement needs to place new points on
+        # curved surfaces.
+        if data_handler.sim_params().mesh_pipeline > 0 and data_handler.sim_params().adaptive_tol <= 0:
+            self.pipeline = MeshPipeline(data_handler.sim_params().mesh_pipeline, max_memory)
+        else:
+            self.pipeline = None
+
+    @staticmethod
+    def meshing_parameters(data_handler: DataHandler) -> msh.MeshingParameters:
+        """Method to create the meshing parameters of the scenery.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Meshing parameters.
+        :rtype: netgen.meshing.MeshingParameters
+        """
+
+        mp = msh.MeshingParameters(
             curvaturesafety=2,
             segmentsperedge=1,
             grading=0.3,
@@ -51,111 +135,253 @@ class NGMesh:
             optsteps3d=1,
             optimize3d="m"
         )
-        self.restrict_mesh(data_handler, self.mp)
+        NGMesh.restrict_mesh(data_handler, mp)
 
-        self.netgen_mesh = msh.Mesh()
-        self.mesh_badness = 0
-        self.mesh = ng.Mesh(self.netgen_mesh)
-        self.init_mesh_t = data_handler.sim_params().t0
+        return mp
 
     @staticmethod
-    def init_mesh(data_handler: DataHandler, mp: msh.MeshingParameters) -> List[Union[msh.Mesh, float]]:
-        """Method to initialize the full mesh and geometry.
+    def init_mesh(data_handler: DataHandler, mp: msh.MeshingParameters,
+                  telemetry: Union[Telemetry, None] = None, crop: bool = False,
+                  symmetry: Union[List[SymmetryPlane], None] = None) -> List[Union[msh.Mesh, float]]:
+        """Method to initialize the full mesh and geometry with the geometry backend chosen in the simulation
+            parameters.
 
         :param data_handler: Object of the Data class containing all simulation relevant data.
         :type data_handler: DataHandler
         :param mp: Meshing parameters.
         :type mp: netgen.mesh.MeshingParameters
+        :param telemetry: Collects the durations of geometry build and mesh generation.
+        :type telemetry: Union[Telemetry, None]
+        :param crop: Clip the bodies at the simulation boundaries.
+        :type crop: bool
+        :param symmetry: Symmetry planes the geometry is clipped at.
+        :type symmetry: Union[List[SymmetryPlane], None]
 
         :return: Full mesh and its badness.
         :rtype: List[Union[netgen.meshing.Mesh, float]]
         """
 
-        ng_geometry: CSGeometry = CSGeometry(data_handler)
-        with TaskManager():
-            net_mesh = ng_geometry.geometry.GenerateMesh(mp)
+        if telemetry is None:
+            telemetry = Telemetry()
+
+        options: Dict[str, float] = dict()
+        with telemetry.stage("geometry build"):
+            if data_handler.sim_params().geometry_backend == 1:
+                ng_geometry: Union[CSGeometry, OCCGeometry] = OCCGeometry(data_handler, crop, symmetry)
+                options = OCCGeometry.mesh_options
+            else:
+                ng_geometry: Union[CSGeometry, OCCGeometry] = CSGeometry(data_handler, crop, symmetry)
+        with telemetry.stage("mesh generation"), TaskManager():
+            net_mesh = ng_geometry.geometry.GenerateMesh(mp=mp, **options)
         init_badness = net_mesh.CalcTotalBadness(mp)
 
         return [net_mesh, init_badness]
 
     def update(self, data_handler: DataHandler, t: float) -> None:
-        """The method updates the mesh based on the current rotation angle of the gear theta. When possible, the gears
-            mesh gets rotated and optimized. If the badness of the rotated mesh exceeds a certain badness, the full mesh
-            gets rebuild.
+        """The method updates the mesh based on the current motion state of the components. When possible, the mesh
+            follows the moving components (see MeshMotion) and gets optimized once its badness grows by
+            optimize_badness_factor. If an element gets inverted, the badness of the moved mesh exceeds a certain
+            badness or a component moved beyond its limit since the last rebuild, the full mesh gets rebuild. If none
+            of the components moved since the last call, the mesh is kept as it is.
         """
 
-        temp_mesh = self.mesh.ngmesh.Copy()
-        rebuild_mesh = True
-
-        for num, obj in enumerate(data_handler.objects):
-            if type(obj).__name__ == "Gear":
-                if obj.rotate_mesh and temp_mesh.Points():
-                    [temp_mesh, rotated_badness] = self.rotate_gear_mesh(temp_mesh, self.mp, data_handler, num)
-                    print("Initial Badness: " + str(self.mesh_badness))
-                    print("Badness after Rotation: " + str(rotated_badness))
-                    print("Init Mesh T: " + str(self.init_mesh_t))
-                    print("T: " + str(t))
-
-                    if rotated_badness < self.mesh_badness * 1.1 and \
-                            obj.omega * t < obj.omega * self.init_mesh_t + obj.rotate_mesh_max_angle:
-                        rebuild_mesh = False
-            elif type(obj).__name__ == "GearRack":
-                rebuild_mesh = True
-                break
+        geometry_state = self.motion_state(data_handler)
+        if self.mesh.ngmesh.Points() and geometry_state == self.geometry_state:
+            self.rebuilt = False
+            return
+
+        # The mesh is moved in place. A rejected motion is always followed by a rebuild, so the previous mesh never
+        # has to be restored and is not copied.
+        net_mesh = self.mesh.ngmesh
+        rebuild_mesh = not net_mesh.Points() or bool(self.symmetry) or self.crop or \
+            not MeshMotion.supported(data_handler, geometry_state, self.init_state)
+
+        if not rebuild_mesh:
+            with self.telemetry.stage("mesh motion"):
+                [moved, moved_badness, optimized] = self.move_mesh(
+                    net_mesh, self.mp, data_handler, self.geometry_state, geometry_state, self.current_badness,
+                    self.mesh_badness * self.optimize_badness_factor)
+            self.telemetry.record(mesh_optimized=int(optimized))
+            print("Initial Badness: " + str(self.mesh_badness))
+            print("Badness after Motion: " + str(moved_badness))
+            print("Init Mesh T: " + str(self.init_mesh_t))
+            print("T: " + str(t))
+            rebuild_mesh = not moved or moved_badness >= self.mesh_badness * 1.1
+            self.current_badness = moved_badness
 
         if rebuild_mesh:
             print("-------> Rebuild Mesh")
-            [temp_mesh, self.mesh_badness] = self.init_mesh(data_handler, self.mp)
+            pipelined = None
+            if self.pipeline is not None:
+                with self.telemetry.stage("pipeline wait"):
+                    pipelined = self.pipeline.take(t, geometry_state)
+            if pipelined is not None:
+                [net_mesh, self.mesh_badness, records] = pipelined
+                self.telemetry.merge(records)
+            else:
+                [net_mesh, self.mesh_badness] = self.init_mesh(data_handler, self.mp, self.telemetry, self.crop,
+                                                               self.symmetry)
             print("New Badness: " + str(self.mesh_badness))
+            self.current_badness = self.mesh_badness
             self.init_mesh_t = t
+            self.init_state = geometry_state
+        self.telemetry.record(mesh_rebuilt=int(rebuild_mesh), mesh_badness=self.mesh_badness)
+
+        self.netgen_mesh = net_mesh
+        self.mesh = ng.Mesh(net_mesh)
+        self.version += 1
+        self.geometry_state = geometry_state
+        self.rebuilt = rebuild_mesh
 
-        self.netgen_mesh = temp_mesh.Copy()
-        self.mesh = ng.Mesh(temp_mesh)
+        # Only redraw if the Netgen gui has been loaded, e.g. by an interactive session.
+        if 'netgen.gui' in sys.modules:
+            ng.Redraw()
 
-        ng.Redraw()
+        self.prefetch(data_handler, t)
+
+    def prefetch(self, data_handler: DataHandler, t: float) -> None:
+        """Requests the meshes of the upcoming time steps in the pipeline, the ones following the current time stamp
+            in times. The motion of the components is followed from the current time step on. Meshes are requested for
+            the steps the mesh can not be moved to, assuming the mesh is rebuilt at each of them.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param t: Time stamp of the current time step.
+        :type t: float
+        """
+
+        if self.pipeline is None:
+            return
+        self.pipeline.discard(t)
+
+        times = np.asarray(self.times if self.times is not None else data_handler.sim_params().t, dtype=float)
+        step = int(np.argmin(np.abs(times - t)))
+        if step + 1 >= len(times):
+            return
+        scene = copy.deepcopy(data_handler)
+        [state, init_state] = [self.geometry_state, self.init_state]
+        for n in range(step + 1, min(step + self.pipeline.depth, len(times) - 1) + 1):
+            t_next = float(times[n])
+            for component in scene.components():
+                if hasattr(component, "update"):
+                    component.update(t_next)
+            [previous_state, state] = [state, self.motion_state(scene)]
+            movable = not (self.symmetry or self.crop) and MeshMotion.supported(scene, state, init_state)
+            if state == previous_state or movable:
+                continue
+            init_state = state
+            if not self.pipeline.request(t_next, state, NGMesh.generate_mesh, copy.deepcopy(scene), self.crop,
+                                         self.symmetry, n):
+                break
 
     @staticmethod
-    def rotate_gear_mesh(mesh: msh.Mesh, mp: msh.MeshingParameters, data_handler: DataHandler,
-                         idx: int) -> List[Union[msh.Mesh, float]]:
-        """Method to rotate the gear in the mesh by one time step and optimize it.
+    def generate_mesh(data_handler: DataHandler, crop: bool, symmetry: List[SymmetryPlane],
+                      step: int) -> List[Union[msh.Mesh, float, dict]]:
+        """Generates the mesh of a time step in a process of the pipeline.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data, with the components
+            at the time step.
+        :type data_handler: DataHandler
+        :param crop: Clip the bodies at the simulation boundaries.
+        :type crop: bool
+        :param symmetry: Symmetry planes the geometry is clipped at.
+        :type symmetry: List[SymmetryPlane]
+        :param step: Index of the time step.
+        :type step: int
+
+        :return: The mesh, its badness, the telemetry records of the generation and the peak memory of the process in
+            MB.
+        :rtype: List[Union[netgen.meshing.Mesh, float, dict]]
+        """
+
+        telemetry = Telemetry()
+        telemetry.step = step
+        [net_mesh, badness] = NGMesh.init_mesh(data_handler, NGMesh.meshing_parameters(data_handler), telemetry, crop,
+                                               symmetry)
+
+        return [net_mesh, badness, telemetry.records(), Telemetry.peak_rss()]
+
+    def close(self) -> None:
+        """Stops the processes of the pipeline. Called when the mesh is replaced or not used anymore."""
 
-        :param mesh: Netgen mesh.
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
+
+    def refine(self, flags: np.ndarray) -> None:
+        """Refines the marked volume elements of the mesh. The badness of the refined mesh becomes the reference for
+            the following mesh rotations.
+
+        :param flags: Refinement flag of each volume element.
+        :type flags: numpy.ndarray
+        """
+
+        for element, flag in zip(self.mesh.Elements(ng.VOL), flags):
+            self.mesh.SetRefinementFlag(element, bool(flag))
+        self.mesh.Refine()
+
+        self.netgen_mesh = self.mesh.ngmesh
+        self.mesh_badness = self.mesh.ngmesh.CalcTotalBadness(self.mp)
+        self.current_badness = self.mesh_badness
+        self.version += 1
+
+    @staticmethod
+    def motion_state(data_handler: DataHandler) -> tuple:
+        """Collects the time dependent states of the components defining their current position in the scenery.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Rotation angles and shifts of all components.
+        :rtype: tuple
+        """
+
+        states: List[tuple] = list()
+        for component in data_handler.components():
+            states.append((getattr(component, 'theta', None),
+                           tuple(np.ravel(getattr(component, 'shift', tuple())))))
+
+        return tuple(states)
+
+    @staticmethod
+    def move_mesh(mesh: msh.Mesh, mp: msh.MeshingParameters, data_handler: DataHandler, state: tuple,
+                  new_state: tuple, badness: float, optimize_badness: float) -> List[Union[bool, float]]:
+        """Method to move the mesh with the components from one motion state to another. The badness of the moved mesh
+            is updated from the elements changed by the motion only. The mesh is optimized if its badness reaches a
+            certain value, the badness is then evaluated on the full mesh.
+
+        :param mesh: Netgen mesh, moved in place.
         :type mesh: netgen.meshing.Mesh
         :param mp: Meshing parameters.
         :type mp: netgen.meshing.MeshingParameters
         :param data_handler: Object of the Data class containing all simulation relevant data.
         :type data_handler: DataHandler
-        :param idx: Index of the gear object in data_handler
-        :type idx: int
-
-        :return: The rotated and optimized mesh and its badness.
-        :rtype: List[union[netgen.meshing.Mesh, float]]
+        :param state: Motion states of the components the mesh was generated for.
+        :type state: tuple
+        :param new_state: Motion states of the components the mesh is moved to.
+        :type new_state: tuple
+        :param badness: Badness of the mesh before the motion.
+        :type badness: float
+        :param optimize_badness: Badness from which on the moved mesh is optimized.
+        :type optimize_badness: float
+
+        :return: Whether the mesh got moved, the badness of the moved mesh and whether it got optimized.
+        :rtype: List[Union[bool, float]]
         """
 
-        position = [data_handler.objects[idx].position(
-            data_handler.objects[idx].theta - data_handler.objects[idx].omega * data_handler.sim_params().dt),
-            data_handler.objects[idx].position(data_handler.objects[idx].theta)]
-        axis = [data_handler.objects[idx].rotation_axis(
-            data_handler.objects[idx].theta - data_handler.objects[idx].omega * data_handler.sim_params().dt),
-            data_handler.objects[idx].rotation_axis(data_handler.objects[idx].theta)]
-        trans_matrix = [data_handler.objects[idx].transformation_matrix(axis[0]),
-                        data_handler.objects[idx].transformation_matrix(axis[1])]
-
-        for p in mesh.Points():
-            p_canonical: np.ndarray = np.linalg.inv(trans_matrix[0]).dot(np.array([p[0], p[1], p[2]]) - position[0])
-            if abs(p_canonical[2]) <= data_handler.objects[idx].length/2 + 3e-2 and sqrt(
-                    pow(p_canonical[0], 2) + pow(p_canonical[1], 2)) <= (
-                    data_handler.objects[idx].diameter[1] + data_handler.objects[idx].tooth_height)/2 + 3e-2:
-                p_rotated: np.ndarray = data_handler.objects[idx].rotation_matrix(
-                    data_handler.objects[idx].omega*data_handler.sim_params().dt).dot(p_canonical)
-                p_new: np.ndarray = trans_matrix[1].dot(p_rotated)
-                p[0] = p_new[0] + position[1][0]
-                p[1] = p_new[1] + position[1][1]
-                p[2] = p_new[2] + position[1][2]
+        displacement = MeshMotion.displacement(mesh, data_handler, state, new_state)
+        band = MeshMotion.band(mesh, displacement)
+        band_badness = np.sum(NGMesh.element_badness(NGMesh.element_vertices(mesh, band)))
+
+        if not MeshMotion.apply(mesh, displacement):
+            return [False, float('inf'), False]
+
+        badness += np.sum(NGMesh.element_badness(NGMesh.element_vertices(mesh, band))) - band_badness
+        if badness < optimize_badness:
+            return [True, float(badness), False]
 
         mesh.OptimizeVolumeMesh(mp)
-        badness: float = mesh.CalcTotalBadness(mp)
-        return [mesh, badness]
+        return [True, mesh.CalcTotalBadness(mp), True]
 
     @staticmethod
     def restrict_mesh(data_handler: DataHandler, mp: msh.MeshingParameters) -> None:
@@ -410,7 +636,65 @@ class NGMesh:
         print("############################################################")
 
     @staticmethod
-    def aspect_ratio(mesh: msh.Mesh):
+    def element_vertices(mesh: msh.Mesh, elements: Union[np.ndarray, None] = None) -> np.ndarray:
+        """Collects the coordinates of the vertices of the volume elements of the mesh at once.
+
+        :param mesh: Netgen Mesh
+        :type mesh: netgen.meshing.Mesh
+        :param elements: Indices of the elements. None selects all elements.
+        :type elements: Union[numpy.ndarray, None]
+
+        :return: Array of shape (m, 4, 3) with the coordinates of the four vertices of each tetrahedron.
+        :rtype: numpy.ndarray
+        """
+
+        nodes = mesh.Elements3D().NumPy()['nodes'][:, :4] - 1
+        if elements is not None:
+            nodes = nodes[elements]
+
+        return mesh.Coordinates()[nodes]
+
+    @staticmethod
+    def edge_lengths(vertices: np.ndarray) -> np.ndarray:
+        """Calculates the edge lengths of tetrahedra. Opposite edges are three columns apart.
+
+        :param vertices: Array of shape (m, 4, 3) with the coordinates of the vertices of the tetrahedra.
+        :type vertices: numpy.ndarray
+
+        :return: Array of shape (m, 6) with the lengths of the edges 01, 02, 03, 23, 13 and 12.
+        :rtype: numpy.ndarray
+        """
+
+        first = [0, 0, 0, 2, 1, 1]
+        second = [1, 2, 3, 3, 3, 2]
+
+        return np.linalg.norm(vertices[:, first] - vertices[:, second], axis=2)
+
+    @staticmethod
+    def element_badness(vertices: np.ndarray) -> np.ndarray:
+        """Calculates the shape badness of tetrahedra as Netgen does. It is 1 for the regular tetrahedron and grows
+            for distorted ones, the sum over all elements of a mesh is the value of CalcTotalBadness.
+
+        :param vertices: Array of shape (m, 4, 3) with the coordinates of the vertices of the tetrahedra.
+        :type vertices: numpy.ndarray
+
+        :return: Badness of each tetrahedron, 1e24 for flat or inverted ones.
+        :rtype: numpy.ndarray
+        """
+
+        squares = np.sum(NGMesh.edge_lengths(vertices) ** 2, axis=1)
+        cubes = squares * np.sqrt(squares)
+        # Netgen orders the vertices of its tetrahedra such that the determinant is negative.
+        volumes = -np.linalg.det(vertices[:, 1:] - vertices[:, :1]) / 6
+
+        badness = np.full(len(vertices), 1e24)
+        valid = volumes > 1e-24 * cubes
+        badness[valid] = 0.0080187537 * cubes[valid] / volumes[valid]
+
+        return badness
+
+    @staticmethod
+    def aspect_ratio(mesh: msh.Mesh) -> float:
         """ Calculates the maximum aspect ratio of the edges in the cells of the mesh.
 
         :param mesh: Netgen Mesh
@@ -420,23 +704,12 @@ class NGMesh:
         :rtype: float
         """
 
-        ratios: List = list()
-
-        for el in mesh.Elements3D():
-            vertices: List = list()
-            for vertex in el.vertices:
-                vertices.append(np.array([mesh[vertex][0], mesh[vertex][1], mesh[vertex][2]]))
-            edge_lengths: List = list()
-            for i1, v1 in enumerate(vertices):
-                for i2, v2 in enumerate(vertices[i1+1:]):
-                    edge_lengths.append(np.linalg.norm(v1-v2))
+        edge_lengths = NGMesh.edge_lengths(NGMesh.element_vertices(mesh))
 
-            ratios.append(max(edge_lengths)/min(edge_lengths))
-
-        return max(ratios)
+        return float(np.max(np.max(edge_lengths, axis=1) / np.min(edge_lengths, axis=1)))
 
     @staticmethod
-    def skewness(mesh: msh.Mesh):
+    def skewness(mesh: msh.Mesh) -> float:
         """ Calculates the maximum skewness of the edges in the cells of the mesh.
 
         :param mesh: Netgen Mesh
@@ -446,41 +719,45 @@ class NGMesh:
         :rtype: float
         """
 
-        skew: List = list()
+        vertices = NGMesh.element_vertices(mesh)
+        edge_lengths = NGMesh.edge_lengths(vertices)
 
-        for el in mesh.Elements3D():
-            vertices_list: List = list()
-            for vertex in el.vertices:
-                vertices_list.append(np.array([mesh[vertex][0], mesh[vertex][1], mesh[vertex][2]]))
-            vertices = np.row_stack((vertices_list[0], vertices_list[1], vertices_list[2], vertices_list[3]))
+        delta_abs = np.abs(np.linalg.det(vertices[:, 1:] - vertices[:, :1]))
+        cell_size = delta_abs / 6
 
-            # hard coded because the order of the edges is important to calculate the radius
-            edge_lengths: List = list()
-            edge_lengths.append(np.linalg.norm(vertices_list[0] - vertices_list[1]))
-            edge_lengths.append(np.linalg.norm(vertices_list[0] - vertices_list[2]))
-            edge_lengths.append(np.linalg.norm(vertices_list[0] - vertices_list[3]))
-            edge_lengths.append(np.linalg.norm(vertices_list[2] - vertices_list[3]))
-            edge_lengths.append(np.linalg.norm(vertices_list[1] - vertices_list[3]))
-            edge_lengths.append(np.linalg.norm(vertices_list[1] - vertices_list[2]))
+        # The circumradius follows from the products of the lengths of opposite edges.
+        products = edge_lengths[:, :3] * edge_lengths[:, 3:]
+        p = np.sum(products, axis=1) / 2
+        radius = np.sqrt(p * np.prod(p[:, np.newaxis] - products, axis=1)) / delta_abs
 
-            matrix = np.column_stack((np.array([1, 1, 1, 1]), vertices))
+        optimal_size = (4 / np.sqrt(6) * radius) ** 3 * np.sqrt(2) / 12
 
-            delta_abs = np.linalg.norm(np.linalg.det(matrix))
+        return float(np.max((optimal_size - cell_size) / optimal_size))
 
-            cell_size = delta_abs/6
+    @staticmethod
+    def smoothness(mesh: msh.Mesh) -> float:
+        """ Calculates the maximum ratio of the volumes of neighbouring cells, i.e. cells sharing a face, in the mesh.
 
-            p = (edge_lengths[0]*edge_lengths[3] + edge_lengths[1]*edge_lengths[4] + edge_lengths[2]*edge_lengths[5])/2
+        :param mesh: Netgen Mesh
+        :type mesh: netgen.meshing.Mesh
 
-            radius = sqrt(p*(p-edge_lengths[0]*edge_lengths[3])*(p-edge_lengths[1]*edge_lengths[4])*(
-                    p-edge_lengths[2]*edge_lengths[5]))/delta_abs
+        :return: The maximum volume ratio of all pairs of neighbouring cells, 1 for a mesh without neighbours.
+        :rtype: float
+        """
 
-            optimal_size = pow(4/sqrt(6)*radius, 3)*sqrt(2)/12
+        vertices = NGMesh.element_vertices(mesh)
+        volumes = np.abs(np.linalg.det(vertices[:, 1:] - vertices[:, :1])) / 6
 
-            skew.append((optimal_size-cell_size)/optimal_size)
+        # Each face is identified by its sorted point indices, shared faces appear twice in a row after sorting.
+        nodes = mesh.Elements3D().NumPy()['nodes'][:, :4]
+        faces = np.sort(np.concatenate([np.delete(nodes, idx, axis=1) for idx in range(4)]), axis=1)
+        cells = np.tile(np.arange(len(nodes)), 4)
+        order = np.lexsort(faces.T[::-1])
+        [faces, cells] = [faces[order], cells[order]]
+        shared = np.all(faces[1:] == faces[:-1], axis=1)
+        if not np.any(shared):
+            return 1.0
 
-        return max(skew)
+        [first, second] = [volumes[cells[:-1][shared]], volumes[cells[1:][shared]]]
 
-    @staticmethod
-    def smoothness(mesh: msh.Mesh):
-        """To be implemented."""
-        pass
+        return float(np.max(np.maximum(first, second) / np.minimum(first, second)))
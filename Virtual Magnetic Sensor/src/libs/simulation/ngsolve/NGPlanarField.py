@@ -0,0 +1,200 @@
+import ngsolve as ng
+import numpy as np
+from typing import Union, Tuple, List
+
+from libs.simulation.ngsolve.NGField import NGField
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
+from libs.simulation.ngsolve.NGPlanarMesh import NGPlanarMesh
+
+from libs.DataHandler import DataHandler
+
+from libs.elements.components.Gear import Gear
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+
+
+class NGPlanarField(NGField):
+    """Implementation of MagneticField on the 2D cross-section of the scenery for fast design space exploration. All
+        bodies are assumed to be extruded infinitely along the z-axis, so the vector potential only has a z-component
+        Az and the flux density is B = (dAz/dy, -dAz/dx, 0). The problem is solved on an H1 space of the cross-section
+        with the same boundary condition as the 3D vector potential formulation. Positions are evaluated at their x-
+        and y-coordinates, the z-coordinate is ignored. End effects are neglected, so the results should be confirmed
+        in 3D, in particular if the air gaps are not small compared to the length of the gears and magnets.
+
+    :param ng_mesh: Object of the mesh class handling the 2D mesh of the cross-section.
+    :type ng_mesh: NGPlanarMesh
+    """
+
+    ng_mesh: NGPlanarMesh
+
+    @staticmethod
+    def validity(data_handler: DataHandler) -> Tuple[bool, str]:
+        """Checks whether the scenery can be reduced to its cross-section: All components are gears or evolvent gears
+            rotating about the z-axis without wobbling or eccentricity, all magnets are cuboid magnets rotated about
+            the z-axis only with a magnetisation and all uniform fields in the xy-plane, and the sampling points of all
+            sensors lie within the axial extent of every gear and magnet. Submodels and adaptive refinements are not
+            supported.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Whether the planar formulation is valid and the reason if not.
+        :rtype: Tuple[bool, str]
+        """
+
+        if data_handler.sim_params().submodel_margin > 0:
+            return False, "Submodels are not supported by the planar formulation."
+        if data_handler.sim_params().adaptive_tol > 0:
+            return False, "The adaptive refinement is not supported by the planar formulation."
+
+        z_axis = np.array([0.0, 0.0, 1.0])
+        z_ranges: List[Tuple[float, float]] = list()
+
+        for num, component in enumerate(data_handler.components()):
+            if isinstance(component, Gear):
+                axis = np.asarray(component.axis_0, dtype=float)
+                if not np.allclose(np.cross(axis / np.linalg.norm(axis), z_axis), 0.0):
+                    return False, "The rotation axis of component " + str(num) + " is not the z-axis."
+                if not np.isclose(component.wobble_angle, 0.0) or not np.isclose(component.eccentricity, 0.0):
+                    return False, "Component " + str(num) + " wobbles or rotates eccentrically."
+                z_ranges.append((component.pos[2] - component.length / 2, component.pos[2] + component.length / 2))
+            elif isinstance(component, EvoGear):
+                z_ranges.append((-component.length, 0.0))
+            else:
+                return False, "Components of type " + type(component).__name__ + \
+                    " are not supported by the planar formulation."
+
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            if not isinstance(magnet, CuboidMagnet):
+                return False, "Magnets of type " + type(magnet).__name__ + \
+                    " are not supported by the planar formulation."
+            if not np.isclose(abs(magnet.transformation_matrix[2, 2]), 1.0):
+                return False, "Magnet " + str(num) + " is not rotated about the z-axis only."
+            if not np.isclose(magnet.m_vec[2], 0.0, atol=1e-9 * np.linalg.norm(magnet.m_vec)):
+                return False, "The magnetisation of magnet " + str(num) + " is not in the xy-plane."
+            z_ranges.append((magnet.pos[2] - magnet.dim[2] / 2, magnet.pos[2] + magnet.dim[2] / 2))
+
+        for field in data_handler.uni_fields():
+            if not np.isclose(field.h_vec[2], 0.0, atol=1e-9 * np.linalg.norm(field.h_vec)):
+                return False, "The uniform field is not in the xy-plane."
+
+        for sensor in data_handler.sensors():
+            z = np.asarray(sensor.sampling_points(), dtype=float).reshape(-1, 3)[:, 2]
+            for z_range in z_ranges:
+                if z.min() < z_range[0] or z.max() > z_range[1]:
+                    return False, "The sensors are outside of the axial extent of the gears and magnets."
+
+        return True, ""
+
+    def create_mesh(self, data_handler: DataHandler, crop: bool = False) -> NGPlanarMesh:
+        """Method to create the object handling the 2D mesh of the cross-section.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param crop: Not supported by the planar formulation.
+        :type crop: bool
+
+        :return: Mesh of the cross-section.
+        :rtype: NGPlanarMesh
+        """
+
+        return NGPlanarMesh(data_handler, self.telemetry)
+
+    def symmetry_planes(self, data_handler: DataHandler) -> List[SymmetryPlane]:
+        """The cross-section is not reduced further by symmetry planes.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: An empty list.
+        :rtype: List[SymmetryPlane]
+        """
+
+        return list()
+
+    def stretching_box(self, data_handler: DataHandler) -> np.ndarray:
+        """Method to return the box the open boundary shell is wrapped around in the coordinates of the mesh.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: Lower and upper corner of the cross-section of the box.
+        :rtype: numpy.ndarray
+        """
+
+        return np.asarray(data_handler.sim_params().boundaries, dtype=float)[:, :2]
+
+    def finite_element_space(self) -> ng.FESpace:
+        """Method to declare the finite element space of the z-component of the vector potential.
+
+        :return: The finite element space.
+        :rtype: ngsolve.FESpace
+        """
+
+        return ng.H1(self.ng_mesh.mesh, order=3)
+
+    def bilinear_form(self, preconditioner: bool) -> Tuple[ng.BilinearForm, Union[ng.Preconditioner, None]]:
+        """Method to define and assemble the left hand side of the PDE.
+
+        :param preconditioner: Register a BDDC preconditioner with the bilinear form before assembling.
+        :type preconditioner: bool
+
+        :return: The assembled bilinear form and its preconditioner if requested.
+        :rtype: Tuple[ngsolve.BilinearForm, Union[ngsolve.Preconditioner, None]]
+        """
+
+        u, v = self.fes.TnT()
+
+        a = ng.BilinearForm(self.fes, symmetric=True)
+        a += 1 / (self.mu0 * self.mur) * self.physical_grad(u) * self.physical_grad(v) * self.volume() * ng.dx \
+            + 1e-8 / (self.mu0 * self.mur) * u * v * ng.dx  # 1e-8...  -> regularization term
+
+        c = ng.Preconditioner(a, "bddc") if preconditioner else None
+
+        with ng.TaskManager():
+            a.Assemble()
+
+        return a, c
+
+    def curl(self, u: ng.CoefficientFunction) -> ng.CoefficientFunction:
+        """Curl of the vector field (0, 0, u) in the xy-plane with respect to the physical coordinates.
+
+        :param u: Scalar function of x and y.
+        :type u: ngsolve.CoefficientFunction
+
+        :return: The curl as 3D vector field.
+        :rtype: ngsolve.CoefficientFunction
+        """
+
+        grad = self.physical_grad(u)
+
+        return ng.CoefficientFunction((grad[1], -grad[0], 0))
+
+    def linear_form(self, data_handler: DataHandler) -> ng.LinearForm:
+        """Method to define the right hand side of the PDE, i.e. the sources of the magnetisation and the uniform
+            fields.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The linear form, not yet assembled.
+        :rtype: ngsolve.LinearForm
+        """
+
+        v = self.fes.TestFunction()
+
+        self.h_uni = ng.CoefficientFunction(tuple(self.uniform_field(data_handler)))
+
+        f = ng.LinearForm(self.fes)
+        for num, _ in enumerate(data_handler.physical_magnets()):
+            f += self.mag * self.curl(v) * self.volume() * ng.dx("magnet" + str(num))
+        if data_handler.uni_fields():
+            f += (1 - 1 / self.mur) * self.h_uni * self.curl(v) * self.volume() * ng.dx
+
+        return f
+
+    def set_fields(self) -> None:
+        """Method to derive the magnetic flux density and field strength from the solved vector potential."""
+
+        self.b_field: ng.comp.CoefficientFunction = self.curl(self.gfu) + self.mu0 * self.h_uni
+        self.h_field: ng.fem.CoefficientFunction = self.b_field / (self.mu0 * self.mur) - self.mag
@@ -0,0 +1,105 @@
+import ngsolve as ng
+import netgen.geom2d as geom2d
+import netgen.meshing as msh
+import numpy as np
+from typing import Union
+
+from libs.DataHandler import DataHandler
+from libs.simulation.Telemetry import Telemetry
+
+from libs.simulation.ngsolve.NGMesh import NGMesh
+from libs.simulation.ngsolve.PlanarGeometry import PlanarGeometry
+
+
+class NGPlanarMesh:
+    """Generates the 2D mesh of the cross-section of the scenery. Meshing the cross-section is cheap, so the mesh is
+        rebuilt whenever a component moved instead of rotating it.
+
+    :param mp: Meshing parameters, the maximum mesh size is restricted at the sampling points of the sensors.
+    :type mp: netgen.meshing.MeshingParameters
+    :param mesh: 2D mesh converted to Ngsolve.
+    :type mesh: ngsolve.Mesh
+    :param version: Counter incremented whenever the mesh is rebuilt.
+    :type version: int
+    :param geometry_state: Motion states of the time dependent components the current mesh was generated for.
+    :type geometry_state: tuple
+    :param telemetry: Collects the durations of the mesh operations.
+    :type telemetry: Telemetry
+    :param rebuilt: True if the mesh got rebuilt during the last update.
+    :type rebuilt: bool
+    """
+
+    mp: msh.MeshingParameters
+    mesh: ng.Mesh
+    version: int
+    geometry_state: tuple
+    telemetry: Telemetry
+    rebuilt: bool
+
+    def __init__(self,
+                 data_handler: DataHandler,
+                 telemetry: Union[Telemetry, None] = None) -> None:
+        """Constructor method."""
+
+        self.mp = msh.MeshingParameters(maxh=data_handler.sim_params().maxh_global)
+        for sensor in data_handler.sensors():
+            if hasattr(sensor, 'maxh'):
+                for point in self.plane_points(np.asarray(sensor.sampling_points(), dtype=float).reshape(-1, 3)):
+                    self.mp.RestrictH(x=point[0], y=point[1], z=0.0, h=sensor.maxh)
+
+        self.mesh = ng.Mesh(msh.Mesh(dim=2))
+        self.version = 0
+        self.geometry_state = tuple()
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        self.rebuilt = False
+
+    def plane_points(self, points: np.ndarray) -> np.ndarray:
+        """Maps 3D points to the plane of the mesh.
+
+        :param points: Array of shape (n, 3) with the points.
+        :type points: numpy.ndarray
+        :return: Array of shape (n, 2) with the coordinates in the plane.
+        :rtype: numpy.ndarray
+        """
+
+        return points[:, :2]
+
+    def build_geometry(self, data_handler: DataHandler) -> geom2d.CSG2d:
+        """Creates the 2D geometry the mesh is generated from.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Geometry of the cross-section of the scenery.
+        :rtype: netgen.geom2d.CSG2d
+        """
+
+        return PlanarGeometry(data_handler).geometry
+
+    def update(self, data_handler: DataHandler, t: float) -> None:
+        """Rebuilds the mesh if any of the components moved since the last call.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param t: Current time stamp.
+        :type t: float
+        """
+
+        geometry_state = NGMesh.motion_state(data_handler)
+        if self.mesh.ne > 0 and geometry_state == self.geometry_state:
+            self.rebuilt = False
+            return
+
+        with self.telemetry.stage("geometry build"):
+            geometry = self.build_geometry(data_handler)
+        with self.telemetry.stage("mesh generation"):
+            self.mesh = ng.Mesh(geometry.GenerateMesh(self.mp))
+        self.telemetry.record(mesh_rebuilt=1, elements=self.mesh.ne)
+
+        self.version += 1
+        self.geometry_state = geometry_state
+        self.rebuilt = True
+
+    def close(self) -> None:
+        """The 2D meshes are generated when needed, there is no pipeline to stop."""
+
+        pass
@@ -0,0 +1,90 @@
+import ngsolve as ng
+from typing import Union, Tuple
+
+from libs.simulation.ngsolve.NGField import NGField
+
+from libs.DataHandler import DataHandler
+
+
+class NGScalarField(NGField):
+    """Implementation of MagneticField based on the total magnetic scalar potential. Since the scenery is free of
+        currents, the magnetic field strength is the sum of the uniform fields and the gradient of a scalar potential
+        phi, H = H0 - grad(phi). The flux density B = mu0 * mu_r * (H + M) is free of divergence, which results in a
+        symmetric positive definite system on an H1 space with far less degrees of freedom than the vector potential.
+        The potential vanishes on the outer boundary, which corresponds to the boundary condition of the vector
+        potential formulation, i.e. the tangential field strength equals the one of the uniform fields.
+    """
+
+    def finite_element_space(self) -> ng.FESpace:
+        """Method to declare the finite element space of the scalar potential on the current mesh.
+
+        :return: The finite element space.
+        :rtype: ngsolve.FESpace
+        """
+
+        # The potential vanishes on the symmetry planes of an odd field. On the planes of an even field the natural
+        # boundary condition B.n = 0 holds.
+        dirichlet = ["outer"] + [plane.bc for plane in self.symmetry if plane.odd]
+
+        return ng.H1(self.ng_mesh.mesh, order=3, dirichlet="|".join(dirichlet))
+
+    def bilinear_form(self, preconditioner: bool) -> Tuple[ng.BilinearForm, Union[ng.Preconditioner, None]]:
+        """Method to define and assemble the left hand side of the PDE.
+
+        :param preconditioner: Register a preconditioner with the bilinear form before assembling. The H1 system is
+            preconditioned by a two level method with a direct solve on the lowest order space, which is considerably
+            cheaper to set up than BDDC.
+        :type preconditioner: bool
+
+        :return: The assembled bilinear form and its preconditioner if requested.
+        :rtype: Tuple[ngsolve.BilinearForm, Union[ngsolve.Preconditioner, None]]
+        """
+
+        u, v = self.fes.TnT()
+
+        a = ng.BilinearForm(self.fes, symmetric=True)
+        a += self.mu0 * self.mur * self.physical_grad(u) * self.physical_grad(v) * self.volume() * ng.dx
+
+        c = ng.Preconditioner(a, "multigrid") if preconditioner else None
+
+        with ng.TaskManager():
+            a.Assemble()
+
+        return a, c
+
+    def linear_form(self, data_handler: DataHandler) -> ng.LinearForm:
+        """Method to define the right hand side of the PDE, i.e. the sources of the magnetisation and the uniform
+            fields.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+
+        :return: The linear form, not yet assembled.
+        :rtype: ngsolve.LinearForm
+        """
+
+        v = self.fes.TestFunction()
+
+        # The uniform fields are sources in the magnetic materials only, since mu0 * H0 is free of divergence.
+        self.h_uni = ng.CoefficientFunction(tuple(self.uniform_field(data_handler)))
+
+        f = ng.LinearForm(self.fes)
+        for num, _ in enumerate(data_handler.physical_magnets()):
+            f += self.mu0 * self.mur * self.mag * self.physical_grad(v) * self.volume() * ng.dx("magnet" + str(num))
+        if data_handler.uni_fields():
+            f += self.mu0 * (self.mur - 1) * self.h_uni * self.physical_grad(v) * self.volume() * ng.dx
+
+        return f
+
+    def set_fields(self) -> None:
+        """Method to derive the magnetic field strength and flux density from the solved scalar potential."""
+
+        self.h_field: ng.fem.CoefficientFunction = self.h_uni - self.physical_grad(self.gfu)
+        self.b_field: ng.comp.CoefficientFunction = self.mu0 * self.mur * (self.h_field + self.mag)
+
+    def draw(self) -> None:
+        """Method to draw the magnetic field strength and the magnetic flux density in the Netgen gui."""
+
+        ng.Draw(self.gfu, self.ng_mesh.mesh, "scalar-potential", draw_surf=False)
+        ng.Draw(self.b_field, self.ng_mesh.mesh, "B-field", draw_surf=False)
+        ng.Draw(self.h_field, self.ng_mesh.mesh, "H-field", draw_surf=False)
@@ -0,0 +1,420 @@
+import netgen.occ as occ
+import numpy as np
+from typing import Dict, List, Union
+
+from libs.DataHandler import DataHandler
+from libs.elements.BoundingBox import BoundingBox
+from libs.elements.Component import Component
+from libs.elements.Magnet import Magnet
+from libs.elements.Sensor import Sensor
+from libs.elements.SimParams import SimParams
+
+from libs.elements.components.Gear import Gear
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.components.Shaft import Shaft
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.RodMagnet import RodMagnet
+from libs.elements.sensors.GMRSensor import GMRSensor
+from libs.elements.sensors.HallSensor import HallSensor
+
+from libs.simulation.ngsolve.CSGeometries.CSGGear import CSGGear
+from libs.simulation.ngsolve.CSGeometries.CSGEvoGear import CSGEvoGear
+from libs.simulation.ngsolve.CSGeometries.CSGGearRack import CSGGearRack
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
+from libs.simulation.ngsolve.PlanarGeometry import PlanarGeometry
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
+
+
+class OCCGeometry:
+    """Generates the geometry of the scenery with the OpenCascade kernel of netgen (netgen.occ) as alternative to
+        CSGeometry. Each body is a 2D sketch of its cross-section extruded along its axis. The teeth of gears and gear
+        racks are the polygons bounded by the tooth planes of the CSG geometries, fused with the cross-section of the
+        body before the extrusion. Unlike the intersections of half spaces of the CSG geometry, the flanks become flat
+        faces meshed once, which avoids the small surface patches and badly shaped elements at the tooth edges. The
+        domains carry the same material names as in CSGeometry, the faces of the simulation boundaries are named
+        "outer" ("shell" for the inner box of an open boundary shell) and the faces at symmetry planes after the
+        boundary conditions of the planes.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    :param crop: Intersect all bodies with the simulation boundaries, e.g. for a submodel covering only a part of the
+        scenery.
+    :type crop: bool
+    :param symmetry: Symmetry planes the scenery is clipped at, the bodies are cropped to the remaining box.
+    :type symmetry: List[SymmetryPlane]
+    """
+
+    # Meshing parameters overriding the ones of NGMesh. The OCC mesher refines the surface mesh between close edges
+    # much stronger than the CSG mesher, the default factor of NGMesh quadruples the elements at the teeth.
+    mesh_options: Dict[str, float] = {"closeedgefac": 0.5}
+
+    materials: Dict[str, str]
+    crop: bool
+    symmetry: List[SymmetryPlane]
+    culling: ToothCulling
+    geometry: occ.OCCGeometry
+
+    def __init__(self,
+                 data_handler: DataHandler,
+                 crop: bool = False,
+                 symmetry: List[SymmetryPlane] = None) -> None:
+        """Constructor method."""
+
+        self.crop = crop or bool(symmetry)
+        self.symmetry = symmetry if symmetry is not None else list()
+
+        self.materials = {
+            "component": "iron",
+            "magnet": "magnet",
+            "sensor": "air",
+            "outer": "air"
+        }
+
+        self.culling = ToothCulling(data_handler)
+        self.geometry = occ.OCCGeometry(self.init_geometry(data_handler))
+
+    def init_geometry(self, data_handler: DataHandler) -> occ.TopoDS_Shape:
+        """Creates the overall shape of all elements of the simulation. As in CSGeometry, earlier bodies are only
+            subtracted from a body if their bounding boxes overlap. The bodies and the remaining air are glued to one
+            shape with conforming interfaces.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Shape of the whole scenery.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        sim_params = data_handler.sim_params()
+        shell = sim_params.shell_thickness
+        border = self.clip(self.brick(sim_params.boundaries, 0.0, "shell" if shell > 0 else "outer"), sim_params)
+
+        bodies_list: List[occ.TopoDS_Shape] = list()
+        boxes_list: List[np.ndarray] = list()
+        domains: List[occ.TopoDS_Shape] = list()
+
+        elements = [(self.materials["magnet"] + str(num), self.magnet_body(magnet), magnet)
+                    for num, magnet in enumerate(data_handler.physical_magnets())] + \
+                   [(self.materials["component"] + str(num), self.component_body(component), component)
+                    for num, component in enumerate(data_handler.components())] + \
+                   [(self.materials["sensor"], self.sensor_body(sensor), sensor)
+                    for sensor in data_handler.physical_sensors()]
+
+        for material, body, element in elements:
+            if body is None:
+                continue
+            if self.crop:
+                body = body * border
+            box = element.bounding_box()
+            for other, other_box in zip(bodies_list, boxes_list):
+                if BoundingBox.distance(box, other_box) == 0:
+                    body = body - other
+            if not body.solids:
+                continue
+            bodies_list.append(body)
+            boxes_list.append(box)
+            body.mat(material)
+            body.maxh = element.maxh
+            domains.append(body)
+
+        outer_body = border
+        for body in bodies_list:
+            outer_body = outer_body - body
+        outer_body.mat(self.materials["outer"])
+        outer_body.maxh = sim_params.maxh_global
+        domains.append(outer_body)
+
+        if shell > 0:
+            shell_body = self.clip(self.brick(sim_params.boundaries, shell, "outer"), sim_params) - border
+            boundaries = np.asarray(sim_params.boundaries, dtype=float)
+            for body, box in zip(bodies_list, boxes_list):
+                if np.any(box[0] <= boundaries[0]) or np.any(box[1] >= boundaries[1]):
+                    shell_body = shell_body - body
+            shell_body.mat(self.materials["outer"])
+            shell_body.maxh = sim_params.maxh_global
+            domains.append(shell_body)
+
+        return occ.Glue(domains)
+
+    @staticmethod
+    def brick(boundaries: np.ndarray, margin: float, bc: str) -> occ.TopoDS_Shape:
+        """Builds the simulation box enlarged by a margin on each side.
+
+        :param boundaries: Lower and upper corner of the simulation box.
+        :type boundaries: numpy.ndarray
+        :param margin: Margin added on each side.
+        :type margin: float
+        :param bc: Name of the faces.
+        :type bc: str
+        :return: Shape of the box.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        box = occ.Box(occ.Pnt(*(np.array(boundaries[0], dtype=float) - margin)),
+                      occ.Pnt(*(np.array(boundaries[1], dtype=float) + margin)))
+        box.faces.name = bc
+
+        return box
+
+    def clip(self, body: occ.TopoDS_Shape, sim_params: SimParams) -> occ.TopoDS_Shape:
+        """Clips a shape at the symmetry planes, the cut faces are named after the boundary conditions of the planes.
+
+        :param body: Shape to clip.
+        :type body: netgen.occ.TopoDS_Shape
+        :param sim_params: Simulation parameters.
+        :type sim_params: SimParams
+        :return: Part of the shape on the kept side of all symmetry planes.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        for plane in self.symmetry:
+            support = np.array(sim_params.boundaries[0], dtype=float)
+            support[plane.axis] = plane.offset
+            half_space = occ.HalfSpace(occ.Pnt(*support), occ.Vec(*np.asarray(plane.normal, dtype=float)))
+            half_space.faces.name = plane.bc
+            body = body * half_space
+
+        return body
+
+    @staticmethod
+    def polygon(points: np.ndarray) -> occ.Face:
+        """Creates a planar face from the corners of a polygon in 3D.
+
+        :param points: Array of shape (n, 3) with the corners.
+        :type points: numpy.ndarray
+        :return: Polygon face.
+        :rtype: netgen.occ.Face
+        """
+
+        vertices = [occ.Vertex(occ.Pnt(*point)) for point in np.asarray(points, dtype=float)]
+
+        return occ.Face(occ.MakePolygon(vertices + vertices[:1]))
+
+    @staticmethod
+    def disc(center: np.ndarray, normal: np.ndarray, radius: float) -> occ.Face:
+        """Creates a circular face.
+
+        :param center: Center of the disc.
+        :type center: numpy.ndarray
+        :param normal: Normal of the disc.
+        :type normal: numpy.ndarray
+        :param radius: Radius of the disc.
+        :type radius: float
+        :return: Disc face.
+        :rtype: netgen.occ.Face
+        """
+
+        return occ.Face(occ.Wire(occ.Circle(occ.Pnt(*center), occ.Dir(*normal), radius)))
+
+    @staticmethod
+    def extrude(sketch: occ.TopoDS_Shape, vector: np.ndarray) -> occ.TopoDS_Shape:
+        """Extrudes a sketch along a vector.
+
+        :param sketch: Planar faces.
+        :type sketch: netgen.occ.TopoDS_Shape
+        :param vector: Direction and length of the extrusion.
+        :type vector: numpy.ndarray
+        :return: Extruded solid.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        return occ.Prism(sketch, occ.Vec(*np.asarray(vector, dtype=float)))
+
+    def ring(self, center: np.ndarray, axis: np.ndarray, diameter: np.ndarray, teeth: List[occ.Face]) \
+            -> occ.TopoDS_Shape:
+        """Creates the sketch of a disc with an optional bore and teeth on its rim.
+
+        :param center: Center of the disc.
+        :type center: numpy.ndarray
+        :param axis: Normal of the disc.
+        :type axis: numpy.ndarray
+        :param diameter: Inner and outer diameter, no bore if the inner one is 0.
+        :type diameter: numpy.ndarray
+        :param teeth: Faces of the teeth in the plane of the disc.
+        :type teeth: List[netgen.occ.Face]
+        :return: Sketch of the cross-section.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        sketch = self.disc(center, axis, diameter[1] / 2)
+        if teeth:
+            sketch = occ.Glue([sketch] + teeth).UnifySameDomain()
+        if diameter[0] > 0.0:
+            sketch = sketch - self.disc(center, axis, diameter[0] / 2)
+
+        return sketch
+
+    def component_body(self, component: Component) -> Union[occ.TopoDS_Shape, None]:
+        """Method to generate the shape of a component with the parameters specified in the committed component
+            object.
+
+        :param component: Component parameters.
+        :type component: Component
+        :return: Component shape, None if the type is not supported.
+        :rtype: Union[netgen.occ.TopoDS_Shape, None]
+        """
+
+        if isinstance(component, Gear):
+            return self.gear_body(component)
+        elif isinstance(component, EvoGear):
+            return self.evogear_body(component)
+        elif isinstance(component, Shaft):
+            return self.shaft_body(component)
+        elif isinstance(component, GearRack):
+            return self.gear_rack_body(component)
+
+        return None
+
+    def gear_body(self, gear: Gear) -> occ.TopoDS_Shape:
+        """Builds the shape of a gear. The teeth are the polygons bounded by the tooth planes of CSGGear in the
+            body-fixed coordinate system, sketched on the front face of the gear.
+
+        :param gear: Gear parameters.
+        :type gear: Gear
+        :return: Gear shape.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        csg_gear = CSGGear(gear, self.culling)
+        position = gear.position(gear.theta)
+        axis = gear.rotation_axis(gear.theta)
+        trans_matrix = gear.transformation_matrix(axis)
+        inverse = np.linalg.inv(trans_matrix)
+        front = position - gear.length / 2 * axis
+
+        size = gear.diameter[1] + gear.tooth_height
+        square = size * np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+        teeth: List[occ.Face] = list()
+        for phi, n_idx in csg_gear.teeth():
+            planes = [(inverse.dot(support - position)[:2], inverse.dot(normal)[:2])
+                      for support, normal in csg_gear.tooth_planes(phi, n_idx).values()]
+            corners = PlanarGeometry.clip(square, planes)
+            teeth.append(self.polygon(front + np.column_stack((corners, np.zeros(len(corners)))).dot(
+                trans_matrix.T)))
+
+        diameter = np.array([gear.diameter[0], gear.diameter[1] - gear.tooth_height])
+
+        return self.extrude(self.ring(front, axis, diameter, teeth), gear.length * axis)
+
+    def evogear_body(self, evogear: EvoGear) -> occ.TopoDS_Shape:
+        """Builds the shape of an evolvent gear from the tooth profile extruded in CSGEvoGear.
+
+        :param evogear: EvoGear parameters.
+        :type evogear: EvoGear
+        :return: EvoGear shape.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        csg_evogear = CSGEvoGear(evogear, self.culling)
+        profile = csg_evogear.evotooth_2dpoint_array(evogear.involute_points)[0]
+
+        # The profile is extruded with its second coordinate along the direction vector of the tooth.
+        teeth: List[occ.Face] = list()
+        for extrusion in csg_evogear.evotooth_extrude_list(evogear.involute_points):
+            y_dir = np.asarray(extrusion[3][:2], dtype=float) / np.linalg.norm(extrusion[3][:2])
+            x_dir = np.array([-y_dir[1], y_dir[0]])
+            corners = np.outer(profile[:, 0], x_dir) + np.outer(profile[:, 1], y_dir)
+            teeth.append(self.polygon(np.column_stack((corners, np.zeros(len(corners))))))
+
+        # The bore of CSGEvoGear has the radius diameter[0].
+        diameter = np.array([2 * evogear.diameter[0], evogear.d_f])
+
+        return self.extrude(self.ring(np.zeros(3), np.array([0.0, 0.0, 1.0]), diameter, teeth),
+                            np.array([0.0, 0.0, -evogear.length]))
+
+    def gear_rack_body(self, gear_rack: GearRack) -> occ.TopoDS_Shape:
+        """Builds the shape of a gear rack. The teeth are the polygons bounded by the tooth planes of CSGGearRack in
+            the body-fixed coordinate system, sketched on the back face of the rack.
+
+        :param gear_rack: GearRack parameters.
+        :type gear_rack: GearRack
+        :return: Gear rack shape.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        csg_gear_rack = CSGGearRack(gear_rack, self.culling)
+        position = gear_rack.position()
+        trans_matrix = gear_rack.transformation_matrix()
+        inverse = np.linalg.inv(trans_matrix)
+        half = gear_rack.dim / 2
+
+        sketch = self.polygon(position + (np.array([[-1.0, -1.0, -1.0], [1.0, -1.0, -1.0], [1.0, 1.0, -1.0],
+                                                    [-1.0, 1.0, -1.0]]) * half).dot(trans_matrix.T))
+
+        size = gear_rack.dim[0] + gear_rack.dim[1] + gear_rack.tooth_height
+        square = size * np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+        teeth: List[occ.Face] = list()
+        for idx in csg_gear_rack.teeth():
+            planes = [(inverse.dot(support - position)[:2], inverse.dot(normal)[:2])
+                      for support, normal in csg_gear_rack.tooth_planes(idx).values()]
+            corners = PlanarGeometry.clip(square, planes)
+            teeth.append(self.polygon(position + np.column_stack((corners, np.full(len(corners), -half[2]))).dot(
+                trans_matrix.T)))
+        if teeth:
+            sketch = occ.Glue([sketch] + teeth).UnifySameDomain()
+
+        return self.extrude(sketch, trans_matrix.dot(np.array([0.0, 0.0, gear_rack.dim[2]])))
+
+    def shaft_body(self, shaft: Shaft) -> occ.TopoDS_Shape:
+        """Builds the shape of a shaft.
+
+        :param shaft: Shaft parameters.
+        :type shaft: Shaft
+        :return: Shaft shape.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        axis = np.asarray(shaft.axis, dtype=float)
+
+        return self.extrude(self.ring(shaft.pos - shaft.length / 2 * axis, axis, shaft.diameter, list()),
+                            shaft.length * axis)
+
+    def cuboid(self, center: np.ndarray, trans_matrix: np.ndarray, dim: np.ndarray) -> occ.TopoDS_Shape:
+        """Builds a rotated cuboid from its bottom face.
+
+        :param center: Center of the cuboid.
+        :type center: numpy.ndarray
+        :param trans_matrix: Transformation matrix of the body-fixed coordinate system.
+        :type trans_matrix: numpy.ndarray
+        :param dim: Edge lengths in the body-fixed coordinate system.
+        :type dim: numpy.ndarray
+        :return: Cuboid shape.
+        :rtype: netgen.occ.TopoDS_Shape
+        """
+
+        corners = np.array([[-1.0, -1.0, -1.0], [1.0, -1.0, -1.0], [1.0, 1.0, -1.0], [-1.0, 1.0, -1.0]]) * dim / 2
+
+        return self.extrude(self.polygon(center + corners.dot(trans_matrix.T)),
+                            trans_matrix.dot(np.array([0.0, 0.0, dim[2]])))
+
+    def magnet_body(self, magnet: Magnet) -> Union[occ.TopoDS_Shape, None]:
+        """Method to generate the shape of a magnet.
+
+        :param magnet: Magnet parameters.
+        :type magnet: Magnet
+        :return: Magnet shape, None if the type is not supported.
+        :rtype: Union[netgen.occ.TopoDS_Shape, None]
+        """
+
+        if isinstance(magnet, CuboidMagnet):
+            return self.cuboid(magnet.pos, magnet.transformation_matrix, magnet.dim)
+        elif isinstance(magnet, RodMagnet):
+            axis = np.asarray(magnet.axis, dtype=float)
+            return self.extrude(self.disc(magnet.pos - magnet.length / 2 * axis, axis, magnet.radius),
+                                magnet.length * axis)
+
+        return None
+
+    def sensor_body(self, sensor: Sensor) -> Union[occ.TopoDS_Shape, None]:
+        """Method to generate the shape of a sensor case.
+
+        :param sensor: Sensor parameters.
+        :type sensor: Sensor
+        :return: Sensor shape, None if the type is not supported.
+        :rtype: Union[netgen.occ.TopoDS_Shape, None]
+        """
+
+        if isinstance(sensor, (GMRSensor, HallSensor)):
+            return self.cuboid(sensor.pos, sensor.transformation_matrix, sensor.dim)
+
+        return None
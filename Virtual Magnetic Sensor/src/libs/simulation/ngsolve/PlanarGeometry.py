@@ -0,0 +1,190 @@
+import netgen.geom2d as geom2d
+import numpy as np
+from typing import Dict, List, Tuple
+
+from libs.DataHandler import DataHandler
+
+from libs.elements.components.Gear import Gear
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+
+from libs.simulation.ngsolve.CSGeometries.CSGGear import CSGGear
+from libs.simulation.ngsolve.CSGeometries.CSGEvoGear import CSGEvoGear
+
+
+class PlanarGeometry:
+    """Generates the 2D geometry of the cross-section of the scenery in the xy-plane with netgen.geom2d.CSG2d elements.
+        The tooth shapes are taken from the same parameters and planes as the 3D geometries, so the cross-section
+        matches the one of the 3D mesh. Only gears, evolvent gears and cuboid magnets extruded along the z-axis are
+        supported, see NGPlanarField.validity.
+
+    :param data_handler: Object of the Data class containing all simulation relevant data.
+    :type data_handler: DataHandler
+    """
+
+    materials: Dict[str, str]
+    geometry: geom2d.CSG2d
+
+    def __init__(self,
+                 data_handler: DataHandler) -> None:
+        """Constructor method."""
+
+        self.materials = {
+            "component": "iron",
+            "magnet": "magnet",
+            "outer": "air"
+        }
+
+        self.geometry = self.init_geometry(data_handler)
+
+    def init_geometry(self, data_handler: DataHandler) -> geom2d.CSG2d:
+        """Creates the overall 2D geometry of all elements of the simulation.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: Geometry of the cross-section of the scenery.
+        :rtype: netgen.geom2d.CSG2d
+        """
+
+        geometry: geom2d.CSG2d = geom2d.CSG2d()
+        bodies_list: List[geom2d.Solid2d] = list()
+
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            magnet_body = self.cuboid_magnet_body(magnet)
+            for body in bodies_list:
+                magnet_body = magnet_body - body
+            bodies_list.append(magnet_body)
+            geometry.Add(magnet_body.Mat(self.materials["magnet"] + str(num)).Maxh(magnet.maxh))
+
+        for num, component in enumerate(data_handler.components()):
+            if isinstance(component, EvoGear):
+                component_body = self.evogear_body(component)
+            else:
+                component_body = self.gear_body(component)
+            for body in bodies_list:
+                component_body = component_body - body
+            bodies_list.append(component_body)
+            geometry.Add(component_body.Mat(self.materials["component"] + str(num)).Maxh(component.maxh))
+
+        boundaries = np.asarray(data_handler.sim_params().boundaries, dtype=float)[:, :2]
+        shell = data_handler.sim_params().shell_thickness
+        outer_body = geom2d.Rectangle(pmin=tuple(boundaries[0]), pmax=tuple(boundaries[1]),
+                                      bc="shell" if shell > 0 else "outer")
+        if shell > 0:
+            # The open boundary shell is a separate domain around the simulation boundaries.
+            shell_body = geom2d.Rectangle(pmin=tuple(boundaries[0] - shell), pmax=tuple(boundaries[1] + shell),
+                                          bc="outer") - outer_body
+            for body in bodies_list:
+                shell_body = shell_body - body
+            geometry.Add(shell_body.Mat(self.materials["outer"]).Maxh(data_handler.sim_params().maxh_global))
+        for body in bodies_list:
+            outer_body = outer_body - body
+        geometry.Add(outer_body.Mat(self.materials["outer"]).Maxh(data_handler.sim_params().maxh_global))
+
+        return geometry
+
+    @staticmethod
+    def polygon(points: np.ndarray) -> geom2d.Solid2d:
+        """Creates a solid from the corners of a polygon in either orientation.
+
+        :param points: Array of shape (n, 2) with the corners.
+        :type points: numpy.ndarray
+        :return: Polygon geometry.
+        :rtype: netgen.geom2d.Solid2d
+        """
+
+        x, y = points[:, 0], points[:, 1]
+        if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) < 0:
+            points = points[::-1]
+
+        return geom2d.Solid2d([tuple(point) for point in points])
+
+    @staticmethod
+    def clip(points: np.ndarray, planes: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+        """Clips a convex polygon by the half planes behind the given lines (Sutherland-Hodgman).
+
+        :param points: Array of shape (n, 2) with the corners of the polygon.
+        :type points: numpy.ndarray
+        :param planes: Support point and outer normal of each line.
+        :type planes: List[Tuple[numpy.ndarray, numpy.ndarray]]
+        :return: Corners of the clipped polygon.
+        :rtype: numpy.ndarray
+        """
+
+        for support, normal in planes:
+            distance = (points - support).dot(normal)
+            clipped: List[np.ndarray] = list()
+            for idx in range(len(points)):
+                current, following = points[idx], points[(idx + 1) % len(points)]
+                d_current, d_following = distance[idx], distance[(idx + 1) % len(points)]
+                if d_current <= 0:
+                    clipped.append(current)
+                if d_current * d_following < 0:
+                    clipped.append(current + d_current / (d_current - d_following) * (following - current))
+            points = np.array(clipped)
+
+        return points
+
+    def gear_body(self, gear: Gear) -> geom2d.Solid2d:
+        """Builds the cross-section of a gear. The teeth are the polygons bounded by the tooth planes of the 3D
+            geometry.
+
+        :param gear: Gear parameters.
+        :type gear: Gear
+        :return: Gear geometry.
+        :rtype: netgen.geom2d.Solid2d
+        """
+
+        csg_gear = CSGGear(gear)
+        center = gear.position(gear.theta)[:2]
+
+        body = geom2d.Circle(center=tuple(center), radius=gear.diameter[1] / 2 - gear.tooth_height / 2)
+        if gear.diameter[0] > 0.0:
+            body = body - geom2d.Circle(center=tuple(center), radius=gear.diameter[0] / 2)
+
+        size = gear.diameter[1] + gear.tooth_height
+        square = center + size * np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+        for phi, n_idx in csg_gear.teeth():
+            planes = [(support[:2], normal[:2]) for support, normal in csg_gear.tooth_planes(phi, n_idx).values()]
+            body = body + self.polygon(self.clip(square, planes))
+
+        return body
+
+    def evogear_body(self, evogear: EvoGear) -> geom2d.Solid2d:
+        """Builds the cross-section of an evolvent gear from the tooth profile extruded in the 3D geometry.
+
+        :param evogear: EvoGear parameters.
+        :type evogear: EvoGear
+        :return: EvoGear geometry.
+        :rtype: netgen.geom2d.Solid2d
+        """
+
+        csg_evogear = CSGEvoGear(evogear)
+        profile = csg_evogear.evotooth_2dpoint_array(evogear.involute_points)[0]
+
+        body = geom2d.Circle(center=(0.0, 0.0), radius=evogear.d_f / 2)
+        if evogear.diameter[0] > 0.0:
+            body = body - geom2d.Circle(center=(0.0, 0.0), radius=evogear.diameter[0])
+
+        # The profile is extruded with its second coordinate along the direction vector of the tooth.
+        for direction in csg_evogear.dirvec_array():
+            y_dir = direction[:2] / np.linalg.norm(direction[:2])
+            x_dir = np.array([-y_dir[1], y_dir[0]])
+            body = body + self.polygon(np.outer(profile[:, 0], x_dir) + np.outer(profile[:, 1], y_dir))
+
+        return body
+
+    @staticmethod
+    def cuboid_magnet_body(magnet: CuboidMagnet) -> geom2d.Solid2d:
+        """Builds the cross-section of a cuboid magnet rotated about the z-axis.
+
+        :param magnet: CuboidMagnet parameters.
+        :type magnet: CuboidMagnet
+        :return: Cuboid magnet geometry.
+        :rtype: netgen.geom2d.Solid2d
+        """
+
+        corners = np.array([[-1.0, -1.0, 0.0], [1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, 1.0, 0.0]]) * magnet.dim / 2
+        points = magnet.pos[:2] + corners.dot(magnet.transformation_matrix.T)[:, :2]
+
+        return PlanarGeometry.polygon(points)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+import copy
+import numpy as np
+from typing import List, Tuple, Union
+
+from libs.DataHandler import DataHandler
+
+from libs.elements.components.Gear import Gear
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.RodMagnet import RodMagnet
+
+from libs.simulation.ngsolve.CSGeometries.CSGGear import CSGGear
+
+
+class SymmetryPlane:
+    """Mirror plane of the scenery normal to one of the coordinate axes. Only the half of the simulation box on the
+        kept side of the plane is meshed. The magnetic scalar potential is either even or odd with respect to the
+        mirroring: If the magnetisations and uniform fields are parallel to the plane, the flux density is tangential
+        on the plane (B.n = 0). If they are normal to the plane, the field strength is normal on the plane (n x H = 0).
+        Positions on the far side are evaluated at their mirror image and the field vector is mirrored back.
+
+    :param axis: Index of the coordinate axis normal to the plane.
+    :type axis: int
+    :param offset: Coordinate of the plane along the axis.
+    :type offset: float
+    :param side: 1 if the half with coordinates above the offset is kept, -1 otherwise.
+    :type side: int
+    :param odd: True if the field strength is normal on the plane, False if the flux density is tangential.
+    :type odd: bool
+    :param tol: Absolute tolerance of the geometric comparisons.
+    :type tol: float
+    """
+
+    axis: int
+    offset: float
+    side: int
+    odd: bool
+    tol: float
+
+    def __init__(self,
+                 axis: int,
+                 offset: float,
+                 side: int = 1,
+                 odd: bool = False,
+                 tol: float = 1e-9) -> None:
+        """Constructor method."""
+
+        self.axis = axis
+        self.offset = offset
+        self.side = side
+        self.odd = odd
+        self.tol = tol
+
+    @property
+    def bc(self) -> str:
+        """Name of the boundary condition on the plane."""
+
+        return "symmetry_" + "xyz"[self.axis]
+
+    @property
+    def normal(self) -> np.ndarray:
+        """Outer normal of the kept half space on the plane."""
+
+        normal = np.zeros(3)
+        normal[self.axis] = -self.side
+
+        return normal
+
+    def mirror_point(self, point: np.ndarray) -> np.ndarray:
+        """Mirrors a point at the plane.
+
+        :param point: Point to mirror.
+        :type point: numpy.ndarray
+        :return: Mirror image of the point.
+        :rtype: numpy.ndarray
+        """
+
+        point = np.array(point, dtype=float)
+        point[self.axis] = 2 * self.offset - point[self.axis]
+
+        return point
+
+    def mirror_vector(self, vector: np.ndarray) -> np.ndarray:
+        """Mirrors a direction at the plane.
+
+        :param vector: Direction to mirror.
+        :type vector: numpy.ndarray
+        :return: Mirror image of the direction.
+        :rtype: numpy.ndarray
+        """
+
+        vector = np.array(vector, dtype=float)
+        vector[self.axis] = -vector[self.axis]
+
+        return vector
+
+    def reflect(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Maps positions on the far side of the plane to their mirror image on the kept side.
+
+        :param points: Array of shape (n, 3) with the positions.
+        :type points: numpy.ndarray
+        :return: The mapped positions and the factors of shape (n, 3) the components of the field vectors at the
+            mapped positions have to be multiplied with.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        points = np.array(points, dtype=float)
+        factors = np.ones(points.shape)
+
+        far = (points[:, self.axis] - self.offset) * self.side < 0
+        points[far, self.axis] = 2 * self.offset - points[far, self.axis]
+        if self.odd:
+            factors[np.ix_(far, [idx for idx in range(3) if idx != self.axis])] = -1.0
+        else:
+            factors[far, self.axis] = -1.0
+
+        return points, factors
+
+    @staticmethod
+    def parity(vector: np.ndarray, axis: int) -> Union[bool, None]:
+        """Returns whether a magnetisation or uniform field is compatible with an odd or an even field.
+
+        :param vector: Magnetisation or field strength.
+        :type vector: numpy.ndarray
+        :param axis: Index of the coordinate axis normal to the plane.
+        :type axis: int
+        :return: True if the vector is normal to the plane, False if it is parallel to the plane, None otherwise.
+        :rtype: Union[bool, None]
+        """
+
+        tangential = np.delete(vector, axis)
+        atol = 1e-9 * np.linalg.norm(vector)
+        if np.isclose(vector[axis], 0.0, atol=atol):
+            return False
+        if np.allclose(tangential, 0.0, atol=atol):
+            return True
+
+        return None
+
+    @classmethod
+    def detect(cls, data_handler: DataHandler) -> List[SymmetryPlane]:
+        """Checks the center planes of the simulation box normal to the coordinate axes for mirror symmetry of the
+            scenery. The reason why a plane is rejected is printed.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :return: The symmetry planes of the scenery.
+        :rtype: List[SymmetryPlane]
+        """
+
+        planes: List[SymmetryPlane] = list()
+        for axis in range(3):
+            [plane, reason] = cls.from_scene(data_handler, axis)
+            if plane is not None:
+                planes.append(plane)
+            else:
+                print("No symmetry plane normal to the " + "xyz"[axis] + "-axis: " + reason)
+
+        return planes
+
+    @classmethod
+    def from_scene(cls, data_handler: DataHandler, axis: int) -> Tuple[Union[SymmetryPlane, None], str]:
+        """Creates the symmetry plane through the center of the simulation box normal to the given axis if the
+            scenery is mirror symmetric with respect to it at all time stamps of the simulation. Only gears, shafts,
+            cuboid magnets and rod magnets are supported. The sensors are only sampled on the kept side, so all of them
+            have to be on the plane or on the same side of it.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param axis: Index of the coordinate axis normal to the plane.
+        :type axis: int
+        :return: The symmetry plane, None if the scenery is not symmetric, and the reason if not.
+        :rtype: Tuple[Union[SymmetryPlane, None], str]
+        """
+
+        if data_handler.sim_params().submodel_margin > 0:
+            return None, "Symmetry planes are not supported together with submodels."
+
+        boundaries = np.asarray(data_handler.sim_params().boundaries, dtype=float)
+        plane = cls(axis, float(boundaries[:, axis].mean()), tol=1e-9 * np.linalg.norm(boundaries[1] - boundaries[0]))
+
+        parities = set()
+        for num, magnet in enumerate(data_handler.physical_magnets()):
+            if isinstance(magnet, CuboidMagnet):
+                directions = magnet.transformation_matrix.T
+            elif isinstance(magnet, RodMagnet):
+                directions = [magnet.axis]
+            else:
+                return None, "Magnets of type " + type(magnet).__name__ + " are not supported."
+            if not plane.on_plane(magnet.pos) or not all(plane.invariant(direction) for direction in directions):
+                return None, "Magnet " + str(num) + " is not symmetric."
+            if np.linalg.norm(magnet.m_vec) > 0:
+                parities.add(cls.parity(magnet.m_vec, axis))
+        for field in data_handler.uni_fields():
+            parities.add(cls.parity(field.h_vec, axis))
+        if None in parities or len(parities) > 1:
+            return None, "The magnetisations and uniform fields are neither all parallel nor all normal to the plane."
+        plane.odd = parities.pop() if parities else False
+
+        for num, component in enumerate(data_handler.components()):
+            if not isinstance(component, (Gear, Shaft)):
+                return None, "Components of type " + type(component).__name__ + " are not supported."
+            if isinstance(component, Shaft) and (not plane.on_plane(component.pos) or
+                                                 not plane.invariant(component.axis)):
+                return None, "Component " + str(num) + " is not symmetric."
+
+        sides = {int(np.sign(sensor.pos[axis] - plane.offset)) for sensor in data_handler.physical_sensors()
+                 if not np.isclose(sensor.pos[axis], plane.offset, atol=plane.tol)}
+        if len(sides) > 1:
+            return None, "Sensors are placed on both sides of the plane."
+        plane.side = sides.pop() if sides else 1
+
+        [symmetric, reason] = plane.components_symmetric(data_handler, data_handler.sim_params().t)
+        if not symmetric:
+            return None, reason
+
+        return plane, ""
+
+    def on_plane(self, point: np.ndarray) -> bool:
+        """Checks whether a point lies on the plane.
+
+        :param point: Point to check.
+        :type point: numpy.ndarray
+        :return: True if the point is its own mirror image.
+        :rtype: bool
+        """
+
+        return bool(np.isclose(point[self.axis], self.offset, atol=self.tol))
+
+    def invariant(self, direction: np.ndarray) -> bool:
+        """Checks whether an axis of a body is mapped onto itself, i.e. is parallel or normal to the plane.
+
+        :param direction: Axis of the body.
+        :type direction: numpy.ndarray
+        :return: True if the mirrored axis is parallel to the axis.
+        :rtype: bool
+        """
+
+        direction = np.asarray(direction, dtype=float) / np.linalg.norm(direction)
+
+        return bool(np.allclose(np.cross(self.mirror_vector(direction), direction), 0.0, atol=1e-9))
+
+    def components_symmetric(self, data_handler: DataHandler, times: np.ndarray) -> Tuple[bool, str]:
+        """Checks whether the gears are mirror symmetric at the given time stamps. A gear is symmetric if its center
+            and axis are mapped onto themselves and the mirrored bounding planes of every tooth bound another tooth.
+
+        :param data_handler: Object of the Data class containing all simulation relevant data.
+        :type data_handler: DataHandler
+        :param times: Time stamps to check.
+        :type times: numpy.ndarray
+        :return: Whether all gears are symmetric and the reason if not.
+        :rtype: Tuple[bool, str]
+        """
+
+        for num, component in enumerate(data_handler.components()):
+            if not isinstance(component, Gear):
+                continue
+            gear = copy.deepcopy(component)
+            for t in times:
+                gear.update(t)
+                if not self.on_plane(gear.position(gear.theta)) or not self.invariant(gear.rotation_axis(gear.theta)):
+                    return False, "Component " + str(num) + " is not symmetric at t = " + str(t) + "."
+
+                csg_gear = CSGGear(gear)
+                teeth = [list(csg_gear.tooth_planes(phi, n_idx).values()) for phi, n_idx in csg_gear.teeth()]
+                for tooth in teeth:
+                    mirrored = [(self.mirror_point(support), self.mirror_vector(normal)) for support, normal in tooth]
+                    if not any(len(other) == len(mirrored) and
+                               all(any(self.same_plane(plane, other_plane) for other_plane in other)
+                                   for plane in mirrored) for other in teeth):
+                        return False, "The teeth of component " + str(num) + " are not symmetric at t = " + \
+                            str(t) + "."
+
+        return True, ""
+
+    def same_plane(self, plane: Tuple[np.ndarray, np.ndarray], other: Tuple[np.ndarray, np.ndarray]) -> bool:
+        """Checks whether two planes given by a support point and an outer normal bound the same half space.
+
+        :param plane: Support point and outer normal of the first plane.
+        :type plane: Tuple[numpy.ndarray, numpy.ndarray]
+        :param other: Support point and outer normal of the second plane.
+        :type other: Tuple[numpy.ndarray, numpy.ndarray]
+        :return: True if the half spaces are equal.
+        :rtype: bool
+        """
+
+        normal = plane[1] / np.linalg.norm(plane[1])
+        other_normal = other[1] / np.linalg.norm(other[1])
+
+        return bool(np.allclose(normal, other_normal, atol=1e-9) and
+                    np.isclose(np.dot(other[0] - plane[0], normal), 0.0, atol=self.tol))
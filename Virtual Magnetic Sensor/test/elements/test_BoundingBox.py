@@ -0,0 +1,35 @@
+import numpy as np
+
+from libs.elements.BoundingBox import BoundingBox
+from libs.elements.components.Gear import Gear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+
+
+def test_cylinder():
+    box = BoundingBox.cylinder(np.zeros(3), np.array([0.0, 0.0, 2.0]), 1.0, 4.0)
+
+    assert np.allclose(box, np.array([[-1.0, -1.0, -2.0], [1.0, 1.0, 2.0]]))
+
+
+def test_cuboid():
+    matrix = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    box = BoundingBox.cuboid(np.array([1.0, 0.0, 0.0]), matrix, -np.array([2.0, 1.0, 0.5]), np.array([2.0, 1.0, 0.5]))
+
+    assert np.allclose(box, np.array([[0.0, -2.0, -0.5], [2.0, 2.0, 0.5]]))
+
+
+def test_distance():
+    box = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+    assert np.isclose(BoundingBox.distance(box, box + np.array([4.0, 5.0, 0.0])), np.sqrt(9.0 + 16.0))
+    assert BoundingBox.distance(box, box + 0.5) == 0.0
+    assert np.isclose(BoundingBox.volume(BoundingBox.union([box, box + 1.0])), 8.0)
+
+
+def test_elements():
+    gear = Gear.template()
+    radius = gear.diameter[1] / 2 + gear.tooth_height / 2
+    assert np.allclose(gear.bounding_box()[1, :2], radius)
+
+    magnet = CuboidMagnet.template()
+    assert np.allclose(magnet.bounding_box(), np.array([magnet.pos - magnet.dim / 2, magnet.pos + magnet.dim / 2]))
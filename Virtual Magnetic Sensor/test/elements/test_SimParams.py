@@ -10,7 +10,8 @@ def test_from_dict_and_to_dict():
                            samples=21,
                            maxh_global=3.0,
                            tol=1e-3,
-                           maxit=1000)
+                           maxit=1000,
+                           solver=1)
     for key, value in SimParams.template().from_dict(sim_params.to_dict()).__dict__.items():
         if not np.allclose(value, sim_params.__dict__[key]):
             assert False
@@ -0,0 +1,78 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.EvoGear import EvoGear
+from libs.elements.components.Gear import Gear
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.CSGeometry import CSGeometry
+from libs.simulation.ngsolve.CSGeometries.CSGEvoGear import CSGEvoGear
+from libs.simulation.ngsolve.CSGeometries.CSGGear import CSGGear
+from libs.simulation.ngsolve.CSGeometries.CSGGearRack import CSGGearRack
+from libs.simulation.ngsolve.CSGeometries.ToothCulling import ToothCulling
+from libs.simulation.ngsolve.NGMesh import NGMesh
+
+
+def test_overlapping():
+    box = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+    assert CSGeometry.overlapping(box, box + 0.5)
+    assert CSGeometry.overlapping(box, box + np.array([1.0, 0.0, 0.0]))
+    assert not CSGeometry.overlapping(box, box + np.array([1.5, 0.0, 0.0]))
+
+
+def test_many_bodies():
+    sim_params = SimParams.template()
+    sim_params.boundaries = np.array([[-4.0, -4.0, -3.0], [8.0, 8.0, 3.0]])
+    sim_params.maxh_global = 3.0
+    objects = [sim_params]
+    for i in range(2):
+        for j in range(2):
+            magnet = CuboidMagnet.template()
+            magnet.pos = np.array([4.0 * i, 4.0 * j, 0.0])
+            magnet.dim = np.array([2.0, 2.0, 1.0])
+            sensor = HallSensor.template()
+            sensor.pos = magnet.pos + np.array([0.0, 0.0, 1.0])
+            sensor.dim = np.array([0.5, 0.5, 0.2])
+            objects += [magnet, sensor]
+    data_handler = DataHandler(objects)
+
+    [mesh, _] = NGMesh.init_mesh(data_handler, NGMesh(data_handler).mp)
+    assert mesh.GetNDomains() == 9
+
+
+def test_tooth_culling():
+    sim_params = SimParams.template()
+    sensor = HallSensor.template()
+    sensor.pos = np.array([7.0, 0.0, 0.0])
+    data_handler = DataHandler([sim_params, sensor])
+    gear = Gear.template()
+    gear.rotate_mesh = False
+    evogear = EvoGear.template()
+    gear_rack = GearRack.template()
+    gear_rack.move_mesh = False
+
+    assert len(CSGGear(gear, ToothCulling(data_handler)).teeth()) == gear.n
+    assert len(CSGEvoGear(evogear, ToothCulling(data_handler)).evotooth_extrude_list(evogear.involute_points)) == \
+        evogear.n
+
+    sim_params.tooth_culling = 1.0
+    culling = ToothCulling(data_handler)
+    teeth = CSGGear(gear, culling).teeth()
+    assert 0 < len(teeth) < gear.n
+    assert (gear.theta, 0) in teeth
+    assert all(abs(np.cos(phi)) > 0.9 for phi, _ in teeth)
+    gear.rotate_mesh = True
+    gear.rotate_mesh_max_angle = 0.5
+    assert len(CSGGear(gear, culling).teeth()) > len(teeth)
+    assert 0 < len(CSGEvoGear(evogear, culling).evotooth_extrude_list(evogear.involute_points)) < evogear.n
+
+    sensor.pos = np.array([4.0, 2.5, 0.0])
+    racks = CSGGearRack(gear_rack, ToothCulling(data_handler))
+    assert [idx for idx in range(10) if culling.relevant(racks.tooth_box(idx))] == []
+    assert [idx for idx in range(10) if ToothCulling(data_handler).relevant(racks.tooth_box(idx))] == [7, 8, 9]
+    assert racks.teeth() == [7, 8, 9]
+    gear_rack.move_mesh = True
+    assert racks.teeth() == [6, 7, 8, 9]
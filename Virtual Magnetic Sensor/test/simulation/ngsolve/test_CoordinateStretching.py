@@ -0,0 +1,38 @@
+import ngsolve as ng
+import numpy as np
+from netgen.occ import Box, OCCGeometry, Pnt
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.magnets.UniField import UniField
+from libs.simulation.ngsolve.CoordinateStretching import CoordinateStretching
+from libs.simulation.ngsolve.NGScalarField import NGScalarField
+
+
+def test_mapping():
+    stretching = CoordinateStretching(np.array([-1.0, -1.0, -1.0]), np.array([1.0, 1.0, 1.0]), 1.0, 10.0)
+    mesh = ng.Mesh(OCCGeometry(Box(Pnt(-2, -2, -2), Pnt(2, 2, 2))).GenerateMesh(maxh=1.0))
+
+    assert np.isclose(stretching.mapped[0](mesh(0.5, 0.0, 0.0)), 0.5)
+    assert np.isclose(stretching.derivatives[0](mesh(1.0, 0.0, 0.0)), 1.0)
+    assert np.isclose(stretching.mapped[0](mesh(2.0, 0.0, 0.0)), 11.0)
+    assert np.isclose(stretching.mapped[1](mesh(0.0, -2.0, 0.0)), -11.0)
+    assert np.isclose(stretching.derivatives[2](mesh(0.0, 0.0, 2.0)), 100.0)
+    assert np.isclose(stretching.det(mesh(2.0, 2.0, 0.5)), 1e4)
+
+
+def test_uniform_field():
+    sim_params = SimParams.template()
+    sim_params.formulation = 2
+    sim_params.shell_thickness = 2.0
+    uni_field = UniField.template()
+    data_handler = DataHandler([sim_params, uni_field])
+
+    field = NGScalarField(data_handler)
+    field.create_field(data_handler, 0.0)
+
+    x = np.array([0.0, 2.0])
+    y = np.array([1.0, -3.0])
+    z = np.array([0.5, 0.0])
+    assert np.allclose(field.get_h_field(x, y, z), uni_field.h_vec)
+    assert np.allclose(field.get_b_field(x, y, z), uni_field.b_vec)
@@ -0,0 +1,41 @@
+import ngsolve as ng
+from netgen.csg import unit_cube
+
+from libs.simulation.ngsolve.DeflatedCG import DeflatedCG
+
+
+def system(scale: float):
+    mesh = ng.Mesh(unit_cube.GenerateMesh(maxh=0.4))
+    fes = ng.H1(mesh, order=2, dirichlet=".*")
+    u, v = fes.TnT()
+    a = ng.BilinearForm(fes)
+    a += ng.grad(u) * ng.grad(v) * ng.dx
+    c = ng.Preconditioner(a, "local")
+    a.Assemble()
+    f = ng.LinearForm(fes)
+    f += scale * ng.x * v * ng.dx
+    f.Assemble()
+    return fes, a, c, f
+
+
+def test_solve():
+    fes, a, c, f = system(1.0)
+    solver = DeflatedCG(2)
+    sol = ng.GridFunction(fes)
+    ref = ng.GridFunction(fes)
+
+    first = solver.solve(mat=a.mat, pre=c.mat, rhs=f.vec, sol=sol.vec, tol=1e-10, maxsteps=500)
+    ref.vec.data = a.mat.Inverse(fes.FreeDofs()) * f.vec
+    diff = sol.vec.CreateVector()
+    diff.data = sol.vec - ref.vec
+    assert first > 0
+    assert diff.Norm() < 1e-6 * ref.vec.Norm()
+    assert solver.dim() == 1
+
+    # A right hand side within the recycle space is solved by the projection alone.
+    f.vec.data *= 2
+    assert solver.solve(mat=a.mat, pre=c.mat, rhs=f.vec, sol=sol.vec, tol=1e-10, maxsteps=500) < first
+    assert solver.dim() == 2
+
+    solver.reset()
+    assert solver.dim() == 0
@@ -0,0 +1,39 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.MeshMotion import MeshMotion
+from libs.simulation.ngsolve.NGMesh import NGMesh
+
+
+def test_move():
+    gear_rack = GearRack.template()
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 4.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 2.5, 0.0])
+    data_handler = DataHandler([SimParams.template(), gear_rack, magnet, sensor])
+
+    [mesh, _] = NGMesh.init_mesh(data_handler, NGMesh(data_handler).mp)
+    state = NGMesh.motion_state(data_handler)
+    gear_rack.update(2.0)
+    new_state = NGMesh.motion_state(data_handler)
+    assert MeshMotion.supported(data_handler, new_state, state)
+
+    points = mesh.Coordinates().copy()
+    elements = mesh.Elements3D().NumPy()
+    rack = np.unique(elements['nodes'][elements['index'] == 2] - 1)
+    surface = np.unique(mesh.Elements2D().NumPy()['nodes'] - 1)
+    static = np.setdiff1d(surface, rack)
+    assert mesh.GetMaterial(2) == "iron0"
+
+    assert MeshMotion.move(mesh, data_handler, state, new_state)
+    moved = mesh.Coordinates()
+    assert np.allclose(moved[rack] - points[rack], gear_rack.shift)
+    assert np.allclose(moved[static], points[static])
+
+    gear_rack.update(30.0)
+    assert not MeshMotion.supported(data_handler, NGMesh.motion_state(data_handler), state)
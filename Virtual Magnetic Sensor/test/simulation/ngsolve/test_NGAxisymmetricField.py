@@ -0,0 +1,44 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.RodMagnet import RodMagnet
+from libs.elements.magnets.UniField import UniField
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.NGAxisymmetricField import NGAxisymmetricField
+
+
+def test_validity():
+    shaft = Shaft.template()
+    shaft.pos = np.array([0.0, 0.0, 3.0])
+    data_handler = DataHandler([SimParams.template(), RodMagnet.template(), shaft, HallSensor.template()])
+    assert NGAxisymmetricField.validity(data_handler)[0]
+
+    shaft.pos = np.array([0.5, 0.0, 3.0])
+    assert not NGAxisymmetricField.validity(data_handler)[0]
+    shaft.pos = np.array([0.0, 0.0, 3.0])
+
+    data_handler.physical_magnets()[0].m_vec = np.array([1e6, 0.0, 0.0])
+    assert not NGAxisymmetricField.validity(data_handler)[0]
+
+    data_handler = DataHandler([SimParams.template(), RodMagnet.template(), Gear.template()])
+    assert not NGAxisymmetricField.validity(data_handler)[0]
+
+
+def test_uniform_field():
+    shaft = Shaft.template()
+    shaft.axis = np.array([0.0, 1.0, 0.0])
+    shaft.mu_r = 1.0
+    uni_field = UniField.template()
+    data_handler = DataHandler([SimParams.template(), shaft, uni_field])
+
+    field = NGAxisymmetricField(data_handler)
+    field.create_field(data_handler, 0.0)
+
+    x = np.array([0.0, 2.0])
+    y = np.array([1.0, -3.0])
+    z = np.array([0.0, 0.5])
+    assert np.allclose(field.get_h_field(x, y, z), uni_field.h_vec, atol=1e-5 * np.linalg.norm(uni_field.h_vec))
+    assert np.allclose(field.get_b_field(x, y, z), uni_field.b_vec, atol=1e-5 * np.linalg.norm(uni_field.b_vec))
@@ -0,0 +1,35 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.NGField import NGField
+
+
+def test_mark():
+    indicators = np.array([0.1, 4.0, 0.5, 3.0, 0.4])
+
+    assert np.array_equal(NGField.mark(indicators, 0.5), [False, True, False, False, False])
+    assert np.array_equal(NGField.mark(indicators, 0.8), [False, True, False, True, False])
+    assert NGField.mark(indicators, 1.0).all()
+
+
+def test_submodel_box():
+    sim_params = SimParams.template()
+    sim_params.submodel_margin = 2.0
+    sim_params.tooth_culling = 3.0
+    sensor = HallSensor.template()
+    sensor.pos = np.array([9.0, 0.0, 1.0])
+    data_handler = DataHandler([sim_params, sensor])
+
+    box = NGField.submodel_box(data_handler, sensor)
+    assert np.allclose(box, [[7.0, -2.0, -1.0], [10.0, 2.0, 3.0]])
+
+    global_scene = NGField.global_scene(data_handler)
+    assert not global_scene.sensors()
+    assert global_scene.sim_params().tooth_culling == 0
+    assert sim_params.tooth_culling == 3.0
+    local_scene = NGField.local_scene(data_handler, sensor, box)
+    assert np.allclose(local_scene.sim_params().boundaries, box)
+    assert local_scene.sim_params().submodel_margin == 0
+    assert sim_params.submodel_margin == 2.0
@@ -0,0 +1,92 @@
+import netgen.meshing as msh
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.NGMesh import NGMesh
+
+
+def test_quality():
+    # A regular tetrahedron and a corner of a cube with half its volume sharing a face.
+    mesh = msh.Mesh()
+    points = [mesh.Add(msh.MeshPoint(msh.Pnt(*p))) for p in [(1, 1, 1), (1, -1, -1), (-1, 1, -1), (-1, -1, 1)]]
+    mesh.Add(msh.Element3D(1, [points[0], points[1], points[2], points[3]]))
+    mesh.Add(msh.Element3D(1, [points[1], points[2], points[3], mesh.Add(msh.MeshPoint(msh.Pnt(-1, -1, -1)))]))
+
+    vertices = NGMesh.element_vertices(mesh)
+    assert vertices.shape == (2, 4, 3)
+    assert np.isclose(NGMesh.element_badness(vertices[:1])[0], 1.0)
+    assert np.isclose(NGMesh.aspect_ratio(mesh), np.sqrt(2))
+    assert np.isclose(NGMesh.smoothness(mesh), 2.0)
+    assert NGMesh.skewness(mesh) > 0.5
+
+
+def test_update():
+    gear_rack = GearRack.template()
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 4.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 2.5, 0.0])
+    data_handler = DataHandler([SimParams.template(), gear_rack, magnet, sensor])
+
+    ng_mesh = NGMesh(data_handler)
+    ng_mesh.update(data_handler, 0.0)
+    assert ng_mesh.rebuilt
+
+    # The badness is tracked on the elements moved with the gear rack.
+    gear_rack.update(0.1)
+    ng_mesh.update(data_handler, 0.1)
+    assert not ng_mesh.rebuilt
+    assert np.isclose(ng_mesh.current_badness, ng_mesh.mesh.ngmesh.CalcTotalBadness(ng_mesh.mp))
+
+
+def test_pipeline():
+    gear_rack = GearRack.template()
+    gear_rack.move_mesh = False
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 4.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 2.5, 0.0])
+    sim_params = SimParams.template()
+    sim_params.samples = 3
+    sim_params.mesh_pipeline = 1
+    sim_params.reset()
+    data_handler = DataHandler([sim_params, gear_rack, magnet, sensor])
+
+    ng_mesh = NGMesh(data_handler)
+    for t in sim_params.t:
+        gear_rack.update(t)
+        ng_mesh.update(data_handler, t)
+        assert ng_mesh.rebuilt
+    ng_mesh.close()
+    assert ng_mesh.pipeline is None
+
+    # The meshes of the later steps are generated by the pipeline and equal the directly generated ones.
+    generations = [event for event in ng_mesh.telemetry.events if event['name'] == "mesh generation"]
+    assert [event['step'] for event in generations if event['pid'] != generations[0]['pid']] == [1, 2]
+    [mesh, badness] = NGMesh.init_mesh(data_handler, ng_mesh.mp)
+    assert ng_mesh.mesh.ne == len(mesh.Elements3D())
+    assert np.isclose(ng_mesh.mesh_badness, badness)
+
+
+def test_pipeline_times():
+    gear_rack = GearRack.template()
+    gear_rack.move_mesh = False
+    sim_params = SimParams.template()
+    sim_params.mesh_pipeline = 2
+    sim_params.reset()
+    data_handler = DataHandler([sim_params, gear_rack, CuboidMagnet.template(), HallSensor.template()])
+
+    # The time stamps are not on the uniform grid of the simulation parameters, e.g. the angles of a sampler.
+    times = [0.0, 0.35, 0.8]
+    ng_mesh = NGMesh(data_handler, times=times)
+    for t in times:
+        gear_rack.update(t)
+        ng_mesh.update(data_handler, t)
+    ng_mesh.close()
+
+    generations = [event for event in ng_mesh.telemetry.events if event['name'] == "mesh generation"]
+    assert [event['step'] for event in generations if event['pid'] != generations[0]['pid']] == [1, 2]
@@ -0,0 +1,41 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.UniField import UniField
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.NGPlanarField import NGPlanarField
+
+
+def test_validity():
+    magnet = CuboidMagnet.template()
+    magnet.m_vec = np.array([0.0, 1e6, 0.0])
+    data_handler = DataHandler([SimParams.template(), Gear.template(), magnet, HallSensor.template()])
+    assert NGPlanarField.validity(data_handler)[0]
+
+    data_handler.sensors()[0].pos = np.array([0.0, 0.0, 0.8])
+    assert not NGPlanarField.validity(data_handler)[0]
+    data_handler.sensors()[0].pos = np.array([0.0, 0.0, 0.0])
+
+    magnet.m_vec = np.array([0.0, 0.0, 1e6])
+    assert not NGPlanarField.validity(data_handler)[0]
+    magnet.m_vec = np.array([0.0, 1e6, 0.0])
+
+    data_handler.components()[0].axis_0 = np.array([1.0, 0.0, 0.0])
+    assert not NGPlanarField.validity(data_handler)[0]
+
+
+def test_uniform_field():
+    uni_field = UniField.template()
+    data_handler = DataHandler([SimParams.template(), uni_field])
+
+    field = NGPlanarField(data_handler)
+    field.create_field(data_handler, 0.0)
+
+    x = np.array([0.0, 2.0])
+    y = np.array([1.0, -3.0])
+    z = np.array([0.5, 0.0])
+    assert np.allclose(field.get_h_field(x, y, z), uni_field.h_vec, atol=1e-5 * np.linalg.norm(uni_field.h_vec))
+    assert np.allclose(field.get_b_field(x, y, z), uni_field.b_vec, atol=1e-5 * np.linalg.norm(uni_field.b_vec))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.magnets.UniField import UniField
+from libs.simulation.ngsolve.NGScalarField import NGScalarField
+
+
+def test_uniform_field():
+    sim_params = SimParams.template()
+    sim_params.formulation = 2
+    uni_field = UniField.template()
+    data_handler = DataHandler([sim_params, uni_field])
+
+    field = NGScalarField(data_handler)
+    field.create_field(data_handler, 0.0)
+
+    x = np.array([0.0, 2.0])
+    y = np.array([1.0, -3.0])
+    z = np.array([0.5, 0.0])
+    assert np.allclose(field.get_h_field(x, y, z), uni_field.h_vec)
+    assert np.allclose(field.get_b_field(x, y, z), uni_field.b_vec)
@@ -0,0 +1,29 @@
+import ngsolve as ng
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.NGMesh import NGMesh
+
+
+def test_init_mesh():
+    sim_params = SimParams.template()
+    sim_params.geometry_backend = 1
+    gear_rack = GearRack.template()
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 4.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 2.5, 0.0])
+    data_handler = DataHandler([sim_params, gear_rack, magnet, sensor])
+
+    [net_mesh, badness] = NGMesh.init_mesh(data_handler, NGMesh(data_handler).mp)
+    mesh = ng.Mesh(net_mesh)
+
+    assert set(mesh.GetMaterials()) == {"magnet0", "iron0", "air"}
+    assert "outer" in mesh.GetBoundaries()
+    assert badness > 0
+    volume = gear_rack.dim[0] * gear_rack.dim[1] * gear_rack.dim[2]
+    assert ng.Integrate(1, mesh, definedon=mesh.Materials("iron0")) > volume
@@ -0,0 +1,43 @@
+import numpy as np
+from math import radians
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ngsolve.SymmetryPlane import SymmetryPlane
+
+
+def scene() -> DataHandler:
+    sim_params = SimParams.template()
+    sim_params.t = np.array([0.0, 0.5, 1.0])
+    gear = Gear.template()
+    gear.n = 24
+    gear.omega = radians(15.0)
+    gear.display_teeth_angle = np.array([0.0, 360.0])
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 5.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 4.0, -0.5])
+
+    return DataHandler([sim_params, gear, magnet, sensor])
+
+
+def test_detect():
+    planes = SymmetryPlane.detect(scene())
+    assert [(plane.axis, plane.odd, plane.side) for plane in planes] == [(0, False, 1), (2, True, -1)]
+
+    data_handler = scene()
+    data_handler.sim_params().t = np.array([0.0, 0.25])
+    assert [plane.axis for plane in SymmetryPlane.detect(data_handler)] == [2]
+
+
+def test_reflect():
+    plane = SymmetryPlane(0, 1.0, side=1, odd=False)
+    [points, factors] = plane.reflect(np.array([[0.0, 2.0, 3.0], [2.0, 2.0, 3.0]]))
+    assert np.allclose(points, [[2.0, 2.0, 3.0], [2.0, 2.0, 3.0]])
+    assert np.allclose(factors, [[-1.0, 1.0, 1.0], [1.0, 1.0, 1.0]])
+
+    plane.odd = True
+    assert np.allclose(plane.reflect(np.array([[0.0, 2.0, 3.0]]))[1], [[1.0, -1.0, -1.0]])
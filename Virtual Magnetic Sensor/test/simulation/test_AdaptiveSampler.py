@@ -0,0 +1,62 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.AdaptiveSampler import AdaptiveSampler
+
+
+def data_handler() -> DataHandler:
+    sim_params = SimParams.template()
+    sim_params.samples = 101
+    sim_params.sampling_tol = 0.1
+    sim_params.sampling_stride = 10
+    sim_params.reset()
+    return DataHandler([sim_params, HallSensor.template()])
+
+
+def sample(sampler: AdaptiveSampler, signal: callable) -> None:
+    times = sampler.next_times()
+    while times:
+        sampler.add(times, [[dict(), {'hall_voltage': [signal(t)]}] for t in times])
+        times = sampler.next_times()
+
+
+def test_edge():
+    scene = data_handler()
+    sampler = AdaptiveSampler(scene)
+
+    def signal(t: float) -> float:
+        return 2.0 if t > 0.425 else 1.0
+
+    # The coarse grid is only bisected around the edge, until the time stamps next to it are solved.
+    sample(sampler, signal)
+    assert sorted(sampler.solved) == sorted(list(range(0, 101, 10)) + [42, 43, 45])
+    assert np.array_equal(sampler.result()[1]['hall_voltage'], [signal(t) for t in scene.sim_params().t])
+
+
+def test_interpolation():
+    scene = data_handler()
+    scene.sim_params().sampling_tol = 1.0
+    sampler = AdaptiveSampler(scene)
+
+    # Vector valued measurements are interpolated per component.
+    sample(sampler, lambda t: np.array([t, 1.0 - t]))
+    assert len(sampler.solved) == 11
+    assert np.allclose(sampler.result()[1]['hall_voltage'],
+                       np.column_stack([scene.sim_params().t, 1.0 - scene.sim_params().t]))
+
+
+def test_empty_channel():
+    scene = data_handler()
+    scene.sim_params().sampling_tol = 1.0
+    sampler = AdaptiveSampler(scene)
+
+    # A measurement without values in some steps is not sampled, the others are.
+    times = sampler.next_times()
+    while times:
+        sampler.add(times, [[dict(), {'hall_voltage': [t], 'field': [t] if t > 0.5 else list()}] for t in times])
+        times = sampler.next_times()
+    assert len(sampler.solved) == 11
+    assert sampler.result()[1]['field'] == []
+    assert np.allclose(sampler.result()[1]['hall_voltage'], scene.sim_params().t)
@@ -0,0 +1,40 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.simulation.CostEstimator import CostEstimator
+from libs.simulation.Telemetry import Telemetry
+
+
+def test_calibration(tmp_path):
+    cost_estimator = CostEstimator(DataHandler().template(), tmp_path / "cost_calibration.json")
+    default_rss = cost_estimator.default_rss[0] + cost_estimator.default_rss[1] * 1e5
+    assert np.allclose(cost_estimator.predict(1e5), (cost_estimator.default_time_per_dof * 1e5, default_rss))
+
+    for ndof in [1e4, 1e5]:
+        telemetry = Telemetry()
+        telemetry.begin_step(0, 0.0)
+        telemetry.record(ndof=ndof)
+        telemetry.end_step()
+        telemetry.steps[-1].update(duration=1e-4 * ndof, rss=100 + 1e-3 * ndof)
+        assert cost_estimator.calibrate(telemetry)
+
+    assert len(cost_estimator.load_calibration()) == 2
+    assert np.allclose(cost_estimator.predict(1e6), (100.0, 1100.0))
+
+
+def test_estimate(tmp_path):
+    data_handler = DataHandler().template()
+    cost_estimator = CostEstimator(data_handler, tmp_path / "cost_calibration.json")
+    estimate = cost_estimator.estimate()
+
+    # The mesh of the empty box is small and generated directly.
+    assert (estimate['elements'], estimate['ndof']) == CostEstimator.mesh_statistics(data_handler, 1.0)
+    assert np.isclose(estimate['total_time'], estimate['step_time'] * data_handler.sim_params().samples)
+    assert "Estimated DOFs" in CostEstimator.report(estimate, 1.0)
+
+
+def test_spawn_estimate(tmp_path):
+    data_handler = DataHandler().template()
+    cost_estimator = CostEstimator(data_handler, tmp_path / "cost_calibration.json")
+
+    assert cost_estimator.spawn_estimate() == cost_estimator.estimate()
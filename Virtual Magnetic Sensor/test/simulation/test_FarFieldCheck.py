@@ -0,0 +1,44 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.FarFieldCheck import FarFieldCheck
+
+
+def scene() -> DataHandler:
+    sim_params = SimParams.template()
+    sim_params.boundaries = np.array([[-9.0, -9.0, -4.0], [9.0, 12.0, 4.0]])
+    sim_params.maxh_global = 3.0
+    sim_params.formulation = 2
+    gear = Gear.template()
+    gear.diameter = np.array([0.0, 12.0])
+    gear.n = 24
+    gear.length = 3.0
+    gear.maxh = 1.5
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 10.0, 0.0])
+    magnet.dim = np.array([3.0, 2.0, 2.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 7.5, 0.0])
+    sensor.dim = np.array([0.5, 0.5, 0.2])
+    sensor.maxh = 0.5
+    return DataHandler([sim_params, gear, magnet, sensor])
+
+
+def test_check():
+    data_handler = scene()
+    assert FarFieldCheck.check(data_handler) == []
+
+    data_handler.sim_params().tooth_culling = 2.0
+    assert FarFieldCheck.error(data_handler) < FarFieldCheck.tolerance
+    assert data_handler.sim_params().tooth_culling == 2.0
+
+
+def test_spawn_check():
+    data_handler = scene()
+    data_handler.sim_params().tooth_culling = 2.0
+
+    assert FarFieldCheck.spawn_check(data_handler) == FarFieldCheck.check(data_handler)
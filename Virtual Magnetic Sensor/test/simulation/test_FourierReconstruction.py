@@ -0,0 +1,79 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.components.GearRack import GearRack
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.FourierReconstruction import FourierReconstruction
+
+
+def data_handler(samples: int) -> DataHandler:
+    sim_params = SimParams.template()
+    sim_params.t1 = 100.0
+    sim_params.samples = samples
+    sim_params.fourier_harmonics = 1
+    sim_params.reset()
+    gear = Gear.template()
+    gear.n = 4
+    return DataHandler([sim_params, gear, HallSensor.template()])
+
+
+def reconstruct(reconstruction: FourierReconstruction, signal: callable) -> None:
+    times = reconstruction.next_times()
+    while times:
+        reconstruction.add(times, [[dict(), dict(), {'hall_voltage': [signal(t)]}] for t in times])
+        times = reconstruction.next_times()
+
+
+def test_validity():
+    assert FourierReconstruction.validity(data_handler(100))[0]
+
+    gear_rack = GearRack.template()
+    scene = data_handler(100)
+    assert not FourierReconstruction.validity(DataHandler(scene.objects + [gear_rack]))[0]
+
+    scene.components()[0].omega = 0.0
+    assert not FourierReconstruction.validity(scene)[0]
+
+
+def test_reconstruction():
+    scene = data_handler(500)
+    omega = scene.components()[0].omega
+    reconstruction = FourierReconstruction(scene)
+
+    # The first grid resolves the tooth frequency, the second harmonic of the tooth frequency requires a refinement.
+    def signal(t: float) -> float:
+        return 1.0 + np.sin(4 * omega * t) + 0.5 * np.cos(omega * t) + 0.1 * np.sin(8 * omega * t + 0.3)
+
+    reconstruct(reconstruction, signal)
+    assert reconstruction.converged
+    assert reconstruction.grid_size == 20
+    assert len(reconstruction.solved) == 20 + FourierReconstruction.verification_points
+    assert np.allclose(reconstruction.result()[2]['hall_voltage'], signal(scene.sim_params().t))
+
+
+def test_direct():
+    scene = data_handler(30)
+    reconstruction = FourierReconstruction(scene)
+
+    # The refined grid would need more solves than samples.
+    reconstruct(reconstruction, lambda t: np.sign(np.sin(t)))
+    assert reconstruction.direct
+    assert np.array_equal(reconstruction.result()[2]['hall_voltage'], np.sign(np.sin(scene.sim_params().t)))
+
+
+def test_empty_channel():
+    scene = data_handler(500)
+    omega = scene.components()[0].omega
+    reconstruction = FourierReconstruction(scene)
+
+    # A measurement without values in some steps is not reconstructed, the others are.
+    times = reconstruction.next_times()
+    while times:
+        reconstruction.add(times, [[dict(), dict(), {'hall_voltage': [np.sin(4 * omega * t)], 'field': list()}]
+                                   for t in times])
+        times = reconstruction.next_times()
+    assert reconstruction.converged
+    assert reconstruction.result()[2]['field'] == []
+    assert np.allclose(reconstruction.result()[2]['hall_voltage'], np.sin(4 * omega * scene.sim_params().t))
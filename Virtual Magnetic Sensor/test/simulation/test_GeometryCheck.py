@@ -0,0 +1,71 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.components.GearRack import GearRack
+from libs.elements.components.Shaft import Shaft
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.magnets.RodMagnet import RodMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.GeometryCheck import GeometryCheck
+
+
+def sim_params() -> SimParams:
+    params = SimParams.template()
+    params.boundaries = np.array([[-20.0, -20.0, -20.0], [20.0, 20.0, 20.0]])
+    params.t0 = 0.0
+    params.t1 = 10.0
+    params.samples = 11
+    params.reset()
+    return params
+
+
+def test_valid():
+    gear = Gear.template()
+    gear.diameter = np.array([2.0, 10.0])
+    shaft = Shaft.template()
+    shaft.pos = gear.pos.copy()
+    shaft.axis = gear.axis_0.copy()
+    shaft.diameter = np.array([0.0, 2.0])
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 8.0, 0.0])
+    magnet.dim = np.array([2.0, 2.0, 2.0])
+
+    assert GeometryCheck.check(DataHandler([sim_params(), gear, shaft, magnet])) == []
+
+
+def test_overlap():
+    magnet = CuboidMagnet.template()
+    sensor = HallSensor.template()
+    sensor.pos = magnet.pos + np.array([0.0, 0.0, magnet.dim[2] / 2])
+    rod = RodMagnet.template()
+    rod.pos = magnet.pos + np.array([0.0, 0.0, -magnet.dim[2] / 2 - rod.length / 2 + 0.1])
+
+    problems = GeometryCheck.check(DataHandler([sim_params(), magnet, rod, sensor]))
+    assert len(problems) == 2
+    assert "CuboidMagnet0 and RodMagnet0" in problems[0]
+    assert "CuboidMagnet0 and HallSensor0" in problems[1]
+
+
+def test_trajectory():
+    rack = GearRack.template()
+    rack.velocity = np.array([0.1, 0.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([rack.dim[0] / 2 + 0.5, 0.0, 0.0])
+    sensor.dim = np.array([0.2, 0.2, 0.2])
+
+    problems = GeometryCheck.check(DataHandler([sim_params(), rack, sensor]))
+    assert problems == ["GearRack0 and HallSensor0 overlap at t = 5.0 s."]
+
+
+def test_boundaries_and_dimensions():
+    params = sim_params()
+    params.boundaries = np.array([[-2.0, -2.0, -2.0], [2.0, 2.0, 2.0]])
+    magnet = CuboidMagnet.template()
+    magnet.dim = np.array([1.0, 0.0, 1.0])
+    gear = Gear.template()
+
+    problems = GeometryCheck.check(DataHandler([params, magnet, gear]))
+    assert problems == ["CuboidMagnet0 has non-positive dimensions.",
+                        "Gear0 reaches outside the simulation boundaries at t = 0.0 s."]
@@ -0,0 +1,52 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.Gear import Gear
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.ResultCache import ResultCache
+
+
+def data_handler(omega: float) -> DataHandler:
+    params = SimParams.template()
+    params.reset()
+    gear = Gear.template()
+    gear.omega = omega
+    return DataHandler([params, gear, HallSensor.template()])
+
+
+def test_key():
+    slow = data_handler(1.0)
+    fast = data_handler(2.0)
+    slow.components()[0].update(2.0)
+    fast.components()[0].update(1.0)
+
+    # The same pose reached with a different speed at a different time is the same physical state.
+    assert ResultCache.key(slow) == ResultCache.key(fast)
+
+    fast.components()[0].update(1.5)
+    assert ResultCache.key(slow) != ResultCache.key(fast)
+
+    slow.components()[0].update(1.5 * 2.0)
+    slow.objects[-1].pos = slow.objects[-1].pos + np.array([0.0, 0.0, 1.0])
+    assert ResultCache.key(slow) != ResultCache.key(fast)
+
+
+def test_store(tmp_path):
+    cache = ResultCache(1.0, tmp_path)
+    outputs = [dict(), {'field': [np.arange(3.0)]}]
+
+    assert cache.load("state") is None
+    assert cache.store("state", outputs)
+    assert np.array_equal(cache.load("state")[1]['field'][0], np.arange(3.0))
+
+
+def test_evict(tmp_path):
+    cache = ResultCache(1.0, tmp_path)
+    cache.store("0", [{'field': [np.zeros(50000)]}])
+    cache.store("1", [{'field': [np.zeros(50000)]}])
+    cache.load("0")
+    cache.store("2", [{'field': [np.zeros(50000)]}])
+
+    # Each entry takes 0.4 MB, the least recently used one exceeds the limit.
+    assert sorted(filepath.stem for filepath in tmp_path.glob("*.pkl")) == ["0", "2"]
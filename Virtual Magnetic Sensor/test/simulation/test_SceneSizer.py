@@ -0,0 +1,33 @@
+import numpy as np
+
+from libs.DataHandler import DataHandler
+from libs.elements.BoundingBox import BoundingBox
+from libs.simulation.SceneSizer import SceneSizer
+
+
+def test_propose():
+    data_handler = DataHandler().template()
+    scene_sizer = SceneSizer(data_handler)
+
+    for obj in scene_sizer.objects():
+        assert np.all(obj.bounding_box()[0] >= scene_sizer.boundaries[0])
+        assert np.all(obj.bounding_box()[1] <= scene_sizer.boundaries[1])
+    assert all(h <= scene_sizer.maxh_global for h in scene_sizer.maxh)
+    if scene_sizer.air_gap is not None:
+        assert all(h <= scene_sizer.air_gap for h, obj in zip(scene_sizer.maxh, scene_sizer.objects())
+                   if obj in data_handler.physical_sensors())
+
+
+def test_estimate():
+    data_handler = DataHandler().template()
+    scene_sizer = SceneSizer(data_handler)
+
+    elements, dofs = scene_sizer.estimate(scene_sizer.boundaries, scene_sizer.maxh_global, scene_sizer.maxh)
+    coarse, _ = scene_sizer.estimate(scene_sizer.boundaries, 2 * scene_sizer.maxh_global,
+                                     [2 * h for h in scene_sizer.maxh])
+    assert 0 < coarse < elements < dofs
+
+    scene_sizer.apply()
+    assert np.allclose(data_handler.sim_params().boundaries, scene_sizer.boundaries)
+    assert scene_sizer.estimate() == (elements, dofs)
+    assert BoundingBox.volume(data_handler.sim_params().boundaries) > 0
@@ -0,0 +1,47 @@
+import numpy as np
+
+from libs.ConfigHandler import ConfigHandler
+from libs.DataHandler import DataHandler
+from libs.elements.SimParams import SimParams
+from libs.elements.components.GearRack import GearRack
+from libs.elements.magnets.CuboidMagnet import CuboidMagnet
+from libs.elements.sensors.HallSensor import HallSensor
+from libs.simulation.SnapshotStore import SnapshotStore
+from libs.simulation.ngsolve.NGField import NGField
+
+
+def test_resample(tmp_path):
+    gear_rack = GearRack.template()
+    magnet = CuboidMagnet.template()
+    magnet.pos = np.array([0.0, 4.0, 0.0])
+    sensor = HallSensor.template()
+    sensor.pos = np.array([0.0, 2.5, 0.0])
+    sim_params = SimParams.template()
+    sim_params.samples = 2
+    sim_params.reset()
+    data_handler = DataHandler([sim_params, gear_rack, magnet, sensor])
+
+    store = SnapshotStore(tmp_path)
+    store.save_scene(data_handler)
+    field = NGField(data_handler)
+    data = dict()
+    for n, t in enumerate(sim_params.t):
+        gear_rack.update(t)
+        field.create_field(data_handler, t)
+        data = sensor.set_data(data, field)
+        assert store.save(n, t, field)
+
+    # The mesh is moved with the gear rack, the later step only stores the coordinates of its points.
+    assert store.steps() == [0, 1]
+    assert [filepath.stem for filepath in tmp_path.glob("mesh*.pkl")] == ["mesh0_0"]
+
+    assert store.resample(data_handler, workers=2)
+    assert np.allclose(sensor.hall_voltage, data['hall_voltage'])
+
+
+def test_default_path(tmp_path):
+    data_handler = DataHandler([SimParams.template()])
+    assert SnapshotStore.default_path(data_handler) == ConfigHandler.get_config_path("snapshots")
+
+    data_handler.filepath = tmp_path / "scene"
+    assert SnapshotStore.default_path(data_handler) == tmp_path / "scene_snapshots"
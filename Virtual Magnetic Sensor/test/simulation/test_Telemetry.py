@@ -0,0 +1,45 @@
+from libs.simulation.Telemetry import Telemetry
+
+
+def telemetry() -> Telemetry:
+    worker = Telemetry()
+    with worker.stage("field initialization"):
+        pass
+    for n in range(3):
+        worker.begin_step(n, 0.1 * n)
+        with worker.stage("solve"):
+            worker.record(ndof=100, iterations=10 + n)
+        worker.end_step()
+
+    main = Telemetry()
+    with main.stage("worker process"):
+        pass
+    main.merge(worker.records())
+
+    return main
+
+
+def test_from_dict_and_to_dict():
+    original = telemetry()
+    loaded = Telemetry.from_dict(original.to_dict())
+
+    assert [event['name'] for event in loaded.events] == [event['name'] for event in original.events]
+    assert [event['step'] for event in loaded.events] == [-1, -1, 0, 1, 2]
+    assert [step['iterations'] for step in loaded.steps] == [10, 11, 12]
+    assert all('rss' in step and 'duration' in step for step in loaded.steps)
+    assert all(step['peak_rss'] >= step['rss'] for step in loaded.steps)
+
+
+def test_chrome_trace():
+    trace = telemetry().chrome_trace()['traceEvents']
+
+    assert len([event for event in trace if event['ph'] == 'X']) == 5
+    assert len([event for event in trace if event['ph'] == 'C' and event['name'] == 'iterations']) == 3
+    assert min(event['ts'] for event in trace) == 0
+
+
+def test_solves():
+    main = telemetry()
+    main.steps[1]['cache_hit'] = 1
+
+    assert main.solves() == 2